@@ -187,6 +187,9 @@ class AutomataDrawer:
         Returns:
             Path to the generated file
         """
+        # Derived DFAs are drawn with their descriptive state labels.
+        if hasattr(dfa, "relabeled"):
+            dfa = dfa.relabeled()
         return self.draw_dfa(
             transitions=dfa._transitions,
             start_state=dfa._start_state,
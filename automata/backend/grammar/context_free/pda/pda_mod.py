@@ -3,6 +3,7 @@ from collections import defaultdict
 
 from automata.backend.grammar.dist import Alphabet, StateSet, State, Symbol, Word
 from automata.backend.grammar.automaton_base import Automaton
+from automata.backend.grammar.scc import StateAnalysis
 
 StackSymbol = str
 EPSILON = ""
@@ -201,6 +202,55 @@ class PDA(Automaton[State]):
 
         return None
 
+    def state_analysis(self) -> StateAnalysis:
+        """
+        Classify states on the PDA's control graph, ignoring the stack.
+
+        A state is reachable if some path of transitions leads to it from the
+        start state, whatever the stack would hold; this over-approximates
+        the configurations a run can reach, so states outside it are
+        certainly unused. With acceptance by empty stack every state counts
+        as accepting.
+        """
+        successors: Dict[State, Set[State]] = {
+            state: {target for moves in row.values() for target, _ in moves}
+            for state, row in self.transitions.items()
+        }
+        all_states = self._states.states()
+        accepting = (
+            all_states | successors.keys()
+            if self.accept_by_empty_stack
+            else self._accept_states.states()
+        )
+        return StateAnalysis(all_states, self._start_state, accepting, successors)
+
+    def trim(self) -> "PDA":
+        """
+        Return an equivalent PDA with only the useful states of
+        `state_analysis` (plus the start state) and the transitions between
+        them.
+        """
+        keep = self.state_analysis().useful | {self._start_state}
+        transitions: PDATransitions = {}
+        for state in keep:
+            row = {}
+            for key, moves in self.transitions.get(state, {}).items():
+                kept = {move for move in moves if move[0] in keep}
+                if kept:
+                    row[key] = kept
+            if row:
+                transitions[state] = row
+        return PDA(
+            states=StateSet.from_states(keep),
+            input_alphabet=self.input_alphabet,
+            stack_alphabet=set(self.stack_alphabet),
+            transitions=transitions,
+            start_state=self._start_state,
+            start_stack_symbol=self.start_stack_symbol,
+            accept_states=StateSet.from_states(self._accept_states.states() & keep),
+            accept_by_empty_stack=self.accept_by_empty_stack,
+        )
+
     @classmethod
     def from_string(
         cls,
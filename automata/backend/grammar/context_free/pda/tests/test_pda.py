@@ -181,3 +181,29 @@ class TestPDAAcceptByEmptyStack:
         assert pda.accepts([Symbol(c) for c in "ab"]) is True
         assert pda.accepts([Symbol(c) for c in "aabb"]) is True
         assert pda.accepts([Symbol(c) for c in "aab"]) is False
+
+
+class TestPDATrim:
+    def test_trim_drops_unreachable_and_dead_states(self):
+        pda = PDA.from_string(
+            "q0,a,Z,q0,aZ; q0,a,a,q0,aa; q0,b,a,q1,e; q1,b,a,q1,e; q1,e,Z,q2,Z;"
+            "q0,c,Z,dead,Z; dead,c,Z,dead,Z; lost,a,Z,q2,Z",
+            start_state="q0",
+            accept_states={"q2"},
+        )
+        analysis = pda.state_analysis()
+        assert analysis.trap == {"dead"}
+        assert "lost" not in analysis.reachable
+        trimmed = pda.trim()
+        assert trimmed._states.states() == {"q0", "q1", "q2"}
+        for word in ["ab", "aabb", "abb", "ac", ""]:
+            assert trimmed.accepts(list(word)) == pda.accepts(list(word))
+
+    def test_empty_stack_acceptance_keeps_every_reachable_state(self):
+        pda = PDA.from_string(
+            "q0,a,Z,q1,e; lost,a,Z,q0,Z",
+            start_state="q0",
+            accept_states=set(),
+            accept_by_empty_stack=True,
+        )
+        assert pda.trim()._states.states() == {"q0", "q1"}
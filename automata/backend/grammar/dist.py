@@ -1,4 +1,5 @@
-from typing import NewType, Set, Iterable, Union, Sequence
+import weakref
+from typing import List, NewType, Optional, Set, Iterable, Union, Sequence
 
 Symbol = NewType("Symbol", str)
 TapeSymbol = NewType("TapeSymbol", str)
@@ -79,6 +80,9 @@ class StateSet:
     You can store each state in a Python set, similar to Alphabet.
     """
 
+    # Weak references to the owners told about in-place edits (see `watch`).
+    _watchers: Optional[List[weakref.ref]] = None
+
     def __init__(self, states: Iterable[str]):
         self._states: Set[State] = {State(s) for s in states}
 
@@ -103,12 +107,42 @@ class StateSet:
     def __repr__(self):
         return f"StateSet({sorted(self._states)})"
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_watchers", None)
+        return state
+
     def add_state(self, state: Union[str, State]) -> None:
         self._states.add(State(state))
+        if self._watchers:
+            self._changed()
 
     def remove_state(self, state: Union[str, State]) -> None:
         if state in self._states:
             self._states.remove(State(state))
+            if self._watchers:
+                self._changed()
+
+    def watch(self, owner) -> None:
+        """
+        Call `owner._touch()` after every later `add_state`/`remove_state`,
+        e.g. so an automaton can drop tables built from this set. The owner
+        is held weakly.
+        """
+        if self._watchers is None:
+            self._watchers = []
+        elif any(ref() is owner for ref in self._watchers):
+            return
+        self._watchers.append(weakref.ref(owner))
+
+    def _changed(self) -> None:
+        alive = []
+        for ref in self._watchers:
+            owner = ref()
+            if owner is not None:
+                owner._touch()
+                alive.append(ref)
+        self._watchers = alive
 
     def states(self) -> Set[State]:
         """
@@ -0,0 +1,179 @@
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+"""
+Implements the Aho-Corasick multi-pattern matching algorithm, the
+many-pattern generalization of KMP (see kmp.py):
+
+1. AhoCorasick(patterns):
+   - Builds the keyword trie with failure links (the generalization of the
+     KMP prefix function) and dictionary links, once, for reuse on many texts.
+   - .search(text) returns every (start index, pattern) occurrence in a
+     single left-to-right pass, in O(len(text) + number of matches) time.
+
+2. build_aho_corasick_dfa(patterns, alphabet):
+   - Returns a deterministic finite automaton (transitions, start_state, accept_states)
+     that accepts precisely those strings ending with one of the patterns.
+
+3. aho_corasick_search(patterns, text):
+   - Convenience wrapper: build the automaton and search one text.
+
+Trie nodes are numbered in breadth-first order, so node 0 is the root (the
+empty prefix) and every node is numbered after its failure target.
+"""
+
+
+class AhoCorasick:
+    """
+    The Aho-Corasick automaton for a set of patterns.
+
+    Attributes:
+      patterns: the distinct patterns, in first-occurrence order.
+      goto:     goto[node][char] = child node in the keyword trie.
+      fail:     fail[node] = node of the longest proper suffix of node's
+                prefix that is also a prefix of some pattern.
+      output:   output[node] = indices (into patterns) of the patterns that
+                are exactly node's prefix.
+      dict_link: dict_link[node] = nearest node on the failure chain with a
+                non-empty output, or -1. Following these links enumerates
+                every pattern ending at a position without walking the
+                whole failure chain.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = list(dict.fromkeys(patterns))
+
+        # Build the trie, then renumber nodes breadth-first.
+        trie: List[Dict[str, int]] = [{}]
+        ends: Dict[int, List[int]] = {}
+        for index, pattern in enumerate(self.patterns):
+            node = 0
+            for c in pattern:
+                child = trie[node].get(c)
+                if child is None:
+                    child = len(trie)
+                    trie.append({})
+                    trie[node][c] = child
+                node = child
+            ends.setdefault(node, []).append(index)
+
+        order = [0]
+        for node in order:
+            order.extend(trie[node][c] for c in sorted(trie[node]))
+        number = {old: new for new, old in enumerate(order)}
+
+        size = len(order)
+        self.goto: List[Dict[str, int]] = [
+            {c: number[child] for c, child in trie[old].items()} for old in order
+        ]
+        self.output: List[List[int]] = [ends.get(old, []) for old in order]
+        self.fail: List[int] = [0] * size
+        self.dict_link: List[int] = [-1] * size
+
+        # Failure links in breadth-first order: a node's failure target is
+        # always shallower, so it is final by the time the node is reached.
+        queue = deque([0])
+        while queue:
+            node = queue.popleft()
+            for c, child in self.goto[node].items():
+                queue.append(child)
+                fallback = self.fail[node]
+                while fallback and c not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(c, 0)
+                self.fail[child] = target if target != child else 0
+                suffix = self.fail[child]
+                self.dict_link[child] = (
+                    suffix if self.output[suffix] else self.dict_link[suffix]
+                )
+
+    def __len__(self) -> int:
+        """The number of trie nodes (DFA states)."""
+        return len(self.goto)
+
+    def matches_at(self, node: int) -> Iterator[int]:
+        """Indices of the patterns that end at `node`, longest first."""
+        if not self.output[node]:
+            node = self.dict_link[node]
+        while node != -1:
+            yield from self.output[node]
+            node = self.dict_link[node]
+
+    def iter_search(self, text: str) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (start index, pattern) for every occurrence of every pattern in
+        `text`, ordered by end position and, at equal end, longest first.
+        An empty pattern occurs at every position 0..len(text).
+        """
+        goto, fail, patterns = self.goto, self.fail, self.patterns
+        output, dict_link = self.output, self.dict_link
+        for index in output[0]:
+            yield 0, patterns[index]
+
+        node = 0
+        for i, c in enumerate(text):
+            while node and c not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(c, 0)
+            if output[node] or dict_link[node] != -1:
+                end = i + 1
+                for index in self.matches_at(node):
+                    yield end - len(patterns[index]), patterns[index]
+
+    def search(self, text: str) -> List[Tuple[int, str]]:
+        """Return the list of all (start index, pattern) matches in `text`."""
+        return list(self.iter_search(text))
+
+    def build_dfa(
+        self, alphabet: Set[str]
+    ) -> Tuple[Dict[int, Dict[str, int]], int, Set[int]]:
+        """
+        Complete the goto function over `alphabet` into a DFA transition
+        table (transitions, start_state, accept_states). A node accepts if
+        some pattern ends there, i.e. the input read so far ends with a
+        pattern. Characters outside `alphabet` get no transitions.
+        """
+        transitions: Dict[int, Dict[str, int]] = {}
+        for node in range(len(self.goto)):  # breadth-first: fail[node] is done
+            row = {}
+            for c in alphabet:
+                child = self.goto[node].get(c)
+                if child is not None:
+                    row[c] = child
+                else:
+                    row[c] = transitions[self.fail[node]][c] if node else 0
+            transitions[node] = row
+
+        accept_states = {
+            node
+            for node in range(len(self.goto))
+            if self.output[node] or self.dict_link[node] != -1
+        }
+        return transitions, 0, accept_states
+
+
+def build_aho_corasick_dfa(
+    patterns: Iterable[str], alphabet: Set[str]
+) -> Tuple[Dict[int, Dict[str, int]], int, Set[int]]:
+    """
+    Build a DFA accepting the strings that end with any of `patterns`.
+
+    Returns:
+      (transitions, start_state, accept_states), as build_kmp_dfa does.
+
+    Example usage:
+      >>> transitions, start, accept = build_aho_corasick_dfa(["he", "she"], {"h", "e", "s"})
+      >>> # start=0; accept holds the nodes for "he" and "she".
+    """
+    return AhoCorasick(patterns).build_dfa(alphabet)
+
+
+def aho_corasick_search(patterns: Iterable[str], text: str) -> List[Tuple[int, str]]:
+    """
+    Return every (start index, pattern) occurrence of `patterns` in `text`.
+
+    Example:
+      >>> aho_corasick_search(["he", "she", "hers"], "ushers")
+      [(1, 'she'), (2, 'he'), (2, 'hers')]
+    """
+    return AhoCorasick(patterns).search(text)
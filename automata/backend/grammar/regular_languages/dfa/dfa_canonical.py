@@ -0,0 +1,118 @@
+"""
+Canonical forms and signatures of regular languages.
+
+The trimmed minimal DFA of a language is unique up to renaming its states,
+so fixing the names fixes the automaton. `canonical_form` does this:
+
+1. the DFA is minimized with Hopcroft's algorithm (`DFA.minimized`), which
+   trims it first (a useful `sink_state` is written out as transitions) and
+   leaves a dead state only when the language is empty;
+2. states are renamed q0, q1, ... in breadth-first order from the start,
+   visiting successors by sorted symbol. Unreachable states are never
+   visited, transitions into the dead state are dropped, and the alphabet
+   shrinks to the symbols that label a remaining transition.
+
+`signature` is the SHA-256 of a serialization of the canonical form. Two
+DFAs have the same signature exactly when they accept the same set of words
+(symbols that occur in no accepted word do not matter), so a dict keyed by
+signature deduplicates automata by language:
+
+    >>> by_language = {}
+    >>> for dfa in submissions:
+    ...     by_language.setdefault(dfa.signature(), []).append(dfa)
+"""
+
+import hashlib
+import json
+from typing import Dict, List
+
+from automata.backend.grammar.dist import Alphabet, State, StateSet, Symbol
+from automata.backend.grammar.regular_languages.dfa.dfa_mod import DFA
+
+
+def _build_canonical_form(dfa: DFA) -> DFA:
+    minimal = dfa.minimized()
+    live = minimal.state_analysis().useful
+    if not live:
+        start = State("q0")
+        return DFA(
+            states=StateSet.from_states({start}),
+            alphabet=Alphabet([]),
+            transitions={},
+            start_state=start,
+            accept_states=StateSet([]),
+        )
+
+    symbols = sorted(minimal._alphabet.symbols())
+    name: Dict[State, State] = {minimal._start_state: State("q0")}
+    order = [minimal._start_state]
+    transitions: Dict[State, Dict[Symbol, State]] = {}
+    for state in order:
+        row = minimal._transitions.get(state, {})
+        renamed = {}
+        for symbol in symbols:
+            target = row.get(symbol)
+            if target not in live:
+                continue
+            if target not in name:
+                name[target] = State(f"q{len(order)}")
+                order.append(target)
+            renamed[symbol] = name[target]
+        if renamed:
+            transitions[name[state]] = renamed
+
+    used = {symbol for row in transitions.values() for symbol in row}
+    return DFA(
+        states=StateSet.from_states(set(name.values())),
+        alphabet=Alphabet(used),
+        transitions=transitions,
+        start_state=State("q0"),
+        accept_states=StateSet.from_states(
+            {name[s] for s in minimal._accept_states.states() if s in name}
+        ),
+    )
+
+
+def canonical_form(dfa: DFA) -> DFA:
+    """
+    Return the canonical DFA for `dfa`'s language: trimmed, minimal, states
+    named q0..qn in breadth-first order (q0 is the start), alphabet reduced
+    to the symbols in use. Language-equivalent DFAs get identical canonical
+    forms. Memoized until `dfa` is mutated; treat the result as read-only.
+    """
+    return dfa._cached("canonical_form", lambda: _build_canonical_form(dfa))
+
+
+def _serialize(canonical: DFA) -> List:
+    """A JSON-ready description of a canonical DFA, with states as integers."""
+    symbols = sorted(canonical._alphabet.symbols())
+    column = {symbol: i for i, symbol in enumerate(symbols)}
+    size = len(canonical._states)
+    number = {State(f"q{i}"): i for i in range(size)}
+    rows = [
+        [
+            [column[symbol], number[target]]
+            for symbol, target in sorted(
+                canonical._transitions.get(State(f"q{i}"), {}).items()
+            )
+        ]
+        for i in range(size)
+    ]
+    accepting = sorted(number[s] for s in canonical._accept_states.states())
+    return [symbols, accepting, rows]
+
+
+def signature(dfa: DFA) -> str:
+    """
+    Return a stable hex digest of `dfa`'s language: equal for two DFAs iff
+    they accept the same words. It does not depend on state names, on
+    unreachable or dead states, or on the Python process.
+    """
+    def compute() -> str:
+        payload = json.dumps(
+            ["dfa-signature-1", _serialize(canonical_form(dfa))],
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    return dfa._cached("signature", compute)
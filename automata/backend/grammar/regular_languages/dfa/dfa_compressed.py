@@ -0,0 +1,220 @@
+"""
+Compressed DFA transition tables: row displacement with default targets.
+
+A dense table (`CompiledDFA`) spends one slot per (state, symbol) pair,
+which is wasteful for sparse automata over wide alphabets; the dict-of-dicts
+in `DFA` costs far more per edge. `CompressedDFA` uses the comb-vector
+layout of table-driven lexer generators:
+
+- every state gets a *default* target: the most common target in its row
+  (counting missing transitions, which go to the sink state or reject);
+- only the *exceptions* (symbols whose target differs from the default) are
+  stored, in two shared arrays `next` and `check`;
+- each state's exceptions are placed at `base[s] + column`, with the rows
+  slid over one another (first fit) so that they interleave without
+  colliding; `check[i]` records which state owns slot i.
+
+Looking up δ(s, a) is then
+
+    i = base[s] + column(a)
+    δ(s, a) = next[i] if check[i] == s else default[s]
+
+Four `array('i')`s hold the whole table: roughly 8 bytes per state plus 8
+bytes per exception, independent of the alphabet size.
+
+Execution has the semantics of `DFA.accepts`, including `sink_state`,
+partial transitions and rejection of symbols outside the alphabet.
+"""
+
+from array import array
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from automata.backend.grammar.dist import Alphabet, State, StateSet, Symbol, Word
+from automata.backend.grammar.regular_languages.dfa.dfa_mod import DFA
+
+# Target of a transition that rejects (no transition and no sink state).
+_REJECT = -1
+
+# Candidate positions tried per row before it is appended to the table.
+_MAX_PROBES = 1024
+
+
+class CompressedDFA:
+    """
+    A read-only DFA snapshot stored as a row-displacement table.
+
+    Later changes to the source DFA are not reflected; compress again after
+    mutating it.
+    """
+
+    def __init__(self, dfa: DFA):
+        symbols: Tuple[Symbol, ...] = tuple(sorted(dfa._alphabet.symbols()))
+        named = set(dfa._states.states())
+        named.add(dfa._start_state)
+        for source, row in dfa._transitions.items():
+            named.add(source)
+            named.update(row.values())
+        if dfa._sink_state is not None:
+            named.add(dfa._sink_state)
+        ordered = sorted(named)
+        ordered.remove(dfa._start_state)
+        states: Tuple[State, ...] = (dfa._start_state, *ordered)
+        state_id: Dict[State, int] = {s: i for i, s in enumerate(states)}
+        column: Dict[Symbol, int] = {a: i for i, a in enumerate(symbols)}
+        width = len(symbols)
+        missing = state_id[dfa._sink_state] if dfa._sink_state is not None else _REJECT
+
+        defaults = array("i", [missing]) * len(states)
+        rows: List[Tuple[int, List[Tuple[int, int]]]] = []
+        for source, row in dfa._transitions.items():
+            s = state_id[source]
+            explicit = {
+                column[a]: state_id[t] for a, t in row.items() if a in column
+            }
+            counts = Counter(explicit.values())
+            counts[missing] += width - len(explicit)
+            default = max(counts, key=lambda t: (counts[t], t == missing))
+            defaults[s] = default
+            exceptions = [(c, t) for c, t in explicit.items() if t != default]
+            if default != missing:
+                exceptions += [
+                    (c, missing) for c in range(width) if c not in explicit
+                ]
+            if exceptions:
+                rows.append((s, sorted(exceptions)))
+
+        bases = array("i", [0]) * len(states)
+        check: List[int] = []
+        targets: List[int] = []
+        # First fit, densest rows first. `used` marks taken slots; candidate
+        # bases are found by jumping to the next free slot for the row's
+        # first exception, so occupied stretches are skipped in C. A row that
+        # fits none of the first `_MAX_PROBES` holes goes to the end of the
+        # table, which keeps packing near-linear at little cost in space.
+        rows.sort(key=lambda item: -len(item[1]))
+        used = bytearray()
+        for s, exceptions in rows:
+            first_column = exceptions[0][0]
+            slot = used.find(0, first_column)
+            probes = 0
+            while True:
+                probes += 1
+                if slot == -1 or probes > _MAX_PROBES:
+                    slot = max(len(used), first_column)
+                base = slot - first_column
+                if all(
+                    base + c >= len(used) or not used[base + c]
+                    for c, _ in exceptions
+                ):
+                    break
+                slot = used.find(0, slot + 1)
+            end = base + exceptions[-1][0] + 1
+            if end > len(check):
+                grow = end - len(check)
+                check.extend([_REJECT] * grow)
+                targets.extend([_REJECT] * grow)
+                used.extend(bytes(grow))
+            for c, t in exceptions:
+                check[base + c] = s
+                targets[base + c] = t
+                used[base + c] = 1
+            bases[s] = base
+
+        # Pad so that base + column is always in range: no bounds checks.
+        padding = [_REJECT] * max(width, 1)
+        self._states = states
+        self._symbols = symbols
+        self._state_id = state_id
+        self._symbol_column = column
+        self._base = bases
+        self._default = defaults
+        self._next = array("i", targets + padding)
+        self._check = array("i", check + padding)
+        self._accepting = frozenset(
+            state_id[s] for s in dfa._accept_states.states() if s in state_id
+        )
+        self._sink = None if missing == _REJECT else missing
+
+    @property
+    def states(self) -> Tuple[State, ...]:
+        """The interned states; a state's id is its index (the start is 0)."""
+        return self._states
+
+    @property
+    def symbols(self) -> Tuple[Symbol, ...]:
+        """The interned symbols; a symbol's column is its index."""
+        return self._symbols
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    @property
+    def exception_count(self) -> int:
+        """The number of transitions stored explicitly (not as defaults)."""
+        return sum(1 for owner in self._check if owner != _REJECT)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the four table arrays, in bytes."""
+        return sum(
+            a.itemsize * len(a)
+            for a in (self._base, self._default, self._next, self._check)
+        )
+
+    def step(self, state_id: int, column: int) -> int:
+        """The target id of δ(state_id, column), or -1 if it rejects."""
+        i = self._base[state_id] + column
+        if self._check[i] == state_id:
+            return self._next[i]
+        return self._default[state_id]
+
+    def _walk(self, word: Word) -> int:
+        """Return the state id reached on `word`, or -1 if the run rejects."""
+        base, default, nxt, check = self._base, self._default, self._next, self._check
+        column = self._symbol_column
+        state = 0
+        for symbol in word:
+            col = column.get(symbol)
+            if col is None:
+                return _REJECT
+            i = base[state] + col
+            state = nxt[i] if check[i] == state else default[state]
+            if state < 0:
+                return _REJECT
+        return state
+
+    def accepts(self, word: Word) -> bool:
+        """Return True if the DFA accepts `word`; same semantics as `DFA.accepts`."""
+        return self._walk(word) in self._accepting
+
+    def accepts_many(self, words) -> List[bool]:
+        """Return, for each word in `words`, whether the DFA accepts it."""
+        return [self.accepts(word) for word in words]
+
+    def run(self, word: Word) -> Optional[State]:
+        """Return the state reached on `word`, or None if the run rejects."""
+        state = self._walk(word)
+        return None if state < 0 else self._states[state]
+
+    def to_dfa(self) -> DFA:
+        """Expand the table back into an equivalent `DFA`."""
+        transitions: Dict[State, Dict[Symbol, State]] = {}
+        for s, name in enumerate(self._states):
+            row = {}
+            for col, symbol in enumerate(self._symbols):
+                target = self.step(s, col)
+                if target >= 0:
+                    row[symbol] = self._states[target]
+            if row:
+                transitions[name] = row
+        return DFA(
+            states=StateSet.from_states(set(self._states)),
+            alphabet=Alphabet(self._symbols),
+            transitions=transitions,
+            start_state=self._states[0],
+            accept_states=StateSet.from_states(
+                {self._states[s] for s in self._accepting}
+            ),
+            sink_state=None if self._sink is None else self._states[self._sink],
+        )
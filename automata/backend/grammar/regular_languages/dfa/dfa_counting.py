@@ -0,0 +1,210 @@
+"""
+Counting the words a DFA accepts, by length.
+
+Counts are exact Python integers. They are computed by dynamic programming
+over the *useful* states only (reachable from the start and able to reach an
+accepting state): row s of the transition-count matrix M records, for each
+useful target t, how many symbols lead from s to t. Then
+
+    count(n) = e_start · Mⁿ · f        (f = indicator of accepting states)
+
+For moderate n this is evaluated as n vector steps, O(n · E) for E edges.
+For very large n relative to the automaton, Mⁿ is computed by repeated
+squaring instead, O(m³ · log n) for m useful states; the cheaper plan is
+picked automatically.
+
+Words of length *up to* n are counted in the same way on a one-state
+extension: a new start state that loops on a padding symbol and otherwise
+behaves like the old start state accepts #ʲw exactly when w is accepted, so
+its words of length exactly n correspond one-to-one to accepted words of
+length at most n.
+"""
+
+from typing import Dict, List, Tuple
+
+from automata.backend.grammar.regular_languages.dfa.dfa_mod import DFA
+
+_Matrix = List[List[int]]
+
+
+def _check_length(n: int) -> None:
+    if n < 0:
+        raise ValueError(f"Word length must be non-negative, got {n}")
+
+
+class WordCounter:
+    """
+    Transition-count tables for a DFA's useful states, built once and
+    shared by the counting (and sampling) queries.
+
+    Useful states are renumbered 0..m-1 with the start state as 0. If the
+    start state is not useful the language is empty and m is 0.
+    """
+
+    def __init__(self, dfa: DFA):
+        compiled = dfa.compile()
+        width, table, dead = compiled._width, compiled._table, compiled._dead
+        accepting = compiled._accepting
+
+        successors: List[List[int]] = [
+            [table[row * width + column] // width for column in range(width)]
+            if row != dead and compiled._symbols
+            else []
+            for row in range(dead)
+        ]
+
+        # Reachable from the start ...
+        reachable = {0}
+        stack = [0]
+        while stack:
+            for target in successors[stack.pop()]:
+                if target != dead and target not in reachable:
+                    reachable.add(target)
+                    stack.append(target)
+        # ... and co-reachable to an accepting state.
+        predecessors: Dict[int, List[int]] = {s: [] for s in reachable}
+        for s in reachable:
+            for target in successors[s]:
+                if target in predecessors:
+                    predecessors[target].append(s)
+        live = {s for s in reachable if accepting[s]}
+        stack = list(live)
+        while stack:
+            for pred in predecessors[stack.pop()]:
+                if pred not in live:
+                    live.add(pred)
+                    stack.append(pred)
+
+        order = sorted(live)  # id 0 (the start) comes first when useful
+        index = {s: i for i, s in enumerate(order)}
+        self.size = len(order) if 0 in live else 0
+        self.rows: List[List[Tuple[int, int]]] = []
+        # (symbol column, target) pairs per useful state, in symbol order.
+        self.edges: List[List[Tuple[int, int]]] = []
+        self.accepting: List[bool] = []
+        self.edge_count = 0
+        if self.size:
+            for s in order:
+                multiplicity: Dict[int, int] = {}
+                labelled = []
+                for column, target in enumerate(successors[s]):
+                    if target in index:
+                        multiplicity[index[target]] = (
+                            multiplicity.get(index[target], 0) + 1
+                        )
+                        labelled.append((column, index[target]))
+                self.rows.append(sorted(multiplicity.items()))
+                self.edges.append(labelled)
+                self.accepting.append(bool(accepting[s]))
+                self.edge_count += len(multiplicity)
+        self.symbols = compiled._symbols
+        self.state_ids = order
+
+    # ── Dynamic programming ──────────────────────────────────────────────────
+
+    def series(self, n: int) -> List[int]:
+        """Accepted-word counts for every length 0..n (forward DP)."""
+        _check_length(n)
+        if not self.size:
+            return [0] * (n + 1)
+        rows, accepting = self.rows, self.accepting
+        final = [i for i, a in enumerate(accepting) if a]
+        vector = [0] * self.size
+        vector[0] = 1
+        result = []
+        for length in range(n + 1):
+            result.append(sum(vector[i] for i in final))
+            if length == n:
+                break
+            following = [0] * self.size
+            for s, count in enumerate(vector):
+                if count:
+                    for target, multiplicity in rows[s]:
+                        following[target] += count * multiplicity
+            vector = following
+        return result
+
+    # ── Matrix exponentiation ────────────────────────────────────────────────
+
+    def _prefers_matrix(self, n: int, size: int) -> bool:
+        return size**3 * max(n.bit_length(), 1) < n * max(self.edge_count, 1)
+
+    def _matrix(self, padded: bool) -> _Matrix:
+        """The transition-count matrix, optionally with the padding start state."""
+        size = self.size + (1 if padded else 0)
+        matrix = [[0] * size for _ in range(size)]
+        for s, row in enumerate(self.rows):
+            for target, multiplicity in row:
+                matrix[s][target] = multiplicity
+        if padded:
+            pad = self.size
+            matrix[pad][pad] = 1
+            for target, multiplicity in self.rows[0]:
+                matrix[pad][target] = multiplicity
+        return matrix
+
+    @staticmethod
+    def _multiply(a: _Matrix, b: _Matrix) -> _Matrix:
+        columns = list(zip(*b))
+        return [
+            [sum(x * y for x, y in zip(row, column) if x) for column in columns]
+            for row in a
+        ]
+
+    def _power_row(self, matrix: _Matrix, start: int, n: int) -> List[int]:
+        """Row `start` of matrixⁿ, by repeated squaring."""
+        result = [[int(i == start) for i in range(len(matrix))]]
+        base = matrix
+        while n:
+            if n & 1:
+                result = self._multiply(result, base)
+            n >>= 1
+            if n:
+                base = self._multiply(base, base)
+        return result[0]
+
+    def _count_by_matrix(self, n: int, padded: bool) -> int:
+        accepting = self.accepting + ([self.accepting[0]] if padded else [])
+        start = self.size if padded else 0
+        row = self._power_row(self._matrix(padded), start, n)
+        return sum(count for count, a in zip(row, accepting) if a)
+
+    # ── Queries ──────────────────────────────────────────────────────────────
+
+    def count(self, n: int) -> int:
+        """Number of accepted words of length exactly n."""
+        _check_length(n)
+        if not self.size:
+            return 0
+        if self._prefers_matrix(n, self.size):
+            return self._count_by_matrix(n, padded=False)
+        return self.series(n)[-1]
+
+    def count_upto(self, n: int) -> int:
+        """Number of accepted words of length at most n."""
+        _check_length(n)
+        if not self.size:
+            return 0
+        if self._prefers_matrix(n, self.size + 1):
+            return self._count_by_matrix(n, padded=True)
+        return sum(self.series(n))
+
+
+def word_counter(dfa: DFA) -> WordCounter:
+    """Return the memoized `WordCounter` for `dfa`."""
+    return dfa._cached("word_counter", lambda: WordCounter(dfa))
+
+
+def count_words(dfa: DFA, n: int) -> int:
+    """Return the number of words of length exactly `n` that `dfa` accepts."""
+    return word_counter(dfa).count(n)
+
+
+def count_words_upto(dfa: DFA, n: int) -> int:
+    """Return the number of words of length at most `n` that `dfa` accepts."""
+    return word_counter(dfa).count_upto(n)
+
+
+def growth_series(dfa: DFA, n: int) -> List[int]:
+    """Return `[count_words(dfa, k) for k in range(n + 1)]`, in one pass."""
+    return word_counter(dfa).series(n)
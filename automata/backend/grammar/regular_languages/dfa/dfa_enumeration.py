@@ -0,0 +1,87 @@
+"""
+Lazy enumeration of a DFA's accepted words in shortlex order.
+
+Words are produced shortest first, and words of equal length in
+lexicographic order of the (sorted) alphabet. For each length L the search
+walks the useful states depth-first, guided by a table
+
+    reach[r][s]  —  state s can reach an accepting state in exactly r symbols
+
+so an edge is followed only if it still leads to some accepted word of
+length L. Every branch the search enters therefore yields output; the
+rejecting part of the state space is never expanded. The table grows one
+row per length, on demand.
+
+When the table's row for some length is entirely False, every later row is
+too: the language is finite and the enumeration ends on its own, even with
+no `max_len`.
+"""
+
+from typing import Iterator, List, Optional
+
+from automata.backend.grammar.dist import Word
+from automata.backend.grammar.regular_languages.dfa.dfa_counting import (
+    WordCounter,
+    word_counter,
+)
+from automata.backend.grammar.regular_languages.dfa.dfa_mod import DFA
+
+
+def _words_of_length(
+    counter: WordCounter, reach: List[List[bool]], length: int
+) -> Iterator[Word]:
+    """Accepted words of exactly `length` symbols, in lexicographic order."""
+    if length == 0:
+        if counter.accepting[0]:
+            yield []
+        return
+    symbols, edges = counter.symbols, counter.edges
+    path: List = []
+    frames = [iter(edges[0])]
+    while frames:
+        # Symbols still to read after taking the next edge.
+        remaining = length - len(path) - 1
+        viable = reach[remaining]
+        for column, target in frames[-1]:
+            if not viable[target]:
+                continue
+            path.append(symbols[column])
+            if remaining == 0:
+                yield list(path)
+                path.pop()
+                continue
+            frames.append(iter(edges[target]))
+            break
+        else:
+            frames.pop()
+            if path:
+                path.pop()
+
+
+def enumerate_words(dfa: DFA, max_len: Optional[int] = None) -> Iterator[Word]:
+    """
+    Yield the words `dfa` accepts in shortlex order, lazily.
+
+    Args:
+        dfa: The DFA whose language to enumerate.
+        max_len: Stop after words of this length. With None, enumeration
+            continues for as long as the language has longer words (forever
+            if the language is infinite).
+    """
+    if max_len is not None and max_len < 0:
+        raise ValueError(f"max_len must be non-negative, got {max_len}")
+    counter = word_counter(dfa)
+    if not counter.size:
+        return
+    reach = [list(counter.accepting)]
+    length = 0
+    while max_len is None or length <= max_len:
+        if not any(reach[length]):
+            return
+        if reach[length][0]:
+            yield from _words_of_length(counter, reach, length)
+        previous = reach[length]
+        reach.append(
+            [any(previous[t] for t, _ in row) for row in counter.rows]
+        )
+        length += 1
@@ -1,8 +1,26 @@
-from typing import Dict, Optional, Set
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Union,
+)
 from automata.backend.grammar.dist import Alphabet, StateSet, State, Symbol, Word
 from automata.backend.grammar.automaton_base import Automaton
 from collections import defaultdict
 
+if TYPE_CHECKING:
+    from .dfa_compiled import ByteDFA, CompiledDFA
+    from .dfa_compressed import CompressedDFA
+    from .dfa_scanner import DFAScanner, ScanCheckpoint
+    from automata.backend.grammar.scc import StateAnalysis
+
 
 class DFA(Automaton[State]):
     def __init__(
@@ -13,10 +31,38 @@ class DFA(Automaton[State]):
         start_state: State,
         accept_states: StateSet,
         sink_state: Optional[State] = None,
+        labeler: Optional[Callable[[State], Optional[str]]] = None,
     ):
         super().__init__(states, alphabet, start_state, accept_states)
         self._transitions = transitions
         self._sink_state = sink_state
+        # Derived DFAs (subset construction, products) name their states with
+        # short ids and describe them through `labeler`, which is consulted
+        # only when a label is asked for (printing, drawing, `relabeled`).
+        self._labeler = labeler
+        # Derived results (completed form, minimal DFA, compiled tables, ...)
+        # are memoized in `_cache` and dropped whenever `_version` is bumped
+        # by a mutator, so repeated operations on an unchanged DFA are free.
+        self._version = 0
+        self._cache: Dict[Hashable, Any] = {}
+
+    @property
+    def version(self) -> int:
+        """Mutation counter, bumped by every mutating method of this DFA."""
+        return self._version
+
+    def _touch(self) -> None:
+        """Record a mutation: bump the version and drop memoized results."""
+        self._version += 1
+        self._cache.clear()
+
+    def _cached(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the memoized value for `key`, computing it on first use."""
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = compute()
+            return value
 
     def accepts(self, word: Word) -> bool:
         current = self._start_state
@@ -36,13 +82,145 @@ class DFA(Automaton[State]):
 
         return current in self._accept_states
 
+    def label(self, state: State) -> str:
+        """
+        Return the descriptive label of `state`. For the states of derived
+        DFAs it is built on demand, e.g. "q0,q1" for a subset of NFA states
+        or "(a‖b)" for a product pair; otherwise it is the state's name.
+        """
+        if self._labeler is not None:
+            label = self._labeler(state)
+            if label is not None:
+                return label
+        return str(state)
+
+    def labels(self) -> Dict[State, str]:
+        """Return the label of every state (see `label`)."""
+        return dict(
+            self._cached(
+                "labels",
+                lambda: {state: self.label(state) for state in self._states.states()},
+            )
+        )
+
+    def relabeled(self) -> "DFA":
+        """
+        Return a copy of this DFA whose states are renamed to their labels,
+        e.g. to export or display a derived DFA with descriptive names.
+        Returns self if no state has a label of its own.
+        """
+        if self._labeler is None:
+            return self
+        rename = self.labels()
+        for state in self._transitions.keys() | {self._start_state}:
+            rename.setdefault(state, self.label(state))
+        return DFA(
+            states=StateSet.from_states(rename.values()),
+            alphabet=self._alphabet,
+            transitions={
+                rename[source]: {
+                    symbol: rename.setdefault(target, self.label(target))
+                    for symbol, target in row.items()
+                }
+                for source, row in self._transitions.items()
+            },
+            start_state=State(rename[self._start_state]),
+            accept_states=StateSet.from_states(
+                {rename.get(s, self.label(s)) for s in self._accept_states.states()}
+            ),
+            sink_state=(
+                None
+                if self._sink_state is None
+                else State(rename.get(self._sink_state, self.label(self._sink_state)))
+            ),
+        )
+
+    def compile(self) -> "CompiledDFA":
+        """
+        Return an integer-compiled snapshot of this DFA for fast execution.
+
+        The compiled form exposes `accepts`, `run` and `match_prefix` with the
+        same semantics as this DFA. It is memoized until the DFA is mutated.
+        """
+        from .dfa_compiled import CompiledDFA
+        return self._cached("compile", lambda: CompiledDFA(self))
+
+    def compile_bytes(self) -> "ByteDFA":
+        """
+        Return a byte-level compiled snapshot of this DFA that matches
+        `bytes`, `bytearray`, `memoryview` and `mmap.mmap` inputs in place.
+        Single-character symbols match the byte with the same code point.
+        """
+        from .dfa_compiled import ByteDFA
+        return self._cached("compile_bytes", lambda: ByteDFA(self))
+
+    def compress(self) -> "CompressedDFA":
+        """
+        Return this DFA as a `CompressedDFA`: a row-displacement table with a
+        default target per state, which stores only the transitions that
+        differ from their row's default. Memoized until the DFA is mutated.
+        """
+        from .dfa_compressed import CompressedDFA
+        return self._cached("compress", lambda: CompressedDFA(self))
+
+    def accepts_many(self, words: Iterable[Word]) -> List[bool]:
+        """
+        Return a list with, for each word, whether this DFA accepts it.
+
+        A convenience wrapper for `[self.compile().accepts(w) for w in words]`:
+        each word runs on its own over the memoized compiled table.
+        """
+        return self.compile().accepts_many(words)
+
+    def accepts_parallel(
+        self,
+        word: Word,
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ) -> bool:
+        """
+        Return `self.accepts(word)`, computed by a pool of `workers` processes
+        that each map a chunk of `word` from every state; the per-chunk
+        mappings are then composed. Meant for very long inputs; short ones
+        are run sequentially.
+        """
+        from .dfa_parallel import accepts_parallel
+        return accepts_parallel(self.compile(), word, workers, chunk_size)
+
+    def scanner(self, checkpoint: Optional["ScanCheckpoint"] = None) -> "DFAScanner":
+        """
+        Return a streaming scanner over this DFA, fed with `feed(chunk)`.
+
+        Pass a checkpoint taken from an earlier scanner to resume that scan.
+        """
+        from .dfa_scanner import DFAScanner
+        return DFAScanner(self.compile(), checkpoint)
+
+    def scan_file(
+        self, source, chunk_size: int = 1 << 16, binary: bool = False
+    ) -> "DFAScanner":
+        """
+        Run this DFA over a file (path or open file) in fixed-size chunks,
+        using constant memory. Returns the scanner; check `accepted`.
+
+        With `binary`, the file is read as bytes and run over `compile_bytes()`
+        (an open file must then be in binary mode); otherwise it is read as
+        text.
+        """
+        from .dfa_scanner import DFAScanner, scan_file
+        scanner = DFAScanner(self.compile_bytes()) if binary else self.scanner()
+        return scan_file(scanner, source, chunk_size)
+
     def is_complete(self) -> bool:
         """Return True if every state has a transition on every alphabet symbol."""
         symbols = self._alphabet.symbols()
-        return all(
-            symbol in self._transitions.get(state, {})
-            for state in self._states.states()
-            for symbol in symbols
+        return self._cached(
+            "is_complete",
+            lambda: all(
+                symbol in self._transitions.get(state, {})
+                for state in self._states.states()
+                for symbol in symbols
+            ),
         )
 
     def completed(self, dead_state_name: str = "__dead__") -> "DFA":
@@ -53,9 +231,17 @@ class DFA(Automaton[State]):
         loops to itself on every symbol. Returns self unchanged if the
         transition function is already total. Algorithms that assume a total
         transition function (e.g. minimization) should operate on the result.
+        The result is memoized until this DFA is mutated; treat it as
+        read-only.
         """
         if self.is_complete():
             return self
+        return self._cached(
+            ("completed", dead_state_name),
+            lambda: self._build_completed(dead_state_name),
+        )
+
+    def _build_completed(self, dead_state_name: str) -> "DFA":
 
         dead = State(dead_state_name)
         while dead in self._states:
@@ -78,6 +264,7 @@ class DFA(Automaton[State]):
             start_state=self._start_state,
             accept_states=self._accept_states,
             sink_state=dead,
+            labeler=self._labeler,
         )
 
     @classmethod
@@ -137,6 +324,20 @@ class DFA(Automaton[State]):
             accept_states=StateSet.from_states(list(accept_s)),
         )
 
+    def save(self, path) -> None:
+        """Write this DFA to `path` in the package's binary automaton format."""
+        from ..serialization import save_dfa
+        save_dfa(self, path)
+
+    @classmethod
+    def load(cls, path, mmap: bool = True) -> "DFA":
+        """
+        Read a DFA written by `save`. The transition array is memory-mapped
+        (with `mmap=True`) and its rows are decoded on first use.
+        """
+        from ..serialization import load_dfa
+        return load_dfa(path, mmap=mmap)
+
     def complement(self) -> "DFA":
         """Return a DFA accepting exactly the words this DFA rejects (over its alphabet)."""
         from .dfa_ops import complement
@@ -158,20 +359,117 @@ class DFA(Automaton[State]):
         return difference(self, other)
 
     def is_empty(self) -> bool:
-        """Return True if this DFA accepts no word at all."""
-        from .dfa_ops import is_empty
-        return is_empty(self)
+        """Return True if this DFA accepts no word at all (sink state included)."""
+        return self.state_analysis().is_empty()
 
     def shortest_accepted(self) -> Optional[Word]:
         """Return a shortest accepted word, or None if the language is empty."""
         from .dfa_ops import shortest_accepted
-        return shortest_accepted(self)
+        word = self._cached("shortest_accepted", lambda: shortest_accepted(self))
+        return None if word is None else list(word)
+
+    def reachable_states(self) -> Set[State]:
+        """Return the states reachable from the start state."""
+        from .dfa_ops import reachable_states
+        return set(
+            self._cached(
+                "reachable_states", lambda: frozenset(reachable_states(self))
+            )
+        )
+
+    def state_analysis(self) -> "StateAnalysis":
+        """
+        Return the SCCs of the transition graph and the reachable, live,
+        useful and trap states. Memoized until this DFA is mutated.
+        """
+        from .dfa_ops import state_analysis
+        return self._cached("state_analysis", lambda: state_analysis(self))
+
+    def trim(self) -> "DFA":
+        """
+        Return an equivalent DFA without unreachable or dead states (states
+        from which no accepting state can be reached). The result is
+        memoized until this DFA is mutated; treat it as read-only.
+        """
+        from .dfa_ops import trim
+        return self._cached("trim", lambda: trim(self))
+
+    def minimized(self) -> "DFA":
+        """
+        Return the minimal DFA for this DFA's language (Hopcroft's algorithm).
+        The result is memoized until this DFA is mutated; treat it as
+        read-only.
+        """
+        from .minimization.hopcroft import hopcroft_minimize
+        return self._cached("minimized", lambda: hopcroft_minimize(self))
+
+    def canonical_form(self) -> "DFA":
+        """
+        Return the canonical DFA of this DFA's language: minimal and trimmed,
+        with states renamed q0..qn in breadth-first order over sorted
+        symbols. Equivalent DFAs have identical canonical forms. Memoized
+        until this DFA is mutated; treat it as read-only.
+        """
+        from .dfa_canonical import canonical_form
+        return canonical_form(self)
+
+    def signature(self) -> str:
+        """
+        Return a stable SHA-256 hex digest of this DFA's language, equal for
+        two DFAs exactly when they accept the same words.
+        """
+        from .dfa_canonical import signature
+        return signature(self)
+
+    def count_words(self, n: int) -> int:
+        """Return the number of accepted words of length exactly `n`."""
+        from .dfa_counting import count_words
+        return count_words(self, n)
+
+    def count_words_upto(self, n: int) -> int:
+        """Return the number of accepted words of length at most `n`."""
+        from .dfa_counting import count_words_upto
+        return count_words_upto(self, n)
+
+    def growth_series(self, n: int) -> List[int]:
+        """Return the accepted-word counts for every length 0..n."""
+        from .dfa_counting import growth_series
+        return growth_series(self, n)
+
+    def enumerate(self, max_len: Optional[int] = None) -> Iterator[Word]:
+        """
+        Lazily yield the accepted words in shortlex order (shortest first,
+        then lexicographic), up to `max_len` symbols if given.
+        """
+        from .dfa_enumeration import enumerate_words
+        return enumerate_words(self, max_len)
+
+    def sample(
+        self, n: int, k: Optional[int] = None, rng=None
+    ) -> Union[Word, List[Word]]:
+        """
+        Draw accepted words of length exactly `n` uniformly at random: one
+        word, or a list of `k` words. `rng` is a `random.Random` or a seed.
+        The per-length path-count tables are memoized.
+        """
+        from .dfa_sampling import sample_words
+        return sample_words(self, n, k, rng)
 
     def equivalent_to(self, other: "DFA") -> bool:
         """Return True if this DFA and `other` accept exactly the same language."""
         from .dfa_ops import equivalent
         return equivalent(self, other)
 
+    def is_subset_of(self, other: "DFA") -> bool:
+        """Return True if every word this DFA accepts is accepted by `other`."""
+        from .dfa_ops import is_subset
+        return is_subset(self, other)
+
+    def is_disjoint_from(self, other: "DFA") -> bool:
+        """Return True if no word is accepted by both this DFA and `other`."""
+        from .dfa_ops import intersection_is_empty
+        return intersection_is_empty(self, other)
+
     def find_distinguishing_string(self, other: "DFA") -> Optional[Word]:
         """Return a shortest word on which this DFA and `other` disagree, or None."""
         from .dfa_ops import find_distinguishing_string
@@ -193,8 +491,11 @@ class DFA(Automaton[State]):
         if from_state not in self._transitions:
             self._transitions[from_state] = {}
         self._transitions[from_state][symbol] = to_state
+        self._touch()
 
     def __str__(self):
+        if self._labeler is not None:
+            return str(self.relabeled())
         return (
             f"DFA(states={self._states}, "
             f"alphabet={self._alphabet}, "
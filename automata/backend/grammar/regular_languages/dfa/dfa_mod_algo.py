@@ -1,6 +1,7 @@
 from .dfa_mod import DFA
 from .algo.kmp import build_kmp_dfa, kmp_search
-from typing import Dict, Optional
+from .algo.aho_corasick import AhoCorasick
+from typing import Dict, Iterable, List, Optional, Tuple
 
 
 def create_dfa_from_pattern(pattern: str, alphabet: set[str]) -> DFA:
@@ -29,6 +30,33 @@ def create_dfa_from_pattern(pattern: str, alphabet: set[str]) -> DFA:
     )
 
 
+def create_dfa_from_patterns(patterns: Iterable[str], alphabet: set[str]) -> DFA:
+    """
+    Build a DFA that recognizes strings ending with any of 'patterns'
+    (Aho-Corasick-based). States are named q0..qn, q0 being the start.
+    """
+    transitions, start_state, accept_states = AhoCorasick(patterns).build_dfa(
+        alphabet
+    )
+
+    def name(state: int) -> str:
+        return f"q{state}"
+
+    named_transitions = {
+        name(state): {symbol: name(target) for symbol, target in trans.items()}
+        for state, trans in transitions.items()
+    }
+
+    return DFA(
+        states={name(s) for s in transitions.keys()},
+        alphabet=alphabet,
+        transitions=named_transitions,
+        start_state=name(start_state),
+        accept_states={name(s) for s in accept_states},
+        sink_state=None,
+    )
+
+
 def create_dfa_from_table(
     table: Dict[str, Dict[str, str]],
     start_state: str,
@@ -61,3 +89,11 @@ def find_pattern_in_text(pattern: str, text: str) -> list[int]:
     Return all occurrences of 'pattern' in 'text' using the KMP approach.
     """
     return kmp_search(pattern, text)
+
+
+def find_patterns_in_text(patterns: Iterable[str], text: str) -> List[Tuple[int, str]]:
+    """
+    Return all (start index, pattern) occurrences of any of 'patterns' in
+    'text' in a single pass, using the Aho-Corasick approach.
+    """
+    return AhoCorasick(patterns).search(text)
@@ -6,15 +6,28 @@ construction over the union of the two alphabets, and decision procedures
 (emptiness, equivalence) use breadth-first reachability, so equivalence
 checking returns a *shortest* distinguishing string as a counterexample.
 
+Decision procedures on *pairs* of DFAs (inclusion, disjointness,
+equivalence) never build the product DFA: `_search_product` explores state
+pairs lazily, breadth-first, and stops at the first pair that witnesses the
+property, so a wrong answer is usually refuted after a handful of pairs.
+Plain equivalence goes further with Hopcroft and Karp's union-find check,
+which visits at most one pair per merge of two state classes.
+
 All operations accept partial DFAs; missing transitions are treated as
 transitions to an implicit dead (rejecting) state.
 """
 
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 from collections import deque
+import heapq
+import itertools
 
 from automata.backend.grammar.dist import Alphabet, State, StateSet, Symbol, Word
 from automata.backend.grammar.regular_languages.dfa.dfa_mod import DFA
+from automata.backend.grammar.scc import StateAnalysis
+from automata.backend.grammar.regular_languages.dfa.minimization.hopcroft import (
+    hopcroft_minimize,
+)
 
 _DEAD = "__dead__"
 
@@ -24,10 +37,11 @@ def complement(dfa: DFA) -> DFA:
     Return a DFA accepting exactly the words over the DFA's alphabet that
     `dfa` rejects.
 
-    The complement is taken relative to Σ* for the DFA's own alphabet Σ;
-    the input is completed first so implicit rejections are represented.
+    The complement is taken relative to Σ* for the DFA's own alphabet Σ.
+    The input is trimmed first, which writes out the transitions into its
+    sink state, then completed so implicit rejections are represented.
     """
-    completed = dfa.completed(_DEAD)
+    completed = dfa.trim().completed(_DEAD)
     non_accepting = completed._states.states() - completed._accept_states.states()
     return DFA(
         states=StateSet.from_states(completed._states.states()),
@@ -45,54 +59,68 @@ def _product(
 ) -> DFA:
     """
     Product construction over the union alphabet, restricted to reachable
-    pairs. `accept_rule(in_accept1, in_accept2)` decides acceptance.
+    pairs of the trimmed operands. `accept_rule(in_accept1, in_accept2)`
+    decides acceptance. States are named p0, p1, ... in discovery order
+    (p0 is the start); `DFA.label` gives the "(a‖b)" pair label.
     """
     alphabet = Alphabet(dfa1._alphabet.symbols() | dfa2._alphabet.symbols())
 
     def completed_over(dfa: DFA) -> DFA:
+        if dfa._alphabet.symbols() == alphabet.symbols():
+            return dfa.completed(_DEAD)  # memoized on the operand
         widened = DFA(
             states=StateSet.from_states(dfa._states.states()),
             alphabet=alphabet,
             transitions=dfa._transitions,
             start_state=dfa._start_state,
             accept_states=StateSet.from_states(dfa._accept_states.states()),
+            labeler=dfa._labeler,
         )
         return widened.completed(_DEAD)
 
-    d1, d2 = completed_over(dfa1), completed_over(dfa2)
+    # Trimmed operands keep dead and unreachable states out of the pairs.
+    d1, d2 = completed_over(dfa1.trim()), completed_over(dfa2.trim())
     accept1, accept2 = d1._accept_states.states(), d2._accept_states.states()
+    symbols = list(alphabet.symbols())
 
-    def pair_name(a: State, b: State) -> State:
-        return State(f"({a}‖{b})")
-
+    # Pairs are numbered in discovery order; names are short ids and the
+    # "(a‖b)" labels are only built if asked for.
     start_pair = (d1._start_state, d2._start_state)
-    queue = deque([start_pair])
-    seen = {start_pair}
+    ids: Dict[Tuple[State, State], State] = {start_pair: State("p0")}
+    pairs: List[Tuple[State, State]] = [start_pair]
     transitions: Dict[State, Dict[Symbol, State]] = {}
-    states = set()
     accepting = set()
 
-    while queue:
-        a, b = queue.popleft()
-        name = pair_name(a, b)
-        states.add(name)
+    for a, b in pairs:
+        name = ids[(a, b)]
         if accept_rule(a in accept1, b in accept2):
             accepting.add(name)
+        row1, row2 = d1._transitions[a], d2._transitions[b]
         row = {}
-        for symbol in alphabet.symbols():
-            target = (d1._transitions[a][symbol], d2._transitions[b][symbol])
-            row[symbol] = pair_name(*target)
-            if target not in seen:
-                seen.add(target)
-                queue.append(target)
+        for symbol in symbols:
+            target = (row1[symbol], row2[symbol])
+            target_name = ids.get(target)
+            if target_name is None:
+                target_name = ids[target] = State(f"p{len(pairs)}")
+                pairs.append(target)
+            row[symbol] = target_name
         transitions[name] = row
 
+    pair_of = {name: pair for pair, name in ids.items()}
+
+    def label(state: State) -> Optional[str]:
+        pair = pair_of.get(state)
+        if pair is None:
+            return None
+        return f"({d1.label(pair[0])}‖{d2.label(pair[1])})"
+
     return DFA(
-        states=StateSet.from_states(states),
+        states=StateSet.from_states(ids.values()),
         alphabet=alphabet,
         transitions=transitions,
-        start_state=pair_name(*start_pair),
+        start_state=State("p0"),
         accept_states=StateSet.from_states(accepting),
+        labeler=label,
     )
 
 
@@ -116,11 +144,95 @@ def symmetric_difference(dfa1: DFA, dfa2: DFA) -> DFA:
     return _product(dfa1, dfa2, lambda a, b: a != b)
 
 
+def _empty_dfa(alphabet: Alphabet) -> DFA:
+    """A one-state DFA over `alphabet` that accepts nothing."""
+    start = State("q0")
+    return DFA(
+        states=StateSet.from_states({start}),
+        alphabet=alphabet,
+        transitions={},
+        start_state=start,
+        accept_states=StateSet.from_states(set()),
+    )
+
+
+def _combine_all(
+    dfas: Iterable[DFA],
+    combine: Callable[[DFA, DFA], DFA],
+    absorbing_empty: bool,
+) -> DFA:
+    """
+    Fold `combine` over `dfas`, always combining the two smallest operands
+    (Huffman order), so intermediate products stay as small as possible.
+
+    An intermediate result that has more states than both of its operands
+    is minimized before it is reused. If `absorbing_empty`, an empty
+    intermediate (as for intersection) ends the fold with the empty DFA;
+    otherwise empty operands (neutral for union) are dropped. A single
+    remaining operand is returned as is.
+    """
+    operands = list(dfas)
+    if not operands:
+        raise ValueError("Need at least one DFA to combine")
+    symbols = set()
+    for dfa in operands:
+        symbols |= dfa._alphabet.symbols()
+    alphabet = Alphabet(symbols)
+
+    def is_empty(dfa: DFA) -> bool:
+        # Sink-aware, unlike `DFA.is_empty`: a DFA may accept only by way of
+        # its sink state.
+        return dfa.state_analysis().is_empty()
+
+    tie = itertools.count()  # keeps heapq from ever comparing DFAs
+    heap = []
+    for dfa in operands:
+        if is_empty(dfa):
+            if absorbing_empty:
+                return _empty_dfa(alphabet)
+            continue
+        heapq.heappush(heap, (len(dfa._states), next(tie), dfa))
+    if not heap:
+        return _empty_dfa(alphabet)
+
+    while len(heap) > 1:
+        size1, _, dfa1 = heapq.heappop(heap)
+        size2, _, dfa2 = heapq.heappop(heap)
+        result = combine(dfa1, dfa2)
+        if len(result._states) > max(size1, size2):
+            result = hopcroft_minimize(result)
+        if absorbing_empty and is_empty(result):
+            return _empty_dfa(alphabet)
+        heapq.heappush(heap, (len(result._states), next(tie), result))
+    return heap[0][2]
+
+
+def intersect_all(dfas: Iterable[DFA]) -> DFA:
+    """
+    Return a DFA accepting the words accepted by every DFA in `dfas`.
+
+    Operands are combined smallest-first, growing intermediates are
+    minimized, and the fold stops as soon as an intermediate is empty.
+    """
+    return _combine_all(dfas, intersection, absorbing_empty=True)
+
+
+def union_all(dfas: Iterable[DFA]) -> DFA:
+    """
+    Return a DFA accepting the words accepted by any DFA in `dfas`.
+
+    Empty operands are skipped; the rest are combined smallest-first and
+    growing intermediates are minimized.
+    """
+    return _combine_all(dfas, union, absorbing_empty=False)
+
+
 def shortest_accepted(dfa: DFA) -> Optional[Word]:
     """
     Return a shortest accepted word (as a list of Symbols), or None if the
     DFA's language is empty. Symbols are tried in sorted order, so the
-    result is deterministic.
+    result is deterministic. Missing transitions lead to the sink state, if
+    any, as in `DFA.accepts`.
     """
     if dfa._start_state in dfa._accept_states:
         return []
@@ -132,7 +244,7 @@ def shortest_accepted(dfa: DFA) -> Optional[Word]:
     while queue:
         state, path = queue.popleft()
         for symbol in symbols:
-            target = dfa._transitions.get(state, {}).get(symbol)
+            target = _step(dfa, state, symbol)
             if target is None or target in visited:
                 continue
             word = path + [symbol]
@@ -144,9 +256,169 @@ def shortest_accepted(dfa: DFA) -> Optional[Word]:
     return None
 
 
+def reachable_states(dfa: DFA) -> Set[State]:
+    """
+    Return the states reachable from the start state. A DFA's sink state
+    counts as reachable once a reachable state has a missing transition.
+    """
+    symbols = dfa._alphabet.symbols()
+    reached = {dfa._start_state}
+    stack = [dfa._start_state]
+    while stack:
+        row = dfa._transitions.get(stack.pop(), {})
+        targets = list(row.values())
+        if dfa._sink_state is not None and not symbols <= row.keys():
+            targets.append(dfa._sink_state)
+        for target in targets:
+            if target not in reached:
+                reached.add(target)
+                stack.append(target)
+    return reached
+
+
 def is_empty(dfa: DFA) -> bool:
-    """Return True if the DFA accepts no word at all."""
-    return shortest_accepted(dfa) is None
+    """Return True if the DFA accepts no word at all (sink state included)."""
+    return dfa.state_analysis().is_empty()
+
+
+def state_analysis(dfa: DFA) -> StateAnalysis:
+    """
+    Classify the DFA's states into reachable, live, useful and trap states
+    (see `automata.backend.grammar.scc`). A state with a missing transition
+    has the sink state, if any, as a successor.
+    """
+    symbols = dfa._alphabet.symbols()
+    successors: Dict[State, Set[State]] = {}
+    for state in dfa._states.states() | dfa._transitions.keys():
+        row = dfa._transitions.get(state, {})
+        targets = set(row.values())
+        if dfa._sink_state is not None and not symbols <= row.keys():
+            targets.add(dfa._sink_state)
+        successors[state] = targets
+    return StateAnalysis(
+        dfa._states.states(),
+        dfa._start_state,
+        dfa._accept_states.states(),
+        successors,
+    )
+
+
+def trim(dfa: DFA) -> DFA:
+    """
+    Return an equivalent DFA with only the useful states (reachable and
+    live), plus the start state. Transitions into removed states are
+    dropped, so the result is partial.
+
+    The result has no sink state: if the sink is useful, the transitions
+    that implicitly led to it are written out. Returns `dfa` itself if there
+    is nothing to remove.
+    """
+    analysis = dfa.state_analysis()
+    keep = analysis.useful | {dfa._start_state}
+    if dfa._sink_state is None and keep >= dfa._states.states() | dfa._transitions.keys():
+        return dfa
+    sink = dfa._sink_state if dfa._sink_state in keep else None
+    symbols = dfa._alphabet.symbols()
+
+    transitions: Dict[State, Dict[Symbol, State]] = {}
+    for state in keep:
+        row = dfa._transitions.get(state, {})
+        kept = {symbol: target for symbol, target in row.items() if target in keep}
+        if sink is not None:
+            for symbol in symbols - row.keys():
+                kept[symbol] = sink
+        if kept:
+            transitions[state] = kept
+
+    return DFA(
+        states=StateSet.from_states(keep),
+        alphabet=dfa._alphabet,
+        transitions=transitions,
+        start_state=dfa._start_state,
+        accept_states=StateSet.from_states(dfa._accept_states.states() & keep),
+        labeler=dfa._labeler,
+    )
+
+
+def _step(dfa: DFA, state: Optional[State], symbol: Symbol) -> Optional[State]:
+    """One transition with `DFA.accepts` semantics; None is the implicit dead state."""
+    if state is None:
+        return None
+    target = dfa._transitions.get(state, {}).get(symbol)
+    if target is None and dfa._sink_state is not None and symbol in dfa._alphabet:
+        return dfa._sink_state
+    return target
+
+
+def _search_product(
+    dfa1: DFA, dfa2: DFA, goal: Callable[[bool, bool], bool]
+) -> Optional[Word]:
+    """
+    Return a shortest word w with goal(dfa1 accepts w, dfa2 accepts w), or
+    None if there is none, exploring the product of the two DFAs on the fly.
+
+    Pairs are discovered breadth-first over the union alphabet in sorted
+    order and recorded only as parent pointers; no product DFA is built.
+    A pair is not expanded once a dead component makes the goal unreachable.
+    """
+    symbols = sorted(dfa1._alphabet.symbols() | dfa2._alphabet.symbols())
+    accept1, accept2 = dfa1._accept_states, dfa2._accept_states
+
+    def outcomes(state: Optional[State]) -> Tuple[bool, ...]:
+        return (False,) if state is None else (False, True)
+
+    def hopeless(pair: Tuple[Optional[State], Optional[State]]) -> bool:
+        return not any(
+            goal(a, b) for a in outcomes(pair[0]) for b in outcomes(pair[1])
+        )
+
+    start = (dfa1._start_state, dfa2._start_state)
+    parents: Dict[Tuple, Optional[Tuple[Tuple, Symbol]]] = {start: None}
+    queue = deque([start])
+
+    while queue:
+        pair = queue.popleft()
+        if goal(pair[0] in accept1, pair[1] in accept2):
+            word: List[Symbol] = []
+            link = parents[pair]
+            while link is not None:
+                pair, symbol = link
+                word.append(symbol)
+                link = parents[pair]
+            word.reverse()
+            return word
+        if hopeless(pair):
+            continue
+        for symbol in symbols:
+            target = (_step(dfa1, pair[0], symbol), _step(dfa2, pair[1], symbol))
+            if target not in parents:
+                parents[target] = (pair, symbol)
+                queue.append(target)
+
+    return None
+
+
+def intersection_is_empty(dfa1: DFA, dfa2: DFA) -> bool:
+    """Return True if no word is accepted by both DFAs."""
+    return _search_product(dfa1, dfa2, lambda a, b: a and b) is None
+
+
+def find_common_word(dfa1: DFA, dfa2: DFA) -> Optional[Word]:
+    """Return a shortest word accepted by both DFAs, or None."""
+    return _search_product(dfa1, dfa2, lambda a, b: a and b)
+
+
+def find_inclusion_counterexample(dfa1: DFA, dfa2: DFA) -> Optional[Word]:
+    """
+    Return a shortest word accepted by dfa1 but rejected by dfa2, or None
+    if dfa1's language is a subset of dfa2's.
+    """
+    return _search_product(dfa1, dfa2, lambda a, b: a and not b)
+
+
+def is_subset(dfa1: DFA, dfa2: DFA) -> bool:
+    """Return True if every word dfa1 accepts is also accepted by dfa2."""
+    return find_inclusion_counterexample(dfa1, dfa2) is None
 
 
 def find_distinguishing_string(dfa1: DFA, dfa2: DFA) -> Optional[Word]:
@@ -157,9 +429,79 @@ def find_distinguishing_string(dfa1: DFA, dfa2: DFA) -> Optional[Word]:
     This is the counterexample generator: if a student's DFA differs from a
     reference DFA, the returned word demonstrates the difference.
     """
-    return shortest_accepted(symmetric_difference(dfa1, dfa2))
+    return _search_product(dfa1, dfa2, lambda a, b: a != b)
+
+
+def hopcroft_karp(dfa1: DFA, dfa2: DFA) -> Optional[Word]:
+    """
+    Decide equivalence with Hopcroft and Karp's union-find algorithm and
+    return a distinguishing word, or None if the DFAs are equivalent.
+
+    The states of both DFAs (plus one shared implicit dead state) start in
+    singleton classes. Starting from the pair of start states, each pair
+    taken off the queue has its successors' classes merged, and a successor
+    pair is queued only when its classes were actually distinct. So at most
+    |Q1| + |Q2| pairs are ever processed, for O(|Σ|·n·α(n)) time overall.
+
+    Pairs are processed breadth-first, so the returned word is short, though
+    unlike `find_distinguishing_string` it is not guaranteed to be shortest.
+    """
+    symbols = sorted(dfa1._alphabet.symbols() | dfa2._alphabet.symbols())
+    accept1, accept2 = dfa1._accept_states, dfa2._accept_states
+    # Union-find keys: (1, state) / (2, state); None is the shared dead state.
+    parent: Dict = {}
+    size: Dict = {}
+
+    def key(side: int, state: Optional[State]):
+        return None if state is None else (side, state)
+
+    def find(x):
+        parent.setdefault(x, x)
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]  # path halving
+            x = parent[x]
+        return x
+
+    def union(x, y) -> bool:
+        rx, ry = find(x), find(y)
+        if rx == ry:
+            return False
+        if size.get(rx, 1) < size.get(ry, 1):
+            rx, ry = ry, rx
+        parent[ry] = rx
+        size[rx] = size.get(rx, 1) + size.get(ry, 1)
+        return True
+
+    start = (dfa1._start_state, dfa2._start_state)
+    union(key(1, start[0]), key(2, start[1]))
+    links: Dict[Tuple, Optional[Tuple[Tuple, Symbol]]] = {start: None}
+    queue = deque([start])
+
+    while queue:
+        pair = queue.popleft()
+        if (pair[0] in accept1) != (pair[1] in accept2):
+            word: List[Symbol] = []
+            link = links[pair]
+            while link is not None:
+                pair, symbol = link
+                word.append(symbol)
+                link = links[pair]
+            word.reverse()
+            return word
+        for symbol in symbols:
+            target = (_step(dfa1, pair[0], symbol), _step(dfa2, pair[1], symbol))
+            if union(key(1, target[0]), key(2, target[1])):
+                links.setdefault(target, (pair, symbol))
+                queue.append(target)
+
+    return None
 
 
 def equivalent(dfa1: DFA, dfa2: DFA) -> bool:
-    """Return True if the two DFAs accept exactly the same language."""
-    return find_distinguishing_string(dfa1, dfa2) is None
+    """
+    Return True if the two DFAs accept exactly the same language.
+
+    Uses the near-linear union-find check (`hopcroft_karp`); call
+    `find_distinguishing_string` when a shortest counterexample is needed.
+    """
+    return hopcroft_karp(dfa1, dfa2) is None
@@ -0,0 +1,189 @@
+"""
+Parallel, chunked DFA simulation.
+
+A DFA run is a left fold of the transition function over the input, which
+is sequential as written. But the function a chunk of input induces on
+states, f_chunk : state -> state, can be computed without knowing the state
+the chunk starts in, and running the whole input is just the composition
+
+    f_input = f_chunkN ∘ … ∘ f_chunk2 ∘ f_chunk1
+
+so the input is split into chunks, worker processes compute each chunk's
+state mapping from *every* state at once, and the parent composes the
+mappings in order by following a single state through them.
+
+Workers run the hot loop of a `CompiledDFA` (or `ByteDFA`), which is
+shipped to each worker once when the pool starts: a chunk is turned into
+column numbers in one pass (`CompiledDFA._columns`, the `str.translate`
+fast path where it applies), then stepped over the list table. The runs
+from all start states advance in short blocks, and runs that have reached
+the same state are merged at each block boundary. Blocks start at
+`_FIRST_BLOCK` symbols and double, up to `_MAX_BLOCK`, only while no runs
+merge, so a run that merges has stepped at most about twice as far as it
+needed to. Once a single run is left it finishes the chunk alone. A chunk
+therefore costs O(chunk) steps per run that survives to its end, plus a
+short prefix per start state: a DFA that synchronizes quickly costs about
+one sequential pass per chunk, while one that permutes its states (never
+merging them) costs a factor of the number of states. Parallelism pays off
+for long inputs, synchronizing DFAs and more than one CPU; the per-chunk
+pickling and the composition in the parent make it slower than `accepts`
+on a single core.
+
+Results are exactly those of the sequential run, including the dead row for
+missing transitions and rejection of symbols outside the alphabet.
+"""
+
+import os
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import MutableMapping, Optional
+
+from automata.backend.grammar.dist import State, Word
+from automata.backend.grammar.regular_languages.dfa.dfa_compiled import CompiledDFA
+
+# Inputs shorter than this are run sequentially by default; below it the
+# cost of starting a process pool outweighs the work.
+MIN_CHUNK_SIZE = 1 << 16
+
+# Runs are advanced in blocks of this many symbols between merges of start
+# states that have reached the same state; a block doubles, up to
+# `_MAX_BLOCK`, whenever it ends without a merge.
+_FIRST_BLOCK = 16
+_MAX_BLOCK = 4096
+
+# Per-process copy of the compiled DFA, installed by `_init_worker`.
+_worker_compiled: Optional[CompiledDFA] = None
+
+
+def _init_worker(compiled: CompiledDFA) -> None:
+    global _worker_compiled
+    _worker_compiled = compiled
+
+
+def _chunk_mapping(
+    chunk: Word, metrics: Optional[MutableMapping[str, int]] = None
+) -> array:
+    """
+    The state mapping `chunk` induces, as row offsets indexed by start row.
+    An entry of -1 means the chunk contains a symbol outside the alphabet.
+    `metrics`, if given, receives the number of table `steps` taken and the
+    number of `surviving_runs` at the end of the chunk.
+    """
+    compiled = _worker_compiled
+    rows, width, dead = compiled._rows, compiled._width, compiled._dead
+    mapping = array("i", [-1]) * (dead + 1)
+    columns = compiled._columns(chunk)
+    if columns is None:
+        return mapping
+    # Current row offset -> the start rows that have reached it. The dead
+    # row maps to itself and is left out of the simulation.
+    groups = {row * width: [row] for row in range(dead)}
+    position, block, steps = 0, _FIRST_BLOCK, 0
+    while len(groups) > 1 and position < len(columns):
+        piece = columns[position : position + block]
+        position += block
+        steps += len(piece) * len(groups)
+        merged = {}
+        for offset, origins in groups.items():
+            for column in piece:
+                offset = rows[offset + column]
+            if offset in merged:
+                merged[offset].extend(origins)
+            else:
+                merged[offset] = origins
+        if len(merged) == len(groups):
+            block = min(2 * block, _MAX_BLOCK)
+        groups = merged
+    if position < len(columns):
+        # One run is left: finish the chunk with the sequential loop.
+        ((offset, origins),) = groups.items()
+        steps += len(columns) - position
+        for column in columns[position:]:
+            offset = rows[offset + column]
+        groups = {offset: origins}
+    for offset, origins in groups.items():
+        for row in origins:
+            mapping[row] = offset
+    mapping[dead] = dead * width
+    if metrics is not None:
+        metrics.update({"steps": steps, "surviving_runs": len(groups)})
+    return mapping
+
+
+def _chunks(word: Word, chunk_size: int):
+    for start in range(0, len(word), chunk_size):
+        chunk = word[start : start + chunk_size]
+        # memoryview slices cannot be pickled to the workers.
+        yield chunk.tobytes() if isinstance(chunk, memoryview) else chunk
+
+
+def _parallel_walk(
+    compiled: CompiledDFA,
+    word: Word,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> int:
+    """Row offset reached on `word` (-1 for an unknown symbol), computed in parallel."""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be positive, got {workers}")
+    if chunk_size is None:
+        chunk_size = max(MIN_CHUNK_SIZE, -(-len(word) // (workers * 4)))
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    if workers == 1 or len(word) <= chunk_size:
+        return compiled._walk(word)
+
+    width = compiled._width
+    dead_offset = compiled._dead * width
+    offset = 0
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(compiled,)
+    ) as pool:
+        # Keep a bounded window of chunks in flight so a huge input is never
+        # sliced into memory all at once.
+        pending = deque()
+        chunks = _chunks(word, chunk_size)
+        for chunk in islice(chunks, 2 * workers):
+            pending.append(pool.submit(_chunk_mapping, chunk))
+        while pending:
+            offset = pending.popleft().result()[offset // width]
+            if offset < 0 or offset == dead_offset:
+                # Rejected for good; nothing later can change the outcome.
+                for future in pending:
+                    future.cancel()
+                break
+            for chunk in islice(chunks, 1):
+                pending.append(pool.submit(_chunk_mapping, chunk))
+    return offset
+
+
+def accepts_parallel(
+    compiled: CompiledDFA,
+    word: Word,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> bool:
+    """
+    Return True if `compiled` accepts `word`, splitting the run across a
+    pool of `workers` processes (default: one per CPU) in chunks of
+    `chunk_size` symbols. Short inputs are run sequentially.
+    """
+    offset = _parallel_walk(compiled, word, workers, chunk_size)
+    return offset in compiled._accepting_offsets
+
+
+def run_parallel(
+    compiled: CompiledDFA,
+    word: Word,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> Optional[State]:
+    """Like `CompiledDFA.run`, computed in parallel as `accepts_parallel` is."""
+    offset = _parallel_walk(compiled, word, workers, chunk_size)
+    if offset < 0 or offset == compiled._dead * compiled._width:
+        return None
+    return compiled._states[offset // compiled._width]
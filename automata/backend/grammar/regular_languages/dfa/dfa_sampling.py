@@ -0,0 +1,114 @@
+"""
+Uniform random sampling of accepted words of a fixed length.
+
+For a target length n the sampler precomputes, for every useful state s
+and every r ≤ n, the number of words of length r that lead from s to
+acceptance:
+
+    paths[0][s]   = 1 if s is accepting else 0
+    paths[r][s]   = Σ over edges s -a-> t of paths[r-1][t]
+
+A word is then drawn left to right. At state s, with r symbols still to
+go, the edge to t is taken with probability paths[r-1][t] / paths[r][s].
+Each accepted word of length n is the product of its step probabilities,
+which telescopes to 1 / paths[n][start], so the draw is exactly uniform.
+Counts are exact integers and `random.Random.randrange` draws exactly from
+them, so no precision is lost for long words.
+
+Cumulative edge weights are stored per (r, s), so each step is a binary
+search and a word costs O(n log |Σ|). The tables are memoized on the DFA
+per length.
+"""
+
+import random
+from bisect import bisect_right
+from itertools import accumulate
+from typing import List, Optional, Tuple, Union
+
+from automata.backend.grammar.dist import Word
+from automata.backend.grammar.regular_languages.dfa.dfa_counting import word_counter
+from automata.backend.grammar.regular_languages.dfa.dfa_mod import DFA
+
+RandomSource = Union[random.Random, int, None]
+
+
+def _as_rng(rng: RandomSource) -> random.Random:
+    if isinstance(rng, random.Random):
+        return rng
+    return random.Random(rng)
+
+
+class WordSampler:
+    """Draws accepted words of length `n` uniformly at random from a DFA."""
+
+    def __init__(self, dfa: DFA, n: int):
+        if n < 0:
+            raise ValueError(f"Word length must be non-negative, got {n}")
+        counter = word_counter(dfa)
+        self.length = n
+        self._symbols = counter.symbols
+        self._edges = counter.edges
+
+        paths: List[List[int]] = []
+        if counter.size:
+            paths.append([int(a) for a in counter.accepting])
+            for _ in range(n):
+                previous = paths[-1]
+                paths.append(
+                    [sum(previous[t] * m for t, m in row) for row in counter.rows]
+                )
+        self.total = paths[n][0] if paths else 0
+
+        # _steps[r][s]: (cumulative weights, edge targets) for leaving s with
+        # r symbols still to read, over the edges that can still accept.
+        self._steps: List[List[Optional[Tuple[List[int], List[Tuple[int, int]]]]]]
+        self._steps = []
+        for r in range(1, n + 1 if self.total else 1):
+            weights_after = paths[r - 1]
+            row = []
+            for s, edges in enumerate(self._edges):
+                if not paths[r][s]:
+                    row.append(None)
+                    continue
+                viable = [(c, t) for c, t in edges if weights_after[t]]
+                cumulative = list(accumulate(weights_after[t] for _, t in viable))
+                row.append((cumulative, viable))
+            self._steps.append(row)
+
+    def draw(self, rng: random.Random) -> Word:
+        """Draw one word; the sampler must have a non-zero `total`."""
+        word = []
+        state = 0
+        for r in range(self.length, 0, -1):
+            cumulative, viable = self._steps[r - 1][state]
+            pick = bisect_right(cumulative, rng.randrange(cumulative[-1]))
+            column, state = viable[pick]
+            word.append(self._symbols[column])
+        return word
+
+
+def sample_words(
+    dfa: DFA, n: int, k: Optional[int] = None, rng: RandomSource = None
+) -> Union[Word, List[Word]]:
+    """
+    Draw accepted words of length exactly `n`, uniformly at random.
+
+    Args:
+        dfa: The DFA to sample from.
+        n: The length of the words.
+        k: Number of words to draw. With None, a single word is returned;
+            otherwise a list of `k` independent draws.
+        rng: A `random.Random`, a seed, or None for a fresh unseeded source.
+
+    Raises:
+        ValueError: If the DFA accepts no word of length `n`, or `k` < 0.
+    """
+    if k is not None and k < 0:
+        raise ValueError(f"Sample size must be non-negative, got {k}")
+    sampler = dfa._cached(("sampler", n), lambda: WordSampler(dfa, n))
+    if not sampler.total:
+        raise ValueError(f"The DFA accepts no word of length {n}")
+    source = _as_rng(rng)
+    if k is None:
+        return sampler.draw(source)
+    return [sampler.draw(source) for _ in range(k)]
@@ -0,0 +1,182 @@
+"""
+Streaming, resumable DFA scanning.
+
+`DFA.accepts` needs the whole word up front. A `DFAScanner` instead consumes
+input incrementally: feed it chunks of symbols (e.g. `str` chunks read from a
+text file, or `bytes` chunks for a scanner over a `ByteDFA`) and query the
+state reached so far. Memory use is constant in the
+length of the input.
+
+The scanner runs over the integer table of a `CompiledDFA`, and additionally
+knows which states can still reach an accepting state. Once the run enters a
+state that cannot (or meets a symbol outside the alphabet), the scanner is
+*dead*: no continuation can be accepted, further chunks are skipped, and
+callers reading from a file can stop early.
+
+A scan can be checkpointed into a small `ScanCheckpoint` (state name plus
+position) and resumed later, in another process, or against a freshly
+compiled copy of the same DFA.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, AnyStr, Optional, Union
+
+from automata.backend.grammar.dist import State, Word
+from automata.backend.grammar.regular_languages.dfa.dfa_compiled import (
+    ByteDFA,
+    CompiledDFA,
+)
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+@dataclass(frozen=True)
+class ScanCheckpoint:
+    """Where a scan stands: the current state (None once dead) and how many
+    symbols have been fed so far."""
+
+    state: Optional[State]
+    position: int
+
+
+def _live_offsets(compiled: CompiledDFA) -> frozenset:
+    """Row offsets of the states from which some accepting state is reachable."""
+    width, table = compiled._width, compiled._table
+    rows = compiled._dead + 1
+    predecessors = [[] for _ in range(rows)]
+    for row in range(rows):
+        for column in range(width):
+            predecessors[table[row * width + column] // width].append(row)
+
+    live = {offset // width for offset in compiled._accepting_offsets}
+    stack = list(live)
+    while stack:
+        for pred in predecessors[stack.pop()]:
+            if pred not in live:
+                live.add(pred)
+                stack.append(pred)
+    return frozenset(row * width for row in live)
+
+
+class DFAScanner:
+    """
+    Incrementally runs a compiled DFA over input supplied in chunks.
+
+    Args:
+        compiled: The compiled DFA to run.
+        checkpoint: Resume from this checkpoint instead of the start state.
+    """
+
+    def __init__(
+        self, compiled: CompiledDFA, checkpoint: Optional[ScanCheckpoint] = None
+    ):
+        self._compiled = compiled
+        self._live = _live_offsets(compiled)
+        self._offset = 0
+        self._position = 0
+        self._dead = False
+        if checkpoint is not None:
+            self._restore(checkpoint)
+        self._dead = self._dead or self._offset not in self._live
+
+    def _restore(self, checkpoint: ScanCheckpoint) -> None:
+        self._position = checkpoint.position
+        if checkpoint.state is None:
+            self._dead = True
+            return
+        state_id = self._compiled._state_id.get(checkpoint.state)
+        if state_id is None:
+            raise ValueError(
+                f"Checkpoint state {checkpoint.state!r} is not a state of this DFA"
+            )
+        self._offset = state_id * self._compiled._width
+
+    def feed(self, chunk: Word) -> "DFAScanner":
+        """
+        Consume the symbols of `chunk` (a sequence of symbols, e.g. a str).
+        Returns the scanner, so calls can be chained.
+        """
+        self._position += len(chunk)
+        if self._dead:
+            return self
+        table, column = self._compiled._table, self._compiled._symbol_column
+        offset = self._offset
+        try:
+            for symbol in chunk:
+                offset = table[offset + column[symbol]]
+        except KeyError:
+            # A symbol outside the alphabet rejects every continuation.
+            self._dead = True
+            return self
+        self._offset = offset
+        self._dead = offset not in self._live
+        return self
+
+    @property
+    def state(self) -> Optional[State]:
+        """The current state, or None once the run has died."""
+        if self._dead:
+            return None
+        return self._compiled._states[self._offset // self._compiled._width]
+
+    @property
+    def is_dead(self) -> bool:
+        """True if no continuation of the input fed so far can be accepted."""
+        return self._dead
+
+    @property
+    def accepted(self) -> bool:
+        """True if the input fed so far is accepted."""
+        return not self._dead and self._offset in self._compiled._accepting_offsets
+
+    @property
+    def position(self) -> int:
+        """The number of symbols fed so far."""
+        return self._position
+
+    def checkpoint(self) -> ScanCheckpoint:
+        """Capture the scan so it can be resumed with `DFA.scanner(checkpoint)`."""
+        return ScanCheckpoint(state=self.state, position=self._position)
+
+    @property
+    def is_binary(self) -> bool:
+        """True if the scanner runs a `ByteDFA` and is fed `bytes` chunks."""
+        return isinstance(self._compiled, ByteDFA)
+
+    def __repr__(self) -> str:
+        return (
+            f"DFAScanner(state={self.state!r}, position={self._position}, "
+            f"dead={self._dead})"
+        )
+
+
+def scan_file(
+    scanner: DFAScanner,
+    source: Union[str, Path, IO[AnyStr]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = "utf-8",
+) -> DFAScanner:
+    """
+    Feed a file to `scanner` in chunks of `chunk_size` characters, or of
+    `chunk_size` bytes when the scanner runs a `ByteDFA`.
+
+    `source` is either a path or an open file. A path is opened in binary
+    mode for a `ByteDFA` scanner and otherwise as text with `encoding`; an
+    open file must match (binary for a `ByteDFA`, text otherwise). Reading
+    stops early once the scanner is dead. Returns the scanner.
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    if isinstance(source, (str, Path)):
+        if scanner.is_binary:
+            with open(source, "rb") as handle:
+                return scan_file(scanner, handle, chunk_size)
+        with open(source, "r", encoding=encoding) as handle:
+            return scan_file(scanner, handle, chunk_size)
+    while not scanner.is_dead:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            break
+        scanner.feed(chunk)
+    return scanner
@@ -12,11 +12,13 @@ data structures needed for the textbook O(|Σ| · n log n) bound:
   smaller half is enqueued. Each state's block can therefore reappear on the
   worklist only O(log n) times per symbol.
 
-The input DFA is first completed (missing transitions are routed to an
-explicit dead state) so that partial DFAs are minimized correctly.
+`hopcroft_minimize` first trims the input (`DFA.trim`), so unreachable and
+dead states never enter the refinement, and then completes it (missing
+transitions are routed to one explicit dead state) so that partial DFAs are
+minimized correctly.
 """
 
-from typing import Dict, List, Set
+from typing import Dict, Hashable, List, Optional, Set, Tuple
 from collections import defaultdict, deque
 
 from automata.backend.grammar.dist import State, Symbol
@@ -28,14 +30,20 @@ from automata.backend.grammar.regular_languages.dfa.minimization.partition_build
 _DEAD = "__dead__"
 
 
-def _refine_partition(dfa: DFA) -> List[Set[State]]:
+def _refine_partition(
+    dfa: DFA, initial: Optional[List[Set[State]]] = None
+) -> List[Set[State]]:
     """
     Run Hopcroft's partition refinement on a completed DFA and return the
     final partition into equivalence classes.
+
+    `initial` overrides the starting partition (by default: accepting vs.
+    non-accepting states); refinement never merges states across its blocks.
     """
     all_states = dfa._states.states()
-    accepting = set(dfa._accept_states.states()) & all_states
-    non_accepting = all_states - accepting
+    if initial is None:
+        accepting = set(dfa._accept_states.states()) & all_states
+        initial = [all_states - accepting, accepting]
     symbols = list(dfa._alphabet.symbols())
 
     # Inverse transition index: predecessors[symbol][state] = states that
@@ -51,7 +59,7 @@ def _refine_partition(dfa: DFA) -> List[Set[State]]:
     blocks: Dict[int, Set[State]] = {}
     block_of: Dict[State, int] = {}
     next_id = 0
-    for group in (non_accepting, accepting):
+    for group in initial:
         if group:
             blocks[next_id] = set(group)
             for s in group:
@@ -61,8 +69,14 @@ def _refine_partition(dfa: DFA) -> List[Set[State]]:
     if len(blocks) <= 1:
         return list(blocks.values())
 
-    smaller_id = min(blocks, key=lambda b: len(blocks[b]))
-    worklist = deque((smaller_id, symbol) for symbol in symbols)
+    # Every initial block but the largest must be used as a splitter.
+    largest_id = max(blocks, key=lambda b: len(blocks[b]))
+    worklist = deque(
+        (block_id, symbol)
+        for block_id in blocks
+        if block_id != largest_id
+        for symbol in symbols
+    )
     on_worklist = set(worklist)
 
     while worklist:
@@ -110,7 +124,8 @@ def hopcroft_minimize(dfa: DFA) -> DFA:
 
     Works on partial DFAs: missing transitions are treated as transitions to
     an implicit dead state, so states that only differ in *how* they reject
-    (dead-state loop vs. missing transition) are correctly merged.
+    (dead-state loop vs. missing transition) are correctly merged. The input
+    is trimmed first, so the result has no unreachable states.
 
     Args:
         dfa: The DFA to minimize
@@ -118,13 +133,49 @@ def hopcroft_minimize(dfa: DFA) -> DFA:
     Returns:
         A minimized DFA accepting the same language
     """
-    completed = dfa.completed(_DEAD)
+    trimmed = dfa.trim()
+    completed = trimmed.completed(_DEAD)
     partition = _refine_partition(completed)
-    added = completed._states.states() - dfa._states.states()
+    added = completed._states.states() - trimmed._states.states()
     dead = next(iter(added)) if added else None
     return build_dfa_from_partition(completed, partition, dead_state=dead)
 
 
+def hopcroft_minimize_tagged(
+    dfa: DFA, tags: Dict[State, Hashable]
+) -> Tuple[DFA, Dict[State, Hashable]]:
+    """
+    Minimize a DFA whose accepting states carry tags (e.g. token kinds),
+    never merging states with different tags.
+
+    The refinement starts from the partition of states by tag (untagged
+    states forming one block) instead of accepting vs. non-accepting.
+
+    Args:
+        dfa: The DFA to minimize
+        tags: The tag of each tagged state; states absent from it are untagged
+
+    Returns:
+        The minimized DFA and the tag of each of its tagged states
+    """
+    completed = dfa.completed(_DEAD)
+    groups: Dict[Hashable, Set[State]] = defaultdict(set)
+    for state in completed._states.states():
+        groups[(state in tags, tags.get(state))].add(state)
+    partition = _refine_partition(completed, list(groups.values()))
+    added = completed._states.states() - dfa._states.states()
+    dead = next(iter(added)) if added else None
+    minimized = build_dfa_from_partition(completed, partition, dead_state=dead)
+
+    # build_dfa_from_partition names block i "q{i}".
+    block_tags = {}
+    for i, block in enumerate(partition):
+        member = next(iter(block))
+        if member in tags:
+            block_tags[State(f"q{i}")] = tags[member]
+    return minimized, block_tags
+
+
 def analyze_equivalence_classes(dfa: DFA) -> Dict[str, List[State]]:
     """
     Analyze and return the equivalence classes found during minimization.
@@ -91,7 +91,8 @@ def myhill_nerode_minimize(dfa: DFA) -> DFA:
     This algorithm uses a table-filling method to identify distinguishable
     pairs of states. Two states are equivalent if they cannot be distinguished
     by any string. Works on partial DFAs: missing transitions are treated as
-    transitions to an implicit dead state.
+    transitions to an implicit dead state. The input is trimmed first, which
+    also shrinks the quadratic table.
 
     Args:
         dfa: The DFA to minimize
@@ -99,9 +100,10 @@ def myhill_nerode_minimize(dfa: DFA) -> DFA:
     Returns:
         A minimized DFA accepting the same language
     """
-    completed, states, distinguishable = _fill_table(dfa)
+    trimmed = dfa.trim()
+    completed, states, distinguishable = _fill_table(trimmed)
     classes = _find_equivalence_classes(states, distinguishable)
-    added = completed._states.states() - dfa._states.states()
+    added = completed._states.states() - trimmed._states.states()
     dead = next(iter(added)) if added else None
     return build_dfa_from_partition(completed, classes, dead_state=dead)
 
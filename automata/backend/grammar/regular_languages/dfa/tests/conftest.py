@@ -0,0 +1,13 @@
+"""Shared fixtures for the DFA tests."""
+
+import pytest
+
+from automata.backend.grammar.regular_languages.dfa.dfa_mod import DFA
+
+
+@pytest.fixture
+def no_bb():
+    # Accepts words over {a,b} without two consecutive b's (Fibonacci counts).
+    return DFA.from_string(
+        "s,a,s;s,b,t;t,a,s", start_state="s", accept_states={"s", "t"}
+    )
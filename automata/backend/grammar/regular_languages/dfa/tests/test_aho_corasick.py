@@ -0,0 +1,78 @@
+import random
+
+from automata.backend.grammar.regular_languages.dfa.algo.aho_corasick import (
+    AhoCorasick,
+    aho_corasick_search,
+)
+from automata.backend.grammar.regular_languages.dfa.algo.kmp import kmp_search
+from automata.backend.grammar.regular_languages.dfa.dfa_mod_algo import (
+    create_dfa_from_patterns,
+    find_patterns_in_text,
+)
+
+
+def _brute_force(patterns, text):
+    return sorted(
+        (i, p)
+        for p in set(patterns)
+        for i in range(len(text) - len(p) + 1)
+        if text.startswith(p, i)
+    )
+
+
+def test_classic_example():
+    assert find_patterns_in_text(["he", "she", "his", "hers"], "ushers") == [
+        (1, "she"),
+        (2, "he"),
+        (2, "hers"),
+    ]
+
+
+def test_overlapping_and_nested_patterns():
+    patterns = ["a", "aa", "aaa", "ab", "bab"]
+    text = "aabaaabab"
+    assert sorted(aho_corasick_search(patterns, text)) == _brute_force(
+        patterns, text
+    )
+
+
+def test_random_patterns_match_brute_force():
+    rng = random.Random(1)
+    for _ in range(20):
+        patterns = [
+            "".join(rng.choice("abc") for _ in range(rng.randint(1, 4)))
+            for _ in range(rng.randint(1, 8))
+        ]
+        text = "".join(rng.choice("abcd") for _ in range(60))
+        assert sorted(find_patterns_in_text(patterns, text)) == _brute_force(
+            patterns, text
+        )
+
+
+def test_single_pattern_agrees_with_kmp():
+    text = "abababcabababcab"
+    matches = AhoCorasick(["ababc"]).search(text)
+    assert [i for i, _ in matches] == kmp_search("ababc", text)
+
+
+def test_empty_pattern_and_duplicates():
+    automaton = AhoCorasick(["a", "", "a"])
+    assert automaton.patterns == ["a", ""]
+    assert automaton.search("aa") == [(0, ""), (0, "a"), (1, ""), (1, "a"), (2, "")]
+    assert AhoCorasick([]).search("abc") == []
+
+
+def test_dfa_accepts_strings_ending_with_a_pattern():
+    alphabet = {"h", "e", "r", "s", "u"}
+    dfa = create_dfa_from_patterns(["he", "she", "hers"], alphabet)
+    assert dfa._start_state == "q0"
+    assert all(str(s).startswith("q") for s in dfa._states.states())
+    for word in ["ushe", "he", "hers", "uuhe"]:
+        assert dfa.accepts(word)
+    for word in ["", "h", "hes", "sheu", "x"]:
+        assert not dfa.accepts(word)
+    # The DFA agrees with the matcher on every prefix of a text.
+    text = "ushershehesh"
+    ends = {i + len(p) for i, p in find_patterns_in_text(["he", "she", "hers"], text)}
+    for n in range(len(text) + 1):
+        assert dfa.accepts(text[:n]) == (n in ends)
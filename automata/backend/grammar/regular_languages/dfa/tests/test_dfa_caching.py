@@ -0,0 +1,61 @@
+"""Tests for memoized derived properties on DFA and their invalidation."""
+
+from automata.backend.grammar.dist import State, Symbol
+from automata.backend.grammar.regular_languages.dfa.dfa_mod import DFA
+
+
+def _partial():
+    # Accepts exactly "ab"; partial, so completion adds a dead state.
+    return DFA.from_string("q0,a,q1;q1,b,q2", start_state="q0", accept_states={"q2"})
+
+
+def test_derived_results_are_memoized():
+    dfa = _partial()
+    assert dfa.completed() is dfa.completed()
+    assert dfa.minimized() is dfa.minimized()
+    assert dfa.compile() is dfa.compile()
+    assert dfa.shortest_accepted() == [Symbol("a"), Symbol("b")]
+    # Callers get copies of mutable results, so they cannot corrupt the cache.
+    dfa.shortest_accepted().append(Symbol("x"))
+    assert dfa.shortest_accepted() == [Symbol("a"), Symbol("b")]
+
+
+def test_add_transition_invalidates():
+    dfa = _partial()
+    completed, compiled = dfa.completed(), dfa.compile()
+    assert not dfa.compile().accepts("b")
+    version = dfa.version
+
+    dfa.add_transition(State("q0"), Symbol("b"), State("q2"))
+
+    assert dfa.version == version + 1
+    assert dfa.completed() is not completed
+    assert dfa.compile() is not compiled
+    assert dfa.compile().accepts("b")
+    assert dfa.shortest_accepted() == [Symbol("b")]
+    assert dfa.minimized().equivalent_to(dfa)
+
+
+def test_emptiness_tracks_mutation():
+    dfa = DFA.from_string("q0,a,q1", start_state="q0", accept_states={"q2"})
+    assert dfa.is_empty()
+    dfa.add_transition(State("q1"), Symbol("a"), State("q2"))
+    assert not dfa.is_empty()
+
+
+def test_reachable_states():
+    dfa = DFA.from_string(
+        "q0,a,q1;q2,a,q0", start_state="q0", accept_states={"q1"}
+    )
+    assert dfa.reachable_states() == {State("q0"), State("q1")}
+    dfa.add_transition(State("q1"), Symbol("a"), State("q2"))
+    assert dfa.reachable_states() == {State("q0"), State("q1"), State("q2")}
+
+
+def test_product_reuses_memoized_completion():
+    d1, d2 = _partial(), _partial()
+    d1.union(d2)
+    # The product completed each operand over the shared alphabet through
+    # the memoized `completed()`, so the work is reused on the next call.
+    assert ("completed", "__dead__") in d1._cache
+    assert d1.union(d2).equivalent_to(d1)
@@ -0,0 +1,82 @@
+"""Tests for canonical forms and language signatures of DFAs."""
+
+from hypothesis import given
+
+from automata.backend.grammar.dist import Alphabet, State, StateSet, Symbol
+from automata.backend.grammar.regular_languages.dfa.dfa_mod import DFA
+from automata.backend.grammar.regular_languages.nfa.nfa_mod import NFA
+from automata.backend.tests.strategies import dfas
+
+
+def test_equivalent_constructions_share_signature():
+    from_regex = NFA.from_regex("(a|b)*abb").to_dfa()
+    by_hand = DFA.from_string(
+        "0,a,1;0,b,0;1,a,1;1,b,2;2,a,1;2,b,3;3,a,1;3,b,0;"
+        "9,a,9",  # unreachable state
+        "0",
+        {"3"},
+    )
+    assert from_regex.signature() == by_hand.signature()
+    canonical = by_hand.canonical_form()
+    assert canonical._start_state == State("q0")
+    assert len(canonical._states) == 4
+    assert canonical._transitions == from_regex.canonical_form()._transitions
+
+
+def test_signature_ignores_dead_states_and_unused_symbols():
+    partial = DFA.from_string("p,a,q", "p", {"q"})
+    padded = DFA(
+        states=StateSet(["x", "y", "dead"]),
+        alphabet=Alphabet(["a", "b", "c"]),
+        transitions={
+            State("x"): {
+                Symbol("a"): State("y"),
+                Symbol("b"): State("dead"),
+                Symbol("c"): State("dead"),
+            },
+            State("y"): {s: State("dead") for s in map(Symbol, "abc")},
+            State("dead"): {s: State("dead") for s in map(Symbol, "abc")},
+        },
+        start_state=State("x"),
+        accept_states=StateSet(["y"]),
+    )
+    assert partial.signature() == padded.signature()
+    assert padded.canonical_form()._alphabet.symbols() == {Symbol("a")}
+
+
+def test_empty_languages_share_signature():
+    no_accepts = DFA.from_string("p,a,p;p,b,p", "p", set())
+    unreachable_accept = DFA.from_string("p,a,p;q,b,q", "p", {"q"})
+    assert no_accepts.signature() == unreachable_accept.signature()
+    assert no_accepts.canonical_form().is_empty()
+    assert no_accepts.signature() != DFA.from_string("p,a,p", "p", {"p"}).signature()
+
+
+def test_sink_state_is_honoured():
+    # Missing transitions go to the accepting sink `s`: the language is a*|a*b(a|b)*.
+    dfa = DFA(
+        states=StateSet(["p", "s"]),
+        alphabet=Alphabet(["a", "b"]),
+        transitions={
+            State("p"): {Symbol("a"): State("p")},
+            State("s"): {Symbol("a"): State("s"), Symbol("b"): State("s")},
+        },
+        start_state=State("p"),
+        accept_states=StateSet(["p", "s"]),
+        sink_state=State("s"),
+    )
+    assert dfa.signature() == DFA.from_string("p,a,p;p,b,p", "p", {"p"}).signature()
+
+
+@given(dfas(max_states=5), dfas(max_states=5))
+def test_signature_matches_equivalence_on_random_dfas(d1, d2):
+    assert (d1.signature() == d2.signature()) == d1.equivalent_to(d2)
+    assert d1.minimized().signature() == d1.signature()
+
+
+def test_signature_is_memoized_and_refreshed_on_mutation():
+    dfa = DFA.from_string("p,a,q", "p", {"q"})
+    first = dfa.signature()
+    assert len(first) == 64 and dfa.signature() is first
+    dfa.add_transition(State("q"), Symbol("a"), State("q"))
+    assert dfa.signature() != first
@@ -0,0 +1,148 @@
+"""Tests for the integer-compiled DFA execution engine."""
+
+import itertools
+
+from automata.backend.grammar.dist import Alphabet, State, StateSet, Symbol
+from automata.backend.grammar.regular_languages.dfa.dfa_mod import DFA
+
+
+def _ends_in_a():
+    return DFA.from_string(
+        "q0,a,q1;q0,b,q0;q1,a,q1;q1,b,q0",
+        start_state="q0",
+        accept_states={"q1"},
+    )
+
+
+def _words(max_len, symbols="ab"):
+    for length in range(max_len + 1):
+        for w in itertools.product(symbols, repeat=length):
+            yield "".join(w)
+
+
+def test_compiled_agrees_with_accepts():
+    dfa = _ends_in_a()
+    compiled = dfa.compile()
+    for w in _words(6, "abc"):
+        assert compiled.accepts(w) == dfa.accepts(w), w
+
+
+def test_partial_dfa_without_sink_rejects_missing_transitions():
+    dfa = DFA.from_string("q0,a,q1;q1,b,q2", start_state="q0", accept_states={"q2"})
+    compiled = dfa.compile()
+    assert compiled.accepts("ab")
+    assert not compiled.accepts("abb")
+    assert not compiled.accepts("b")
+    assert compiled.run("abb") is None
+    assert compiled.run("ab") == State("q2")
+
+
+def test_sink_state_receives_missing_transitions():
+    # The sink is accepting here, which only matters if missing transitions
+    # are really routed to it rather than to the internal dead row.
+    dfa = DFA(
+        states=StateSet(["q0", "sink"]),
+        alphabet=Alphabet(["a", "b"]),
+        transitions={State("q0"): {Symbol("a"): State("q0")}},
+        start_state=State("q0"),
+        accept_states=StateSet(["sink"]),
+        sink_state=State("sink"),
+    )
+    compiled = dfa.compile()
+    for w in _words(4):
+        assert compiled.accepts(w) == dfa.accepts(w), w
+    assert compiled.run("ab") == State("sink")
+
+
+def test_unknown_symbol_rejects():
+    compiled = _ends_in_a().compile()
+    assert not compiled.accepts("aza")
+    assert compiled.run("z") is None
+    assert not compiled.accepts("a\u20aca")
+    assert not compiled.accepts("a\uffff")
+    assert compiled.accepts(["b", "a"]) and not compiled.accepts(["a", "z"])
+
+
+def test_multi_character_symbols_use_column_dict():
+    dfa = DFA.from_string(
+        "q0,ab,q1;q1,c,q0", start_state="q0", accept_states={"q1"}
+    )
+    compiled = dfa.compile()
+    assert compiled._codes is None
+    assert compiled.accepts([Symbol("ab"), Symbol("c"), Symbol("ab")])
+    assert not compiled.accepts([Symbol("ab"), Symbol("ab")])
+    assert not compiled.accepts("ab")
+
+
+def test_match_prefix():
+    # Accepts a(b)* : longest accepted prefix of "abbc" is "abb".
+    dfa = DFA.from_string("q0,a,q1;q1,b,q1", start_state="q0", accept_states={"q1"})
+    compiled = dfa.compile()
+    assert compiled.match_prefix("abbc") == 3
+    assert compiled.match_prefix("abba") == 3
+    assert compiled.match_prefix("ba") is None
+    assert compiled.match_prefix("") is None
+
+    accepts_empty = DFA.from_string("q0,a,q1", start_state="q0", accept_states={"q0"})
+    assert accepts_empty.compile().match_prefix("b") == 0
+
+
+def test_interning_puts_start_first():
+    compiled = _ends_in_a().compile()
+    assert compiled.states[0] == State("q0")
+    assert compiled.symbols == (Symbol("a"), Symbol("b"))
+    assert len(compiled) == 2
+
+
+def test_accepts_many_matches_accepts():
+    dfa = DFA.from_string("q0,a,q1;q1,b,q0", start_state="q0", accept_states={"q1"})
+    batch = list(_words(5, "abz"))
+    assert dfa.accepts_many(batch) == [dfa.accepts(w) for w in batch]
+    assert dfa.accepts_many([]) == []
+    # Any iterable works, including generators of symbol lists.
+    assert dfa.accepts_many(iter([[Symbol("a")], [Symbol("b")]])) == [True, False]
+
+
+def test_byte_dfa_agrees_with_accepts():
+    dfa = _ends_in_a()
+    byte_dfa = dfa.compile_bytes()
+    for w in _words(5, "abc"):
+        data = w.encode("ascii")
+        expected = dfa.accepts(w)
+        assert byte_dfa.accepts(data) == expected, w
+        assert byte_dfa.accepts(bytearray(data)) == expected, w
+        assert byte_dfa.accepts(memoryview(data)) == expected, w
+    assert byte_dfa.run(b"ab") == State("q0")
+    assert byte_dfa.accepts_many([b"a", b"b", b"\xff"]) == [True, False, False]
+
+
+def test_byte_dfa_match_prefix_and_sink():
+    dfa = DFA(
+        states=StateSet(["q0", "q1", "sink"]),
+        alphabet=Alphabet(["a", "b"]),
+        transitions={
+            State("q0"): {Symbol("a"): State("q1")},
+            State("q1"): {Symbol("b"): State("q1")},
+        },
+        start_state=State("q0"),
+        accept_states=StateSet(["q1"]),
+        sink_state=State("sink"),
+    )
+    byte_dfa = dfa.compile_bytes()
+    assert byte_dfa.match_prefix(b"abbab") == 3
+    assert byte_dfa.run(b"aa") == State("sink")
+    # A byte outside the alphabet rejects even when a sink state exists.
+    assert byte_dfa.run(b"a?") is None
+
+
+def test_byte_dfa_scans_mmap_in_place(tmp_path):
+    import mmap
+
+    dfa = _ends_in_a()
+    path = tmp_path / "corpus.bin"
+    path.write_bytes(b"ab" * 1000 + b"a")
+    with open(path, "rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            byte_dfa = dfa.compile_bytes()
+            assert byte_dfa.accepts(mapped)
+            assert byte_dfa.match_prefix(mapped) == 2001
@@ -0,0 +1,51 @@
+"""Tests for row-displacement compressed DFA tables."""
+
+from hypothesis import given, settings, strategies as st
+
+from automata.backend.grammar.dist import Alphabet, State, StateSet, Symbol
+from automata.backend.grammar.regular_languages.dfa.dfa_mod import DFA
+from automata.backend.tests.strategies import dfas
+
+
+@settings(max_examples=60)
+@given(
+    dfas(max_states=12, alphabet="abcdef", sink=True),
+    st.lists(st.text(alphabet="abcdef", max_size=8), max_size=20),
+)
+def test_compressed_matches_accepts_on_random_dfas(dfa, words):
+    compressed = dfa.compress()
+    for word in words:
+        assert compressed.accepts(word) == dfa.accepts(word), word
+        assert compressed.run(word) == dfa.compile().run(word)
+    assert not compressed.accepts("az")
+
+
+@given(dfas(max_states=8, alphabet="abc"))
+def test_round_trip_to_dfa(dfa):
+    assert dfa.compress().to_dfa().equivalent_to(dfa)
+
+
+def test_defaults_absorb_common_targets():
+    # Every state goes to `home` on all 200 symbols except one.
+    symbols = [chr(0x100 + i) for i in range(200)]
+    transitions = {
+        State(f"s{i}"): {Symbol(a): State("home") for a in symbols}
+        for i in range(50)
+    }
+    for i in range(50):
+        transitions[State(f"s{i}")][Symbol(symbols[i])] = State(f"s{(i + 1) % 50}")
+    transitions[State("home")] = {Symbol(symbols[0]): State("s0")}
+    dfa = DFA(
+        states=StateSet([f"s{i}" for i in range(50)] + ["home"]),
+        alphabet=Alphabet(symbols),
+        transitions=transitions,
+        start_state=State("s0"),
+        accept_states=StateSet(["home"]),
+    )
+    compressed = dfa.compress()
+    assert compressed.exception_count == 51
+    # Far smaller than a dense table of 51 x 200 int32 slots.
+    assert compressed.nbytes < 51 * 200 * 4 // 10
+    assert compressed.accepts([symbols[0], symbols[5]])
+    assert not compressed.accepts([symbols[0], symbols[1]])
+    assert dfa.compress() is compressed
@@ -0,0 +1,72 @@
+"""Tests for counting accepted words by length."""
+
+from itertools import product
+
+import pytest
+
+from automata.backend.grammar.dist import State, Symbol
+from automata.backend.grammar.regular_languages.dfa.dfa_counting import WordCounter
+from automata.backend.grammar.regular_languages.dfa.dfa_mod import DFA
+
+
+def _even_as():
+    # Accepts words over {a,b} with an even number of a's.
+    return DFA.from_string(
+        "e,a,o;e,b,e;o,a,e;o,b,o", start_state="e", accept_states={"e"}
+    )
+
+
+def _brute_force(dfa, n):
+    symbols = sorted(str(a) for a in dfa._alphabet)
+    return sum(dfa.accepts(list(word)) for word in product(symbols, repeat=n))
+
+
+def test_counts_match_brute_force(no_bb):
+    for dfa in (_even_as(), no_bb):
+        series = dfa.growth_series(8)
+        assert series == [_brute_force(dfa, n) for n in range(9)]
+        assert [dfa.count_words(n) for n in range(9)] == series
+        assert dfa.count_words_upto(8) == sum(series)
+
+
+def test_fibonacci_growth(no_bb):
+    assert no_bb.growth_series(6) == [1, 2, 3, 5, 8, 13, 21]
+
+
+def test_matrix_power_agrees_with_dynamic_programming(no_bb):
+    counter = WordCounter(no_bb)
+    for n in (0, 1, 7, 50, 301):
+        assert counter._count_by_matrix(n, padded=False) == counter.series(n)[-1]
+        assert counter._count_by_matrix(n, padded=True) == sum(counter.series(n))
+
+
+def test_very_large_lengths_are_exact():
+    # Half of all 2**n words have an even number of a's.
+    n = 10**4
+    assert _even_as().count_words(n) == 2 ** (n - 1)
+    assert _even_as().count_words_upto(n) == 2**n
+
+
+def test_sink_and_useless_states():
+    # Accepts a b*; the sink and the unreachable state must not add counts.
+    dfa = DFA.from_string(
+        "q0,a,q1;q1,b,q1;q9,a,q1", start_state="q0", accept_states={"q1"}
+    )
+    assert dfa.growth_series(3) == [0, 1, 1, 1]
+
+    empty = DFA.from_string("q0,a,q1", start_state="q0", accept_states={"q2"})
+    assert empty.count_words(5) == 0
+    assert empty.growth_series(2) == [0, 0, 0]
+
+
+def test_counts_track_mutation():
+    dfa = DFA.from_string("q0,a,q1", start_state="q0", accept_states={"q1"})
+    assert dfa.count_words(1) == 1
+    dfa.add_transition(State("q1"), Symbol("a"), State("q1"))
+    assert dfa.count_words(3) == 1
+    assert dfa.count_words_upto(3) == 3
+
+
+def test_negative_length_rejected():
+    with pytest.raises(ValueError):
+        _even_as().count_words(-1)
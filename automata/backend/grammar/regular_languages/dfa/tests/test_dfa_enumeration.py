@@ -0,0 +1,52 @@
+"""Tests for lazy shortlex enumeration of accepted words."""
+
+from itertools import islice, product
+
+import pytest
+
+from automata.backend.grammar.regular_languages.dfa.dfa_mod import DFA
+
+
+def _strings(words):
+    return ["".join(word) for word in words]
+
+
+def test_shortlex_order_matches_brute_force(no_bb):
+    expected = [
+        "".join(word)
+        for n in range(5)
+        for word in product("ab", repeat=n)
+        if no_bb.accepts(list(word))
+    ]
+    assert _strings(no_bb.enumerate(max_len=4)) == expected
+    assert len(expected) == sum(no_bb.growth_series(4))
+
+
+def test_infinite_language_is_lazy(no_bb):
+    first = _strings(islice(no_bb.enumerate(), 6))
+    assert first == ["", "a", "b", "aa", "ab", "ba"]
+
+
+def test_finite_language_terminates_without_max_len():
+    dfa = DFA.from_string(
+        "q0,a,q1;q0,b,q2;q1,b,q2", start_state="q0", accept_states={"q1", "q2"}
+    )
+    assert _strings(dfa.enumerate()) == ["a", "b", "ab"]
+
+
+def test_sparse_language_skips_rejecting_branches():
+    # Accepts words over {a,c} ending in "c"; every "b" leads into a trap
+    # state that the enumeration must never expand.
+    dfa = DFA.from_string(
+        "s,a,s;s,c,f;f,a,s;f,c,f;s,b,t;t,a,t;t,b,t;t,c,t;f,b,t",
+        start_state="s",
+        accept_states={"f"},
+    )
+    assert _strings(dfa.enumerate(max_len=2)) == ["c", "ac", "cc"]
+
+
+def test_empty_language_and_bad_bound(no_bb):
+    empty = DFA.from_string("q0,a,q1", start_state="q0", accept_states={"q2"})
+    assert list(empty.enumerate()) == []
+    with pytest.raises(ValueError):
+        list(no_bb.enumerate(max_len=-1))
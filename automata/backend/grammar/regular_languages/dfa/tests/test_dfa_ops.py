@@ -2,6 +2,8 @@
 
 import itertools
 
+import pytest
+
 from automata.backend.grammar.dist import State, Symbol
 from automata.backend.grammar.regular_languages.dfa.dfa_mod import DFA
 
@@ -58,6 +60,19 @@ def test_product_works_on_partial_dfas():
     assert not u.accepts([Symbol("b")])
 
 
+def test_product_states_are_numbered_and_labeled_lazily():
+    product = _ends_in_a().intersection(_even_length())
+    assert product._start_state == State("p0")
+    assert sorted(product._states) == [f"p{i}" for i in range(len(product._states))]
+    assert product.label(State("p0")) == "(q0‖e)"
+    nested = product.union(_ends_in_a())
+    assert nested.label(nested._start_state) == "((q0‖e)‖q0)"
+    relabeled = nested.relabeled()
+    assert relabeled._start_state == "((q0‖e)‖q0)"
+    assert relabeled.equivalent_to(nested)
+    assert "((q0‖e)‖q0)" in str(nested)
+
+
 def test_shortest_accepted_and_is_empty():
     dfa = _ends_in_a()
     assert dfa.shortest_accepted() == [Symbol("a")]
@@ -101,3 +116,177 @@ def test_minimization_preserves_equivalence():
 
     dfa = _ends_in_a()
     assert hopcroft_minimize(dfa).equivalent_to(dfa)
+
+
+def test_inclusion_and_disjointness():
+    from automata.backend.grammar.regular_languages.dfa.dfa_ops import (
+        find_common_word,
+        find_inclusion_counterexample,
+    )
+
+    ends_in_a = _ends_in_a()
+    # Accepts exactly "a": a subset of "ends in a".
+    just_a = DFA.from_string("q0,a,q1", start_state="q0", accept_states={"q1"})
+    assert just_a.is_subset_of(ends_in_a)
+    assert not ends_in_a.is_subset_of(just_a)
+    assert find_inclusion_counterexample(ends_in_a, just_a) == [
+        Symbol("a"),
+        Symbol("a"),
+    ]
+
+    # Accepts exactly "b": disjoint from both.
+    just_b = DFA.from_string("q0,b,q1", start_state="q0", accept_states={"q1"})
+    assert just_b.is_disjoint_from(ends_in_a)
+    assert not just_a.is_disjoint_from(ends_in_a)
+    assert find_common_word(_even_length(), ends_in_a) == [Symbol("a"), Symbol("a")]
+
+
+def _accepting_sink():
+    # Missing transitions go to an accepting sink, so every word over {a, b}
+    # except those made only of a's is accepted: the raw dict alone accepts
+    # nothing.
+    from automata.backend.grammar.dist import Alphabet, StateSet
+
+    return DFA(
+        states=StateSet(["q0", "sink"]),
+        alphabet=Alphabet(["a", "b"]),
+        transitions={
+            State("q0"): {Symbol("a"): State("q0")},
+            State("sink"): {Symbol("a"): State("sink")},
+        },
+        start_state=State("q0"),
+        accept_states=StateSet(["sink"]),
+        sink_state=State("sink"),
+    )
+
+
+def test_complement_and_emptiness_respect_sink_state():
+    dfa = _accepting_sink()
+    assert not dfa.is_empty()
+    assert dfa.shortest_accepted() == [Symbol("b")]
+    comp = dfa.complement()
+    for w in _words(4):
+        assert comp.accepts(w) == (not dfa.accepts(w)), w
+    assert not comp.is_empty()
+    assert comp.complement().equivalent_to(dfa)
+
+    from automata.backend.grammar.regular_languages.dfa import dfa_ops
+
+    assert not dfa_ops.is_empty(dfa)
+    assert dfa_ops.is_empty(dfa.intersection(comp))
+
+
+def test_pair_search_respects_sink_state():
+    # Missing transitions go to an accepting sink, so this DFA accepts every
+    # word over {a, b}; the search must follow `accepts`, not the raw dict.
+    from automata.backend.grammar.dist import Alphabet, StateSet
+
+    everything = DFA(
+        states=StateSet(["q0", "sink"]),
+        alphabet=Alphabet(["a", "b"]),
+        transitions={State("q0"): {Symbol("a"): State("q0")}},
+        start_state=State("q0"),
+        accept_states=StateSet(["q0", "sink"]),
+        sink_state=State("sink"),
+    )
+    universal = DFA.from_string(
+        "u,a,u;u,b,u", start_state="u", accept_states={"u"}
+    )
+    assert everything.equivalent_to(universal)
+    assert universal.is_subset_of(everything)
+
+
+def _contains(symbol):
+    # Accepts words over {a,b,c} containing `symbol`.
+    others = [c for c in "abc" if c != symbol]
+    return DFA.from_string(
+        f"n,{symbol},y;n,{others[0]},n;n,{others[1]},n;"
+        "y,a,y;y,b,y;y,c,y",
+        start_state="n",
+        accept_states={"y"},
+    )
+
+
+def test_intersect_all_and_union_all():
+    from automata.backend.grammar.dist import Alphabet, StateSet
+    from automata.backend.grammar.regular_languages.dfa.dfa_ops import (
+        intersect_all,
+        intersection,
+        union,
+        union_all,
+    )
+
+    parts = [_contains("a"), _contains("b"), _contains("c")]
+    every = intersect_all(parts)
+    some = union_all(parts)
+    for w in itertools.product("abc", repeat=4):
+        w = "".join(w)
+        assert every.accepts(w) == all(p.accepts(w) for p in parts), w
+        assert some.accepts(w) == any(p.accepts(w) for p in parts), w
+    assert every.shortest_accepted() is not None
+    assert len(every.shortest_accepted()) == 3
+
+    # `sink` accepts only through its accepting sink state (here: "c").
+    sink = DFA(
+        states=StateSet(["s0", "s1"]),
+        alphabet=Alphabet(["a", "c"]),
+        transitions={
+            State("s0"): {Symbol("a"): State("s0")},
+            State("s1"): {Symbol("a"): State("s1"), Symbol("c"): State("s0")},
+        },
+        start_state=State("s0"),
+        accept_states=StateSet(["s1"]),
+        sink_state=State("s1"),
+    )
+    just_a = DFA.from_string("d,a,e", start_state="d", accept_states={"e"})
+    assert union_all([just_a, sink]).equivalent_to(union(just_a, sink))
+    assert union_all([just_a, sink]).accepts("c")
+    contains_c = _contains("c")
+    assert intersect_all([contains_c, sink]).equivalent_to(
+        intersection(contains_c, sink)
+    )
+    assert intersect_all([contains_c, sink]).accepts("c")
+
+
+def test_intersect_all_short_circuits_on_empty():
+    from automata.backend.grammar.regular_languages.dfa.dfa_ops import (
+        intersect_all,
+        union_all,
+    )
+
+    just_a = DFA.from_string("q0,a,q1", start_state="q0", accept_states={"q1"})
+    just_b = DFA.from_string("q0,b,q1", start_state="q0", accept_states={"q1"})
+    empty = intersect_all([just_a, just_b, _contains("c")])
+    assert empty.is_empty()
+    assert len(empty._states) == 1
+    assert empty._alphabet.symbols() == {"a", "b", "c"}
+
+    # Empty operands are neutral for union.
+    assert union_all([empty, just_a]).equivalent_to(just_a)
+    assert union_all([empty]).is_empty()
+
+    with pytest.raises(ValueError):
+        intersect_all([])
+
+
+def test_hopcroft_karp_equivalence():
+    from automata.backend.grammar.regular_languages.dfa.dfa_ops import hopcroft_karp
+
+    d1 = _ends_in_a()
+    d1_redundant = DFA.from_string(
+        "s,a,p;s,b,t;p,a,p;p,b,t;t,a,p;t,b,t",
+        start_state="s",
+        accept_states={"p"},
+    )
+    assert hopcroft_karp(d1, d1_redundant) is None
+
+    # Same shape, but "aa" is rejected: p no longer loops on a.
+    d2 = DFA.from_string(
+        "s,a,p;s,b,t;p,a,t;p,b,t;t,a,p;t,b,t",
+        start_state="s",
+        accept_states={"p"},
+    )
+    witness = hopcroft_karp(d1, d2)
+    assert witness is not None
+    assert d1.accepts(witness) != d2.accepts(witness)
+    assert not d1.equivalent_to(d2)
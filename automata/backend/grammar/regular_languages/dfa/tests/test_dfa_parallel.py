@@ -0,0 +1,106 @@
+"""Tests for parallel chunked DFA simulation."""
+
+import random
+
+import pytest
+
+from automata.backend.grammar.dist import State
+from automata.backend.grammar.regular_languages.dfa import dfa_parallel
+from automata.backend.grammar.regular_languages.dfa.dfa_mod import DFA
+from automata.backend.grammar.regular_languages.dfa.dfa_parallel import (
+    accepts_parallel,
+    run_parallel,
+)
+
+
+def _mod3():
+    # Accepts binary numbers divisible by 3 (a permutation DFA: no merging).
+    return DFA.from_string(
+        "r0,0,r0;r0,1,r1;r1,0,r2;r1,1,r0;r2,0,r1;r2,1,r2",
+        start_state="r0",
+        accept_states={"r0"},
+    )
+
+
+def _ends_ab():
+    # Accepts words over {a,b} ending in "ab" (synchronizes quickly).
+    return DFA.from_string(
+        "s,a,x;s,b,s;x,a,x;x,b,y;y,a,x;y,b,s", start_state="s", accept_states={"y"}
+    )
+
+
+def test_chunk_mapping_covers_every_start_state():
+    compiled = _mod3().compile()
+    width = compiled._width
+    dfa_parallel._init_worker(compiled)
+    mapping = dfa_parallel._chunk_mapping("1")
+    # Reading "1" maps r0 -> r1, r1 -> r0, r2 -> r2 and keeps the dead row.
+    ids = compiled._state_id
+    assert mapping[ids[State("r0")]] == ids[State("r1")] * width
+    assert mapping[ids[State("r1")]] == ids[State("r0")] * width
+    assert mapping[ids[State("r2")]] == ids[State("r2")] * width
+    assert mapping[compiled._dead] == compiled._dead * width
+    assert list(dfa_parallel._chunk_mapping("1x")) == [-1] * (compiled._dead + 1)
+
+
+def _last_symbol(n):
+    # n states over {0,...,n-1}; the state is the last symbol read, so every
+    # run synchronizes after one symbol.
+    transitions = ";".join(
+        f"s{p},{c},s{c}" for p in range(n) for c in range(n)
+    )
+    return DFA.from_string(transitions, start_state="s0", accept_states={"s0"})
+
+
+@pytest.mark.parametrize("states", [2, 10, 50])
+def test_chunk_work_is_linear_per_surviving_run(states):
+    rng = random.Random(states)
+    for dfa in (_last_symbol(states), _mod3()):
+        compiled = dfa.compile()
+        dfa_parallel._init_worker(compiled)
+        chunk = [rng.choice(compiled.symbols) for _ in range(20000)]
+        metrics = {}
+        mapping = dfa_parallel._chunk_mapping(chunk, metrics)
+        assert mapping[0] == compiled._walk(chunk)
+        # Runs that merge cost a short prefix; survivors cost the chunk.
+        prefix = 2 * dfa_parallel._FIRST_BLOCK * len(compiled)
+        assert metrics["steps"] <= metrics["surviving_runs"] * len(chunk) + prefix
+    assert metrics["surviving_runs"] == 3
+
+
+def test_parallel_matches_sequential():
+    rng = random.Random(0)
+    for dfa, symbols in ((_mod3(), "01"), (_ends_ab(), "ab")):
+        compiled = dfa.compile()
+        for _ in range(3):
+            word = "".join(rng.choice(symbols) for _ in range(5000))
+            assert dfa.accepts_parallel(word, workers=2, chunk_size=700) == (
+                dfa.accepts(word)
+            )
+            assert run_parallel(compiled, word, workers=2, chunk_size=700) == (
+                compiled.run(word)
+            )
+
+
+def test_rejections_stop_early():
+    dfa = DFA.from_string("q0,a,q0", start_state="q0", accept_states={"q0"})
+    word = "a" * 3000
+    assert dfa.accepts_parallel(word, workers=2, chunk_size=500)
+    assert not dfa.accepts_parallel(word + "b" + word, workers=2, chunk_size=500)
+    assert not dfa.accepts_parallel(word + "z" + word, workers=2, chunk_size=500)
+
+
+def test_byte_dfa_in_parallel():
+    compiled = _ends_ab().compile_bytes()
+    data = b"ab" * 4000
+    assert accepts_parallel(compiled, memoryview(data), workers=2, chunk_size=999)
+    assert not accepts_parallel(compiled, data + b"a", workers=2, chunk_size=999)
+
+
+def test_short_inputs_and_bad_arguments():
+    dfa = _mod3()
+    assert dfa.accepts_parallel("11") and not dfa.accepts_parallel("10")
+    with pytest.raises(ValueError):
+        dfa.accepts_parallel("11", workers=0)
+    with pytest.raises(ValueError):
+        dfa.accepts_parallel("11", workers=2, chunk_size=0)
@@ -0,0 +1,49 @@
+"""Tests for uniform random sampling of accepted words."""
+
+import random
+from collections import Counter
+
+import pytest
+
+from automata.backend.grammar.regular_languages.dfa.dfa_mod import DFA
+
+
+def test_samples_are_accepted_and_of_requested_length(no_bb):
+    words = no_bb.sample(12, k=200, rng=1)
+    assert len(words) == 200
+    assert all(len(word) == 12 and no_bb.accepts(word) for word in words)
+
+
+def test_single_draw_and_seeded_reproducibility(no_bb):
+    word = no_bb.sample(5, rng=random.Random(7))
+    assert no_bb.accepts(word) and len(word) == 5
+    assert no_bb.sample(30, k=5, rng=3) == no_bb.sample(30, k=5, rng=3)
+
+
+def test_distribution_is_uniform(no_bb):
+    # Length 4 has 8 accepted words; each should get about 1/8 of the draws.
+    draws = Counter("".join(w) for w in no_bb.sample(4, k=8000, rng=0))
+    assert len(draws) == no_bb.count_words(4) == 8
+    assert all(800 < count < 1200 for count in draws.values())
+
+
+def test_edges_with_same_target_are_weighted_separately():
+    # Both a and b lead to the accepting state: "a" and "b" are equally likely.
+    dfa = DFA.from_string("q0,a,q1;q0,b,q1", start_state="q0", accept_states={"q1"})
+    draws = Counter("".join(w) for w in dfa.sample(1, k=2000, rng=5))
+    assert set(draws) == {"a", "b"}
+    assert 850 < draws["a"] < 1150
+
+
+def test_tables_are_memoized_per_length(no_bb):
+    no_bb.sample(6, rng=0)
+    assert ("sampler", 6) in no_bb._cache
+
+
+def test_no_words_of_length():
+    dfa = DFA.from_string("q0,a,q1", start_state="q0", accept_states={"q1"})
+    assert dfa.sample(1, rng=0) == ["a"]
+    with pytest.raises(ValueError):
+        dfa.sample(2)
+    with pytest.raises(ValueError):
+        dfa.sample(1, k=-1)
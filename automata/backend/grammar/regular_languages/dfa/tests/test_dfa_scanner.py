@@ -0,0 +1,116 @@
+"""Tests for streaming, resumable DFA scanning."""
+
+import io
+import pickle
+
+import pytest
+
+from automata.backend.grammar.dist import State
+from automata.backend.grammar.regular_languages.dfa.dfa_mod import DFA
+from automata.backend.grammar.regular_languages.dfa.dfa_scanner import (
+    DFAScanner,
+    ScanCheckpoint,
+    scan_file,
+)
+
+
+def _even_as():
+    # Accepts words over {a,b} with an even number of a's.
+    return DFA.from_string(
+        "e,a,o;e,b,e;o,a,e;o,b,o", start_state="e", accept_states={"e"}
+    )
+
+
+def test_chunked_feed_matches_accepts():
+    dfa = _even_as()
+    word = "abbaab" * 50 + "a"
+    scanner = dfa.scanner()
+    for i in range(0, len(word), 7):
+        scanner.feed(word[i : i + 7])
+    assert scanner.accepted == dfa.accepts(word)
+    assert scanner.position == len(word)
+    assert scanner.state == State("o")
+
+
+def test_dead_flag_on_missing_transition_and_unknown_symbol():
+    # Accepts exactly "ab"; after "b" there is no way back.
+    dfa = DFA.from_string("q0,a,q1;q1,b,q2", start_state="q0", accept_states={"q2"})
+    scanner = dfa.scanner().feed("a")
+    assert not scanner.is_dead
+    scanner.feed("a")
+    assert scanner.is_dead
+    assert scanner.state is None
+    assert not scanner.feed("b").accepted
+
+    assert dfa.scanner().feed("az").is_dead
+
+
+def test_dead_flag_on_trap_sink_state():
+    # `t` is a real state, but no accepting state is reachable from it.
+    dfa = DFA.from_string(
+        "s,a,f;s,b,t;f,a,f;f,b,f;t,a,t;t,b,t", start_state="s", accept_states={"f"}
+    )
+    scanner = dfa.scanner().feed("b")
+    assert scanner.is_dead
+
+
+def test_checkpoint_and_resume():
+    dfa = _even_as()
+    first = dfa.scanner().feed("aab").feed("a")
+    checkpoint = pickle.loads(pickle.dumps(first.checkpoint()))
+    assert checkpoint == ScanCheckpoint(state=State("o"), position=4)
+
+    resumed = dfa.scanner(checkpoint).feed("ba")
+    assert resumed.accepted == dfa.accepts("aaba" + "ba")
+    assert resumed.position == 6
+
+
+def test_resume_rejects_foreign_state():
+    with pytest.raises(ValueError, match="not a state"):
+        _even_as().scanner(ScanCheckpoint(state=State("zz"), position=0))
+
+
+def test_scan_file_reads_in_chunks(tmp_path):
+    dfa = _even_as()
+    text = "ab" * 1000 + "a"
+    path = tmp_path / "input.txt"
+    path.write_text(text, encoding="utf-8")
+
+    scanner = dfa.scan_file(path, chunk_size=64)
+    assert scanner.position == len(text)
+    assert scanner.accepted == dfa.accepts(text)
+
+    assert dfa.scan_file(io.StringIO("aa"), chunk_size=1).accepted
+    with pytest.raises(ValueError):
+        dfa.scan_file(io.StringIO("aa"), chunk_size=0)
+
+
+def test_scan_file_stops_once_dead():
+    dfa = DFA.from_string("q0,a,q0", start_state="q0", accept_states={"q0"})
+    source = io.StringIO("aab" + "a" * 1000)
+    scanner = dfa.scan_file(source, chunk_size=4)
+    assert scanner.is_dead
+    assert scanner.position == 4
+
+
+def test_scanner_over_byte_dfa():
+    scanner = DFAScanner(_even_as().compile_bytes())
+    scanner.feed(b"ab").feed(memoryview(b"ba"))
+    assert scanner.accepted
+    assert scanner.feed(b"\x00").is_dead
+
+
+def test_scan_file_binary_with_byte_dfa(tmp_path):
+    dfa = _even_as()
+    data = b"ab" * 1000 + b"a"
+    path = tmp_path / "input.bin"
+    path.write_bytes(data)
+
+    scanner = scan_file(DFAScanner(dfa.compile_bytes()), path, chunk_size=64)
+    assert scanner.is_binary
+    assert scanner.position == len(data)
+    assert scanner.accepted == dfa.accepts(data.decode("latin-1"))
+
+    assert dfa.scan_file(path, chunk_size=64, binary=True).accepted == scanner.accepted
+    assert dfa.scan_file(io.BytesIO(b"aa"), chunk_size=1, binary=True).accepted
+    assert dfa.scan_file(io.BytesIO(b"a\xffa"), binary=True).is_dead
@@ -12,6 +12,7 @@ from automata.backend.grammar.regular_languages.dfa.dfa_mod import DFA
 from automata.backend.grammar.regular_languages.dfa.minimization.hopcroft import (
     analyze_equivalence_classes,
     hopcroft_minimize,
+    hopcroft_minimize_tagged,
 )
 from automata.backend.grammar.regular_languages.dfa.minimization.myhill_nerode import (
     analyze_state_equivalences,
@@ -106,3 +107,18 @@ def test_completed_is_total_and_equivalent():
         assert completed.accepts(word) == dfa.accepts(word), word
     # Already-complete DFAs are returned unchanged.
     assert completed.completed() is completed
+
+
+def test_tagged_minimization_keeps_tags_apart():
+    # a -> x, b -> y: x and y are both accepting sinks, equivalent untagged.
+    dfa = DFA.from_string("s,a,x;s,b,y", start_state="s", accept_states={"x", "y"})
+    assert len(hopcroft_minimize(dfa)._states.states()) == 2
+
+    minimized, tags = hopcroft_minimize_tagged(dfa, {"x": "X", "y": "Y"})
+    assert len(minimized._states.states()) == 3
+    assert sorted(tags.values()) == ["X", "Y"]
+    assert set(tags) == minimized._accept_states.states()
+
+    merged, tags = hopcroft_minimize_tagged(dfa, {"x": "Z", "y": "Z"})
+    assert len(merged._states.states()) == 2
+    assert list(tags.values()) == ["Z"]
@@ -0,0 +1,98 @@
+"""Round-trip tests for the binary DFA/NFA file formats."""
+
+import itertools
+
+import pytest
+
+from automata.backend.grammar.dist import Alphabet, State, StateSet, Symbol
+from automata.backend.grammar.regular_languages.dfa.dfa_mod import DFA
+from automata.backend.grammar.regular_languages.nfa.nfa_mod import NFA
+
+
+def _words(max_len, symbols="ab"):
+    for length in range(max_len + 1):
+        for w in itertools.product(symbols, repeat=length):
+            yield "".join(w)
+
+
+def _partial_with_extras():
+    # "orphan" is declared but unused, "ghost" is an undeclared target,
+    # q2 has an empty row, and missing transitions go to the sink.
+    return DFA(
+        states=StateSet(["q0", "q1", "q2", "orphan", "sink"]),
+        alphabet=Alphabet(["a", "b", "ü"]),
+        transitions={
+            State("q0"): {Symbol("a"): State("q1"), Symbol("ü"): State("ghost")},
+            State("q1"): {Symbol("b"): State("q0")},
+            State("q2"): {},
+        },
+        start_state=State("q0"),
+        accept_states=StateSet(["q1"]),
+        sink_state=State("sink"),
+    )
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_dfa_round_trip_is_exact(tmp_path, use_mmap):
+    dfa = _partial_with_extras()
+    path = tmp_path / "dfa.bin"
+    dfa.save(path)
+    loaded = DFA.load(path, mmap=use_mmap)
+
+    assert loaded._states.states() == dfa._states.states()
+    assert loaded._alphabet.symbols() == dfa._alphabet.symbols()
+    assert loaded._accept_states.states() == dfa._accept_states.states()
+    assert loaded._start_state == dfa._start_state
+    assert loaded._sink_state == dfa._sink_state
+    assert dict(loaded._transitions.items()) == dfa._transitions
+    assert State("q2") in loaded._transitions
+    assert State("sink") not in loaded._transitions
+    for w in _words(4, "abü"):
+        assert loaded.accepts(w) == dfa.accepts(w), w
+
+
+def test_loaded_dfa_supports_mutation(tmp_path):
+    path = tmp_path / "dfa.bin"
+    DFA.from_string("q0,a,q1", start_state="q0", accept_states={"q1"}).save(path)
+    loaded = DFA.load(path)
+    assert not loaded.accepts("aa")
+    loaded.add_transition(State("q1"), Symbol("a"), State("q1"))
+    assert loaded.accepts("aa")
+    assert loaded.minimized().equivalent_to(loaded)
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_nfa_round_trip_is_exact(tmp_path, use_mmap):
+    nfa = NFA.from_regex("(a|b)*abb")
+    # An empty target set and an undeclared state must survive too.
+    nfa.transitions[State("extra")] = {Symbol("a"): StateSet([])}
+    path = tmp_path / "nfa.bin"
+    nfa.save(path)
+    loaded = NFA.load(path, mmap=use_mmap)
+
+    assert loaded._states.states() == nfa._states.states()
+    assert loaded._alphabet.symbols() == nfa._alphabet.symbols()
+    assert loaded._accept_states.states() == nfa._accept_states.states()
+    assert loaded._start_state == nfa._start_state
+    assert loaded.epsilon_symbol == nfa.epsilon_symbol
+    assert {
+        s: {sym: t.states() for sym, t in row.items()}
+        for s, row in loaded.transitions.items()
+    } == {
+        s: {sym: t.states() for sym, t in row.items()}
+        for s, row in nfa.transitions.items()
+    }
+    for w in _words(5):
+        assert loaded.accepts(w) == nfa.accepts(w), w
+
+
+def test_bad_files_are_rejected(tmp_path):
+    path = tmp_path / "bad.bin"
+    path.write_bytes(b"nope")
+    with pytest.raises(ValueError):
+        DFA.load(path)
+
+    dfa_path = tmp_path / "dfa.bin"
+    DFA.from_string("q0,a,q1", start_state="q0", accept_states={"q1"}).save(dfa_path)
+    with pytest.raises(ValueError, match="ANFA"):
+        NFA.load(dfa_path)
@@ -0,0 +1,252 @@
+"""
+Lexer generator: many token regexes, one prioritized longest-match DFA.
+
+Given an ordered list of (token name, regex) rules, `Lexer` builds a single
+automaton that recognizes every token kind at once:
+
+1. each regex goes through `regex_to_nfa` (states renamed apart), and a new
+   start state joins them with ε-edges; each rule's accept state is tagged
+   with the rule's index;
+2. the subset construction gives every DFA state the tag of the *earliest*
+   rule among its NFA accept states, which is how priority ties are broken;
+3. Hopcroft minimization starts from the partition by tag, so states of
+   different token kinds are never merged (`hopcroft_minimize_tagged`);
+4. the result is compiled to the integer table of `CompiledDFA`.
+
+`tokenize` then runs maximal munch over that table: from the current
+position it follows the DFA until no accepting state is reachable any more,
+and emits the longest token seen on the way (the earliest rule on ties). A
+whole text is tokenized in one pass over the combined DFA instead of one
+pass per rule.
+
+`tokenize` also accepts an iterable of text chunks (e.g. an open file); a
+token that straddles a chunk boundary is completed once more input arrives.
+"""
+
+from dataclasses import dataclass
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from automata.backend.grammar.dist import Alphabet, State, StateSet, Symbol
+from automata.backend.grammar.regular_languages.dfa.dfa_mod import DFA
+from automata.backend.grammar.regular_languages.dfa.dfa_scanner import _live_offsets
+from automata.backend.grammar.regular_languages.dfa.minimization.hopcroft import (
+    hopcroft_minimize_tagged,
+)
+from automata.backend.grammar.regular_languages.nfa.algo.nfa_bfs import (
+    closure_of,
+    epsilon_closures,
+)
+from automata.backend.grammar.regular_languages.regex_to_nfa import EPSILON, regex_to_nfa
+
+
+@dataclass(frozen=True)
+class Token:
+    """A token: its rule name, the matched text, and its start offset."""
+
+    kind: str
+    text: str
+    start: int
+
+    @property
+    def end(self) -> int:
+        return self.start + len(self.text)
+
+
+class LexerError(ValueError):
+    """Raised when no rule matches at some position of the input."""
+
+    def __init__(self, message: str, position: int):
+        super().__init__(message)
+        self.position = position
+
+
+def _tagged_subset_construction(
+    transitions: Dict[State, Dict[Symbol, Set[State]]],
+    start: State,
+    rule_of: Dict[State, int],
+    symbols: List[Symbol],
+) -> Tuple[DFA, Dict[State, int]]:
+    """
+    Determinize the union NFA. A DFA state is tagged with the smallest rule
+    index among the NFA accept states it contains.
+    """
+    closures = epsilon_closures(transitions, EPSILON)
+
+    def closure(states: Set[State]) -> FrozenSet[State]:
+        return frozenset(closure_of(states, closures))
+
+    first = closure({start})
+    ids: Dict[FrozenSet[State], State] = {first: State("d0")}
+    order = [first]
+    dfa_transitions: Dict[State, Dict[Symbol, State]] = {}
+    tags: Dict[State, int] = {}
+    for subset in order:
+        name = ids[subset]
+        rules = [rule_of[s] for s in subset if s in rule_of]
+        if rules:
+            tags[name] = min(rules)
+        row = {}
+        for symbol in symbols:
+            targets: Set[State] = set()
+            for s in subset:
+                targets.update(transitions.get(s, {}).get(symbol, ()))
+            if not targets:
+                continue
+            target = closure(targets)
+            if target not in ids:
+                ids[target] = State(f"d{len(order)}")
+                order.append(target)
+            row[symbol] = ids[target]
+        dfa_transitions[name] = row
+
+    dfa = DFA(
+        states=StateSet.from_states(set(ids.values())),
+        alphabet=Alphabet(symbols),
+        transitions=dfa_transitions,
+        start_state=State("d0"),
+        accept_states=StateSet.from_states(set(tags)),
+    )
+    return dfa, tags
+
+
+class Lexer:
+    """
+    A tokenizer for an ordered list of (token name, regex) rules.
+
+    Args:
+        rules: The rules; on equal-length matches the earlier rule wins.
+        alphabet: Extra symbols for `.` wildcards, as in `regex_to_nfa`.
+        skip: Token names to match but not emit (e.g. whitespace).
+
+    Raises:
+        ValueError: If there are no rules, or a rule matches the empty string
+            (maximal munch could then make no progress).
+        RegexSyntaxError: If a rule's regex cannot be parsed.
+    """
+
+    def __init__(
+        self,
+        rules: Sequence[Tuple[str, str]],
+        alphabet: Optional[Iterable[str]] = None,
+        skip: Iterable[str] = (),
+    ):
+        if not rules:
+            raise ValueError("A lexer needs at least one rule")
+        self.rules: List[Tuple[str, str]] = list(rules)
+        self.skip = frozenset(skip)
+
+        nfas = [regex_to_nfa(regex, alphabet) for _, regex in self.rules]
+        symbols = sorted(
+            {symbol for nfa in nfas for symbol in nfa._alphabet.symbols()}
+        )
+        start = State("start")
+        transitions: Dict[State, Dict[Symbol, Set[State]]] = {
+            start: {EPSILON: set()}
+        }
+        rule_of: Dict[State, int] = {}
+        for index, nfa in enumerate(nfas):
+            def rename(state: State, index=index) -> State:
+                return State(f"r{index}.{state}")
+
+            transitions[start][EPSILON].add(rename(nfa._start_state))
+            for source, row in nfa.transitions.items():
+                transitions[rename(source)] = {
+                    symbol: {rename(t) for t in targets.states()}
+                    for symbol, targets in row.items()
+                }
+            for accept in nfa._accept_states.states():
+                rule_of[rename(accept)] = index
+
+        dfa, tags = _tagged_subset_construction(transitions, start, rule_of, symbols)
+        if dfa._start_state in tags:
+            name, regex = self.rules[tags[dfa._start_state]]
+            raise ValueError(
+                f"Rule {name!r} ({regex!r}) matches the empty string"
+            )
+        self.dfa, self._rule_at = hopcroft_minimize_tagged(dfa, tags)
+
+        compiled = self.dfa.compile()
+        width = compiled._width
+        self._compiled = compiled
+        self._live = _live_offsets(compiled)
+        # Row offset -> token name, for the tagged (accepting) rows.
+        self._kind_at: Dict[int, str] = {
+            compiled._state_id[state] * width: self.rules[rule][0]
+            for state, rule in self._rule_at.items()
+        }
+
+    def token_kind(self, state: State) -> Optional[str]:
+        """The token name an accepting state of `self.dfa` stands for."""
+        rule = self._rule_at.get(state)
+        return None if rule is None else self.rules[rule][0]
+
+    def _scan(
+        self, text: str, base: int, final: bool, out: List[Token]
+    ) -> int:
+        """
+        Append the tokens of `text` (which begins at offset `base` of the
+        input) to `out`. Returns the index where scanning stopped: the end of
+        `text`, or with `final` unset, the start of a token that may continue
+        into the next chunk.
+        """
+        table, column = self._compiled._table, self._compiled._symbol_column
+        live, kind_at, skip = self._live, self._kind_at, self.skip
+        position, length = 0, len(text)
+        while position < length:
+            offset, index = 0, position
+            last_end, last_kind = -1, None
+            while index < length:
+                col = column.get(text[index])
+                if col is None:
+                    break
+                offset = table[offset + col]
+                if offset not in live:
+                    break
+                index += 1
+                kind = kind_at.get(offset)
+                if kind is not None:
+                    last_end, last_kind = index, kind
+            else:
+                if not final:
+                    return position  # the token may go on in the next chunk
+            if last_kind is None:
+                raise LexerError(
+                    f"No token matches at position {base + position}: "
+                    f"{text[position : position + 20]!r}",
+                    base + position,
+                )
+            if last_kind not in skip:
+                out.append(Token(last_kind, text[position:last_end], base + position))
+            position = last_end
+        return position
+
+    def tokenize(self, source: Union[str, Iterable[str]]) -> Iterator[Token]:
+        """
+        Yield the tokens of `source` — a string, or an iterable of string
+        chunks such as an open text file — by maximal munch.
+
+        Raises:
+            LexerError: If no rule matches at some position.
+        """
+        chunks = [source] if isinstance(source, str) else source
+        pending, base = "", 0
+        for chunk in chunks:
+            pending += chunk
+            tokens: List[Token] = []
+            consumed = self._scan(pending, base, False, tokens)
+            yield from tokens
+            pending, base = pending[consumed:], base + consumed
+        tokens = []
+        self._scan(pending, base, True, tokens)
+        yield from tokens
@@ -1,6 +1,16 @@
 from collections import deque
-from typing import Dict, MutableMapping, Optional, Set, Union
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Set,
+    Union,
+)
 from automata.backend.grammar.dist import State, Symbol, Word, StateSet
+from automata.backend.grammar.scc import strongly_connected_components
 
 
 def epsilon_closure(
@@ -27,6 +37,55 @@ def epsilon_closure(
     return closure
 
 
+def epsilon_closures(
+    transitions: Dict[State, Dict[Symbol, Set[State]]],
+    epsilon_symbol: Symbol,
+) -> Dict[State, FrozenSet[State]]:
+    """
+    Compute the ε-closure of every single state at once.
+
+    The ε-graph is condensed into its strongly connected components, which
+    Tarjan's algorithm yields successors first: the closure of a component is
+    its members plus the closures of the components its ε-edges lead to, and
+    all members of a component share one frozenset. Every ε-edge is followed
+    once, however the ε-cycles are arranged.
+
+    States without ε-edges in or out are omitted (their closure is just
+    themselves); `closure_of` handles both.
+    """
+    successors: Dict[State, Set[State]] = {
+        state: row[epsilon_symbol]
+        for state, row in transitions.items()
+        if row.get(epsilon_symbol)
+    }
+    closures: Dict[State, FrozenSet[State]] = {}
+    for component in strongly_connected_components(list(successors), successors):
+        members = set(component)
+        closure = set(members)
+        for state in component:
+            for target in successors.get(state, ()):
+                if target not in members:
+                    closure |= closures[target]
+        frozen = frozenset(closure)
+        for state in component:
+            closures[state] = frozen
+    return closures
+
+
+def closure_of(
+    states: Iterable[State], closures: Mapping[State, FrozenSet[State]]
+) -> Set[State]:
+    """The ε-closure of a set of states: the union of their cached closures."""
+    result: Set[State] = set()
+    for state in states:
+        closure = closures.get(state)
+        if closure is None:
+            result.add(state)
+        else:
+            result |= closure
+    return result
+
+
 def nfa_accept_bfs(
     transitions: Dict[State, Dict[Symbol, StateSet]],
     start_state: State,
@@ -34,10 +93,17 @@ def nfa_accept_bfs(
     input_string: Word,
     epsilon_symbol: Symbol,
     metrics: Optional[MutableMapping[str, Union[int, bool]]] = None,
+    closures: Optional[Mapping[State, FrozenSet[State]]] = None,
 ) -> bool:
     """
     BFS-based NFA acceptance check.
     Returns True if the NFA described by 'transitions' can accept 'input_string'.
+
+    Frontiers are ε-closed by searching the ε-edges out of them, or, when
+    a `closures` table is given (see `epsilon_closures`;
+    `NFA.epsilon_closures()` caches one), by unioning its single-state
+    closures. `epsilon_edges_traversed` counts the ε-edges this call
+    followed, so it stays 0 with a table.
     """
     # 1. Start with ε-closure of {start_state}
     transition_lookups = 0
@@ -49,6 +115,8 @@ def nfa_accept_bfs(
     def closure_with_metrics(states: Set[State]) -> Set[State]:
         nonlocal epsilon_closure_calls, epsilon_edges_traversed
         epsilon_closure_calls += 1
+        if closures is not None:
+            return closure_of(states, closures)
         stack = deque(list(states))
         closure = set(states)
         while stack:
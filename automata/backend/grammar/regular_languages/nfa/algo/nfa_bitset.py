@@ -0,0 +1,153 @@
+"""
+Bit-parallel NFA simulation: state sets as integer bit masks.
+
+States are numbered 0..n-1 (the start state is 0) and a set of states is a
+Python int whose bit i stands for state i. Python ints are arbitrary
+precision, so one int holds the frontier of an NFA of any size, and
+union / intersection are single `|` / `&` operations.
+
+Precomputed once per NFA:
+
+- `closure[i]`: the ε-closure of state i, as a mask (from the NFA's
+  cached closure table, `NFA.epsilon_closures`);
+- for each symbol a, `step_a[i]`: the ε-closed set of states reachable from
+  state i on a, i.e. the union of `closure[t]` for each a-successor t, and
+  `movers_a`: the mask of states that have an a-transition at all.
+
+Advancing a frontier F on a is then the union of `step_a[i]` over the bits
+of `F & movers_a`. The union is taken a byte of F at a time: the union for
+each (symbol, byte position, byte value) is computed on first use and
+memoized, so a step costs one table lookup per non-zero byte of the frontier
+instead of one per state, and the tables grow only with the inputs actually
+seen.
+"""
+
+from typing import Dict, List, Optional, Set
+
+from automata.backend.grammar.dist import State, Symbol, Word
+
+
+class BitParallelNFA:
+    """
+    An NFA compiled to integer bit masks. Build it with `NFA.bit_parallel()`.
+
+    The NFA's transitions are snapshotted at construction.
+    """
+
+    def __init__(self, nfa):
+        named = set(nfa._states.states()) | nfa.transitions.keys()
+        for row in nfa.transitions.values():
+            for targets in row.values():
+                named.update(targets)
+        named.discard(nfa._start_state)
+        self.states: List[State] = [nfa._start_state, *sorted(named)]
+        index: Dict[State, int] = {s: i for i, s in enumerate(self.states)}
+        self._index = index
+        epsilon = nfa.epsilon_symbol
+
+        # States of one ε-SCC share a closure frozenset: convert each once.
+        closures = nfa.epsilon_closures()
+        masks: Dict[int, int] = {}
+        self.closure: List[int] = [0] * len(self.states)
+        for i, state in enumerate(self.states):
+            members = closures.get(state)
+            if members is None:
+                self.closure[i] = 1 << i
+                continue
+            mask = masks.get(id(members))
+            if mask is None:
+                mask = masks[id(members)] = self.mask_of(members)
+            self.closure[i] = mask
+
+        # symbol -> {state id -> ε-closed successor mask}
+        self._step: Dict[Symbol, Dict[int, int]] = {}
+        self._movers: Dict[Symbol, int] = {}
+        for source, row in nfa.transitions.items():
+            i = index[source]
+            for symbol, targets in row.items():
+                if symbol == epsilon or not targets:
+                    continue
+                mask = 0
+                for target in targets:
+                    mask |= self.closure[index[target]]
+                per_symbol = self._step.setdefault(symbol, {})
+                per_symbol[i] = per_symbol.get(i, 0) | mask
+                self._movers[symbol] = self._movers.get(symbol, 0) | (1 << i)
+
+        self.start: int = self.closure[0]
+        self.accepting: int = 0
+        for state in nfa._accept_states.states():
+            if state in index:
+                self.accepting |= 1 << index[state]
+        # symbol -> byte position -> {byte value -> union of step masks}
+        self._chunks: Dict[Symbol, List[Dict[int, int]]] = {}
+        self._width = (len(self.states) + 7) // 8
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def mask_of(self, states) -> int:
+        """The bit mask of a collection of states (unknown states are ignored)."""
+        mask = 0
+        for state in states:
+            i = self._index.get(state)
+            if i is not None:
+                mask |= 1 << i
+        return mask
+
+    def states_of(self, mask: int) -> Set[State]:
+        """The states whose bits are set in `mask`."""
+        found = set()
+        while mask:
+            low = mask & -mask
+            found.add(self.states[low.bit_length() - 1])
+            mask ^= low
+        return found
+
+    def _chunk_union(self, symbol: Symbol, position: int, byte: int) -> int:
+        """The union of step masks for the states in one byte of a frontier."""
+        step = self._step[symbol]
+        base = position * 8
+        mask = 0
+        for bit in range(8):
+            if byte >> bit & 1:
+                mask |= step.get(base + bit, 0)
+        return mask
+
+    def step(self, frontier: int, symbol: Symbol) -> int:
+        """The ε-closed set of states reached from `frontier` on `symbol`."""
+        movers = self._movers.get(symbol)
+        if movers is None:
+            return 0
+        active = frontier & movers
+        if not active:
+            return 0
+        chunks = self._chunks.get(symbol)
+        if chunks is None:
+            chunks = self._chunks[symbol] = [{} for _ in range(self._width)]
+        result = 0
+        for position, byte in enumerate(active.to_bytes(self._width, "little")):
+            if byte:
+                table = chunks[position]
+                mask = table.get(byte)
+                if mask is None:
+                    mask = table[byte] = self._chunk_union(symbol, position, byte)
+                result |= mask
+        return result
+
+    def run(self, word: Word, frontier: Optional[int] = None) -> int:
+        """
+        Return the mask of states reached on `word`, from `frontier` (by
+        default the start state's ε-closure). Stops early once it is empty.
+        """
+        current = self.start if frontier is None else frontier
+        step = self.step
+        for symbol in word:
+            current = step(current, symbol)
+            if not current:
+                break
+        return current
+
+    def accepts(self, word: Word) -> bool:
+        """Return True if the NFA accepts `word`."""
+        return bool(self.run(word) & self.accepting)
@@ -0,0 +1,85 @@
+"""
+ε-elimination: an equivalent NFA without ε-transitions.
+
+For every state p, the new NFA gives p the symbol transitions of each state
+in p's ε-closure, i.e.
+
+    δ'(p, a) = ⋃ { δ(q, a) : q ∈ closure(p) }
+
+and makes p accepting if its closure contains an accepting state. The start
+state is unchanged and no state is added, so the result never has more
+states than the original. The closures come from the NFA's cached table
+(`NFA.epsilon_closures`).
+
+States that were only entered through ε-edges are no longer entered at all;
+with `prune=True` (the default) everything unreachable from the start state
+is dropped. On the result, ε-closures are trivial, so simulation and subset
+construction only follow symbol transitions.
+"""
+
+from typing import Dict, Set
+
+from automata.backend.grammar.dist import State, StateSet, Symbol
+
+
+def remove_epsilons(nfa, prune: bool = True):
+    """
+    Return an equivalent NFA without ε-transitions. With `prune`, states not
+    reachable from the start state are removed. Returns `nfa` itself if it
+    has no ε-transitions and nothing is pruned.
+    """
+    epsilon = nfa.epsilon_symbol
+    closures = nfa.epsilon_closures()
+    accepting = nfa._accept_states.states()
+
+    states: Set[State] = nfa._states.states() | nfa.transitions.keys()
+    for row in nfa.transitions.values():
+        for targets in row.values():
+            states.update(targets)
+
+    if prune:
+        keep = {nfa._start_state}
+        stack = [nfa._start_state]
+    else:
+        keep = set(states)
+        stack = list(states)
+
+    transitions: Dict[State, Dict[Symbol, Set[State]]] = {}
+    new_accepting: Set[State] = set()
+    while stack:
+        state = stack.pop()
+        closure = closures.get(state, (state,))
+        if not accepting.isdisjoint(closure):
+            new_accepting.add(state)
+        row: Dict[Symbol, Set[State]] = {}
+        for member in closure:
+            for symbol, targets in nfa.transitions.get(member, {}).items():
+                if symbol != epsilon and targets:
+                    row.setdefault(symbol, set()).update(targets)
+        if not row:
+            continue
+        transitions[state] = row
+        if prune:
+            for targets in row.values():
+                for target in targets:
+                    if target not in keep:
+                        keep.add(target)
+                        stack.append(target)
+
+    if not closures and keep == states:
+        return nfa
+
+    return type(nfa)(
+        states=StateSet.from_states(keep),
+        alphabet=nfa._alphabet,
+        transitions={
+            state: {
+                symbol: StateSet.from_states(targets)
+                for symbol, targets in row.items()
+            }
+            for state, row in transitions.items()
+        },
+        start_state=nfa._start_state,
+        accept_states=StateSet.from_states(new_accepting),
+        epsilon_symbol=epsilon,
+    )
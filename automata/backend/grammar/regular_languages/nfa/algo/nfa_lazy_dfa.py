@@ -0,0 +1,107 @@
+"""
+Lazy DFA: subset construction on the fly, with a bounded cache.
+
+`nfa_to_dfa` builds every reachable subset of NFA states up front, which can
+take exponential time and memory; `nfa_accept_bfs` builds none and redoes the
+successor and ε-closure computation for every symbol of every word. A
+`LazyDFA` sits in between:
+
+- a DFA state (an ε-closed set of NFA states, held as the integer bit mask
+  of `BitParallelNFA`) is created only when an input actually reaches it,
+  and its transitions are filled in one symbol at a time, as they are first
+  taken by a bit-parallel step;
+- states live in an LRU cache of at most `max_states` entries. Matching the
+  same NFA again mostly follows cached transitions, i.e. runs at DFA speed;
+- if the cache thrashes (it is full and most steps of a word still have to
+  compute their successor), the rest of that word is run as a plain set
+  simulation without caching, so a pathological input cannot churn the
+  cache forever.
+
+Memory stays bounded by `max_states` rows whatever the NFA and the input.
+The NFA's transitions are snapshotted (by `NFA.bit_parallel`) when the lazy
+DFA is built.
+"""
+
+import itertools
+from collections import OrderedDict
+from typing import Dict, FrozenSet
+
+from automata.backend.grammar.dist import State, Symbol, Word
+
+DEFAULT_MAX_STATES = 10_000
+
+
+class LazyDFA:
+    """
+    An NFA matcher that determinizes lazily into a bounded LRU cache.
+
+    Attributes:
+        max_states: Capacity of the cache, in DFA states.
+        hits / misses: Transitions taken from the cache / computed.
+        evictions: DFA states dropped from the cache.
+        fallbacks: Words (or word tails) run by set simulation.
+    """
+
+    def __init__(self, nfa, max_states: int = DEFAULT_MAX_STATES):
+        if max_states < 1:
+            raise ValueError(f"max_states must be positive, got {max_states}")
+        self.max_states = max_states
+        self._bits = nfa.bit_parallel()
+        # DFA state -> its transitions computed so far (symbol -> DFA state).
+        self._cache: "OrderedDict[int, Dict[Symbol, int]]" = OrderedDict()
+        self.hits = self.misses = self.evictions = self.fallbacks = 0
+
+    def __len__(self) -> int:
+        """The number of DFA states currently cached."""
+        return len(self._cache)
+
+    def clear(self) -> None:
+        """Drop every cached DFA state."""
+        self._cache.clear()
+
+    def run(self, word: Word) -> FrozenSet[State]:
+        """Return the set of NFA states reached on `word` (empty if none)."""
+        return frozenset(self._bits.states_of(self._run(word)))
+
+    def _run(self, word: Word) -> int:
+        """Return the bit mask of the NFA states reached on `word`."""
+        cache, max_states, step = self._cache, self.max_states, self._bits.step
+        current = self._bits.start
+        steps = computed = evicted = 0
+        symbols = iter(word)
+        for symbol in symbols:
+            row = cache.get(current)
+            if row is None:
+                row = cache[current] = {}
+                if len(cache) > max_states:
+                    cache.popitem(last=False)
+                    evicted += 1
+                    # The whole cache turned over during this word and most
+                    # steps missed: finish the word without caching.
+                    if evicted >= max_states and computed * 2 > steps:
+                        self._record(steps, computed, evicted)
+                        self.fallbacks += 1
+                        return self._bits.run(
+                            itertools.chain([symbol], symbols), current
+                        )
+            else:
+                cache.move_to_end(current)
+            steps += 1
+            target = row.get(symbol)
+            if target is None:
+                target = row[symbol] = step(current, symbol)
+                computed += 1
+            current = target
+            if not current:
+                break
+        self._record(steps, computed, evicted)
+        return current
+
+    def _record(self, steps: int, computed: int, evicted: int) -> None:
+        self.hits += steps - computed
+        self.misses += computed
+        self.evictions += evicted
+
+    def accepts(self, word: Word) -> bool:
+        """Return True if the NFA accepts `word`."""
+        return bool(self._run(word) & self._bits.accepting)
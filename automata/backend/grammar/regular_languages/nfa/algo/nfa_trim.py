@@ -0,0 +1,58 @@
+"""
+Trimming NFAs: dropping the states no accepting run can pass through.
+
+The transition graph (ε-edges included) is analyzed with
+`automata.backend.grammar.scc.StateAnalysis`; only the useful states, those
+both reachable from the start and able to reach an accepting state, are
+kept. Subset construction over a trimmed NFA never builds subsets that
+carry dead NFA states along, so it produces fewer and smaller DFA states.
+"""
+
+from typing import Dict, Set
+
+from automata.backend.grammar.dist import State, StateSet, Symbol
+from automata.backend.grammar.scc import StateAnalysis
+
+
+def state_analysis(nfa) -> StateAnalysis:
+    """Classify the NFA's states into reachable, live, useful and trap states."""
+    successors: Dict[State, Set[State]] = {
+        state: {target for targets in row.values() for target in targets.states()}
+        for state, row in nfa.transitions.items()
+    }
+    return StateAnalysis(
+        nfa._states.states(),
+        nfa._start_state,
+        nfa._accept_states.states(),
+        successors,
+    )
+
+
+def trim(nfa):
+    """
+    Return an equivalent NFA with only the useful states, plus the start
+    state. Returns `nfa` itself if every state is already useful.
+    """
+    analysis = state_analysis(nfa)
+    keep = analysis.useful | {nfa._start_state}
+    if keep >= nfa._states.states() | nfa.transitions.keys():
+        return nfa
+
+    transitions: Dict[State, Dict[Symbol, StateSet]] = {}
+    for state in keep:
+        row = {}
+        for symbol, targets in nfa.transitions.get(state, {}).items():
+            kept = targets.states() & keep
+            if kept:
+                row[symbol] = StateSet.from_states(kept)
+        if row:
+            transitions[state] = row
+
+    return type(nfa)(
+        states=StateSet.from_states(keep),
+        alphabet=nfa._alphabet,
+        transitions=transitions,
+        start_state=nfa._start_state,
+        accept_states=StateSet.from_states(nfa._accept_states.states() & keep),
+        epsilon_symbol=nfa.epsilon_symbol,
+    )
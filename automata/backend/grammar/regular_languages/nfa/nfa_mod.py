@@ -1,10 +1,72 @@
-from typing import Dict, Set
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, Optional, Set
 from automata.backend.grammar.dist import Alphabet, StateSet, State, Symbol, Word
 from automata.backend.grammar.automaton_base import Automaton
 from .algo import nfa_bfs
 from automata.backend.grammar.regular_languages.dfa.dfa_mod import DFA
 from collections import defaultdict
 
+if TYPE_CHECKING:
+    from .algo.nfa_bitset import BitParallelNFA
+    from .algo.nfa_lazy_dfa import LazyDFA
+
+
+class _WatchedDict(dict):
+    """
+    A dict that reports in-place edits: every stored value goes through
+    `adopt` (which may wrap or watch it), and every edit calls `touch`.
+    Copies and pickles are plain dicts.
+    """
+
+    __slots__ = ("_adopt", "_touch")
+
+    def __init__(
+        self,
+        adopt: Callable[[Any], Any],
+        touch: Callable[[], None],
+        items: Dict,
+    ):
+        super().__init__((key, adopt(value)) for key, value in items.items())
+        self._adopt = adopt
+        self._touch = touch
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, self._adopt(value))
+        self._touch()
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._touch()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def pop(self, *args):
+        if args[0] in self:
+            self._touch()
+        return super().pop(*args)
+
+    def popitem(self):
+        item = super().popitem()
+        self._touch()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._touch()
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
 
 class NFA(Automaton[State]):
     def __init__(
@@ -17,8 +79,18 @@ class NFA(Automaton[State]):
         epsilon_symbol: Symbol = Symbol("ε"),
     ):
         super().__init__(states, alphabet, start_state, accept_states)
-        self.transitions = transitions
-        self.epsilon_symbol = epsilon_symbol
+        # Derived matchers (ε-closure table, bit-parallel tables, lazy DFA)
+        # are built from `transitions` on first use and dropped by `_touch`.
+        # `transitions` is held as watched dicts over watched StateSets, so
+        # every in-place edit, at any level, calls `_touch`.
+        self._version = 0
+        self._closures: Optional[Dict[State, FrozenSet[State]]] = None
+        self._bits: Optional["BitParallelNFA"] = None
+        self._lazy: Optional["LazyDFA"] = None
+        self._transitions = self._adopt_transitions(transitions)
+        self._states.watch(self)
+        self._accept_states.watch(self)
+        self._epsilon_symbol = epsilon_symbol
         # Guard against silently-dead epsilon transitions: transitions written
         # with a different epsilon marker than `epsilon_symbol` would never be
         # followed, so fail loudly instead.
@@ -34,6 +106,72 @@ class NFA(Automaton[State]):
                     f"or relabel the transitions."
                 )
 
+    @property
+    def transitions(self) -> Dict[State, Dict[Symbol, StateSet]]:
+        """
+        transitions[state][symbol] is the StateSet of successors. Edits made
+        through this dict, its rows or their StateSets are seen by the NFA.
+        """
+        return self._transitions
+
+    @transitions.setter
+    def transitions(self, transitions: Dict[State, Dict[Symbol, StateSet]]) -> None:
+        self._transitions = self._adopt_transitions(transitions)
+        self._touch()
+
+    @property
+    def epsilon_symbol(self) -> Symbol:
+        """The symbol that marks ε-transitions."""
+        return self._epsilon_symbol
+
+    @epsilon_symbol.setter
+    def epsilon_symbol(self, epsilon_symbol: Symbol) -> None:
+        self._epsilon_symbol = epsilon_symbol
+        self._touch()
+
+    @property
+    def version(self) -> int:
+        """Mutation counter, bumped whenever derived matchers are dropped."""
+        return self._version
+
+    def _touch(self) -> None:
+        """Record a mutation: bump the version and drop derived matchers."""
+        self._version += 1
+        self._closures = self._bits = self._lazy = None
+
+    def _adopt_transitions(self, transitions: Dict) -> _WatchedDict:
+        return _WatchedDict(self._adopt_row, self._touch, transitions)
+
+    def _adopt_row(self, row: Dict) -> _WatchedDict:
+        return _WatchedDict(self._adopt_targets, self._touch, row)
+
+    def _adopt_targets(self, targets: StateSet) -> StateSet:
+        if isinstance(targets, StateSet):
+            targets.watch(self)
+        return targets
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_closures"] = state["_bits"] = state["_lazy"] = None
+        return state
+
+    def __setstate__(self, state) -> None:
+        self.__dict__.update(state)
+        self._transitions = self._adopt_transitions(self._transitions)
+        self._states.watch(self)
+        self._accept_states.watch(self)
+
+    def add_transition(
+        self, from_state: State, symbol: Symbol, to_state: State
+    ) -> None:
+        """Utility method to add a single transition to the NFA."""
+        row = self._transitions.setdefault(from_state, {})
+        targets = row.get(symbol)
+        if targets is None:
+            row[symbol] = StateSet.from_states({to_state})
+        else:
+            targets.add_state(to_state)
+
     @classmethod
     def from_string(
         cls,
@@ -107,12 +245,24 @@ class NFA(Automaton[State]):
         )
 
     @classmethod
-    def from_regex(cls, regex: str) -> "NFA":
+    def from_regex(cls, regex: str, method: str = "thompson") -> "NFA":
         """
-        Create an NFA from a regular expression.
+        Create an NFA from a regular expression, by Thompson's construction
+        or (method="glushkov") as the ε-free position automaton.
         """
         from ..regex_to_nfa import regex_to_nfa
-        return regex_to_nfa(regex)
+        return regex_to_nfa(regex, method=method)
+
+    def save(self, path) -> None:
+        """Write this NFA to `path` in the package's binary automaton format."""
+        from ..serialization import save_nfa
+        save_nfa(self, path)
+
+    @classmethod
+    def load(cls, path, mmap: bool = True) -> "NFA":
+        """Read an NFA written by `save`."""
+        from ..serialization import load_nfa
+        return load_nfa(path, mmap=mmap)
 
     def to_dfa(self) -> "DFA":
         """
@@ -121,17 +271,83 @@ class NFA(Automaton[State]):
         from .nfa_to_dfa import nfa_to_dfa
         return nfa_to_dfa(self)
 
+    def state_analysis(self):
+        """
+        Return the SCCs of the transition graph (ε-edges included) and the
+        reachable, live, useful and trap states.
+        """
+        from .algo.nfa_trim import state_analysis
+        return state_analysis(self)
+
+    def trim(self) -> "NFA":
+        """
+        Return an equivalent NFA without unreachable or dead states (states
+        from which no accepting state can be reached).
+        """
+        from .algo.nfa_trim import trim
+        return trim(self)
+
+    def epsilon_closures(self) -> Dict[State, FrozenSet[State]]:
+        """
+        Return the ε-closure of every single state, computed once over the
+        SCCs of the ε-graph and reused (see `nfa_bfs.epsilon_closures`).
+        States without ε-edges may be missing; `nfa_bfs.closure_of` unions
+        closures for a set of states. Rebuilt after the NFA is edited.
+        """
+        if self._closures is None:
+            self._closures = nfa_bfs.epsilon_closures(
+                self.transitions, self.epsilon_symbol
+            )
+        return self._closures
+
+    def remove_epsilons(self, prune: bool = True) -> "NFA":
+        """
+        Return an equivalent NFA without ε-transitions: each state takes
+        over the symbol transitions of its ε-closure, and accepts if its
+        closure does. With `prune`, states that are no longer reachable from
+        the start state are dropped. Compute it once and reuse the result.
+        """
+        from .algo.nfa_epsilon import remove_epsilons
+        return remove_epsilons(self, prune)
+
+    def bit_parallel(self) -> "BitParallelNFA":
+        """
+        Return this NFA compiled for bit-parallel simulation: states are
+        numbered, state sets are int bit masks, and ε-closed successor masks
+        are precomputed, so a step is a few OR/AND operations. Built on first
+        use and reused (also by `lazy_dfa`) until the NFA is edited.
+        """
+        from .algo.nfa_bitset import BitParallelNFA
+        if self._bits is None:
+            self._bits = BitParallelNFA(self)
+        return self._bits
+
+    def lazy_dfa(self, max_states: Optional[int] = None) -> "LazyDFA":
+        """
+        Return the `LazyDFA` this NFA matches with: DFA states are built as
+        inputs reach them and kept in an LRU cache of `max_states` entries.
+        The lazy DFA is created on first use and reused by `accepts`, so its
+        cache carries over between words; passing `max_states` replaces it.
+        It is rebuilt after any edit of the NFA: `add_transition`, assigning
+        `transitions` or `epsilon_symbol`, or editing `transitions`, its rows
+        or their StateSets in place.
+        """
+        from .algo.nfa_lazy_dfa import DEFAULT_MAX_STATES, LazyDFA
+        if self._lazy is None or (
+            max_states is not None and max_states != self._lazy.max_states
+        ):
+            self._lazy = LazyDFA(self, max_states or DEFAULT_MAX_STATES)
+        return self._lazy
+
     def accepts(self, word: Word) -> bool:
         """
-        Checks acceptance using the BFS approach.
+        Checks acceptance by running the word through the lazy DFA (see
+        `lazy_dfa`); `nfa_bfs.nfa_accept_bfs` is the set-based equivalent.
         """
-        return nfa_bfs.nfa_accept_bfs(
-            transitions=self.transitions,
-            start_state=self._start_state,
-            accept_states=self._accept_states,
-            input_string=word,
-            epsilon_symbol=self.epsilon_symbol,
-        )
+        lazy = self._lazy
+        if lazy is None:
+            lazy = self.lazy_dfa()
+        return lazy.accepts(word)
 
     def __str__(self):
         return (
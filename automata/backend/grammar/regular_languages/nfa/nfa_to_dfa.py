@@ -4,46 +4,54 @@ from typing import Dict, MutableMapping, Optional, Set
 from automata.backend.grammar.dist import State, Symbol, Alphabet, StateSet
 from automata.backend.grammar.regular_languages.dfa.dfa_mod import DFA
 from automata.backend.grammar.regular_languages.nfa.nfa_mod import NFA
-from automata.backend.grammar.regular_languages.nfa.algo.nfa_bfs import epsilon_closure
+from automata.backend.grammar.regular_languages.nfa.algo.nfa_bfs import closure_of
 
 def nfa_to_dfa(nfa: NFA, metrics: Optional[MutableMapping[str, int]] = None) -> DFA:
     """
     Convert an NFA to an equivalent DFA.
+
+    The NFA is trimmed first, so dead NFA states never enter a subset, and
+    subsets are ε-closed from its cached single-state closures. DFA
+    states are named d0, d1, ... (d0 is the start); `DFA.label` gives the
+    subset of NFA states each one stands for, e.g. "q0,q1".
     """
+    nfa = nfa.trim()
     dfa_states: Set[State] = set()
     dfa_transitions: Dict[State, Dict[Symbol, State]] = {}
     dfa_start_state: State
     dfa_accept_states: Set[State] = set()
 
-    # The states in the DFA are frozensets of states from the NFA
     transition_lookups = 0
     epsilon_closure_calls = 0
     max_queue_size = 1
 
+    closures = nfa.epsilon_closures()
+
     def closure_with_metrics(states: Set[State]) -> frozenset[State]:
         nonlocal epsilon_closure_calls
         epsilon_closure_calls += 1
-        return frozenset(epsilon_closure(states, nfa.transitions, nfa.epsilon_symbol))
+        return frozenset(closure_of(states, closures))
 
     nfa_start_closure = closure_with_metrics({nfa._start_state})
-    
-    queue = deque([nfa_start_closure])
-    processed_states = {nfa_start_closure}
+    nfa_accepting = nfa._accept_states.states()
+    symbols = list(nfa._alphabet.symbols())
 
-    # Convert frozenset of states to a string representation for the DFA state
-    def state_name(s: frozenset) -> State:
-        return State(','.join(sorted(list(s))))
+    # DFA states are named d0, d1, ... in discovery order; the subset each
+    # stands for is kept, and its "q0,q1" label is only built if asked for.
+    ids: Dict[frozenset, State] = {nfa_start_closure: State("d0")}
+    subsets = [nfa_start_closure]
+    queue = deque([nfa_start_closure])
 
-    dfa_start_state = state_name(nfa_start_closure)
+    dfa_start_state = ids[nfa_start_closure]
     dfa_states.add(dfa_start_state)
-    if not nfa_start_closure.isdisjoint(nfa._accept_states.states()):
+    if not nfa_start_closure.isdisjoint(nfa_accepting):
         dfa_accept_states.add(dfa_start_state)
 
     while queue:
         current_nfa_states = queue.popleft()
-        current_dfa_state = state_name(current_nfa_states)
+        current_dfa_state = ids[current_nfa_states]
 
-        for symbol in nfa._alphabet.symbols():
+        for symbol in symbols:
             next_nfa_states_set = set()
             for nfa_state in current_nfa_states:
                 transition_lookups += 1
@@ -54,35 +62,43 @@ def nfa_to_dfa(nfa: NFA, metrics: Optional[MutableMapping[str, int]] = None) ->
                 continue
 
             next_nfa_states_closure = closure_with_metrics(next_nfa_states_set)
-            
-            if next_nfa_states_closure not in processed_states:
-                processed_states.add(next_nfa_states_closure)
+
+            target = ids.get(next_nfa_states_closure)
+            if target is None:
+                target = ids[next_nfa_states_closure] = State(f"d{len(subsets)}")
+                subsets.append(next_nfa_states_closure)
                 queue.append(next_nfa_states_closure)
                 max_queue_size = max(max_queue_size, len(queue))
 
-                new_dfa_state = state_name(next_nfa_states_closure)
-                dfa_states.add(new_dfa_state)
-                if not next_nfa_states_closure.isdisjoint(nfa._accept_states.states()):
-                    dfa_accept_states.add(new_dfa_state)
+                dfa_states.add(target)
+                if not next_nfa_states_closure.isdisjoint(nfa_accepting):
+                    dfa_accept_states.add(target)
 
             if current_dfa_state not in dfa_transitions:
                 dfa_transitions[current_dfa_state] = {}
-            dfa_transitions[current_dfa_state][symbol] = state_name(next_nfa_states_closure)
+            dfa_transitions[current_dfa_state][symbol] = target
+
+    subset_of = {name: subset for subset, name in ids.items()}
+
+    def label(state: State) -> Optional[str]:
+        subset = subset_of.get(state)
+        return None if subset is None else ",".join(sorted(subset))
 
     dfa = DFA(
         states=StateSet.from_states(dfa_states),
         alphabet=nfa._alphabet,
         transitions=dfa_transitions,
         start_state=dfa_start_state,
-        accept_states=StateSet.from_states(dfa_accept_states)
+        accept_states=StateSet.from_states(dfa_accept_states),
+        labeler=label,
     )
     if metrics is not None:
         metrics.update(
             {
-                "subset_count": len(processed_states),
+                "subset_count": len(subsets),
                 "transition_lookups": transition_lookups,
                 "traversal_work_units": transition_lookups,
-                "structural_work_units": len(processed_states),
+                "structural_work_units": len(subsets),
                 "epsilon_closure_calls": epsilon_closure_calls,
                 "max_queue_size": max_queue_size,
                 "dfa_state_count": len(list(dfa._states.states())),
@@ -0,0 +1,78 @@
+"""Tests for the lexer generator (combined tagged DFA, maximal munch)."""
+
+import io
+
+import pytest
+
+from automata.backend.grammar.regular_languages.lexer import Lexer, LexerError, Token
+from automata.backend.grammar.regular_languages.regex_to_nfa import regex_to_nfa
+
+RULES = [
+    ("IF", "if"),
+    ("ID", "[a-z][a-z0-9]*"),
+    ("NUM", "[0-9]+"),
+    ("OP", "[-+*/=<]|==|<="),
+    ("WS", "[ \n]+"),
+]
+
+
+def _kinds_and_texts(tokens):
+    return [(t.kind, t.text) for t in tokens]
+
+
+def test_maximal_munch_and_priority():
+    lexer = Lexer(RULES, skip={"WS"})
+    tokens = list(lexer.tokenize("if iffy == 42+x1 <= y"))
+    assert _kinds_and_texts(tokens) == [
+        ("IF", "if"),  # IF and ID both match "if": the earlier rule wins
+        ("ID", "iffy"),  # the longer ID beats the IF prefix
+        ("OP", "=="),
+        ("NUM", "42"),
+        ("OP", "+"),
+        ("ID", "x1"),
+        ("OP", "<="),
+        ("ID", "y"),
+    ]
+    assert tokens[1] == Token("ID", "iffy", 3) and tokens[1].end == 7
+
+
+def test_rule_order_decides_ties():
+    lexer = Lexer([("ID", "[a-z]+"), ("IF", "if")])
+    assert _kinds_and_texts(lexer.tokenize("if")) == [("ID", "if")]
+
+
+def test_combined_dfa_is_minimal_and_keeps_token_kinds():
+    lexer = Lexer([("A", "ab|cb"), ("B", "b")])
+    # "ab" and "cb" end in the same A state; "b" keeps its own B state.
+    accepting = lexer.dfa._accept_states.states()
+    assert sorted(lexer.token_kind(s) for s in accepting) == ["A", "B"]
+    for word in ["ab", "cb", "b"]:
+        assert lexer.dfa.accepts(word)
+
+
+def test_chunked_input_matches_whole_input():
+    lexer = Lexer(RULES, skip={"WS"})
+    text = "if iffy == 42+x1\nwhile9 <= 300\n"
+    whole = list(lexer.tokenize(text))
+    for size in (1, 2, 3, 7):
+        chunks = [text[i : i + size] for i in range(0, len(text), size)]
+        assert list(lexer.tokenize(chunks)) == whole
+    assert list(lexer.tokenize(io.StringIO(text))) == whole
+
+
+def test_single_pass_agrees_with_per_rule_dfas():
+    lexer = Lexer(RULES)
+    dfas = {name: regex_to_nfa(regex).to_dfa() for name, regex in RULES}
+    for token in lexer.tokenize("if x9 == 10\nabc+1"):
+        assert dfas[token.kind].accepts(token.text)
+
+
+def test_errors():
+    lexer = Lexer(RULES)
+    with pytest.raises(LexerError) as info:
+        list(lexer.tokenize("x = ?"))
+    assert info.value.position == 4
+    with pytest.raises(ValueError, match="empty string"):
+        Lexer([("A", "a*")])
+    with pytest.raises(ValueError):
+        Lexer([])
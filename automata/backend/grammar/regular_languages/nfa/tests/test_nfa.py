@@ -50,3 +50,60 @@ def test_mismatched_epsilon_symbol_is_rejected():
             start_state=State("q0"),
             accept_states=StateSet.from_states({State("q1")}),
         )
+
+
+def test_epsilon_closures_follow_cycles_and_chains():
+    # q0 <-ε-> q1 form a cycle that leads on to q2 -ε-> q3; q4 has no ε-edges.
+    nfa = NFA.from_string(
+        "q0,ε,q1;q1,ε,q0;q1,ε,q2;q2,ε,q3;q3,a,q4",
+        start_state="q0",
+        accept_states={"q4"},
+    )
+    closures = nfa.epsilon_closures()
+    assert closures["q0"] == {"q0", "q1", "q2", "q3"}
+    assert closures["q0"] is closures["q1"]  # one shared set per ε-SCC
+    assert closures["q2"] == {"q2", "q3"}
+    assert closures["q3"] == {"q3"}
+    assert "q4" not in closures
+    assert nfa.epsilon_closures() is closures
+
+
+def test_epsilon_closures_match_per_state_search():
+    from automata.backend.grammar.regular_languages.nfa.algo.nfa_bfs import (
+        closure_of,
+        epsilon_closure,
+    )
+
+    nfa = NFA.from_regex("((a|())*|b(c|())*)*d")
+    closures = nfa.epsilon_closures()
+    for state in nfa._states.states():
+        expected = epsilon_closure({state}, nfa.transitions, nfa.epsilon_symbol)
+        assert closure_of([state], closures) == expected
+
+
+def test_nfa_accept_bfs_closes_on_demand_without_a_table():
+    from automata.backend.grammar.regular_languages.nfa.algo.nfa_bfs import (
+        nfa_accept_bfs,
+    )
+
+    # A long ε-chain the word never reaches: searching on demand must not
+    # touch it, while the table covers it.
+    chain = ";".join(f"c{i},ε,c{i + 1}" for i in range(200))
+    nfa = NFA.from_string(f"q0,ε,q1;q1,a,q2;{chain}", "q0", {"q2"})
+    args = (nfa.transitions, nfa._start_state, nfa._accept_states)
+
+    metrics = {}
+    assert nfa_accept_bfs(*args, "a", nfa.epsilon_symbol, metrics)
+    assert metrics["epsilon_edges_traversed"] == 1
+
+    with_table = {}
+    closures = nfa.epsilon_closures()
+    assert nfa_accept_bfs(
+        *args, "a", nfa.epsilon_symbol, with_table, closures=closures
+    )
+    assert with_table["epsilon_edges_traversed"] == 0
+    for word in ("", "b", "aa"):
+        assert not nfa_accept_bfs(*args, word, nfa.epsilon_symbol)
+        assert not nfa_accept_bfs(
+            *args, word, nfa.epsilon_symbol, closures=closures
+        )
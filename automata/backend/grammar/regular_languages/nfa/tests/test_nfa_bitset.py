@@ -0,0 +1,47 @@
+"""Tests for bit-parallel NFA simulation."""
+
+import random
+
+import pytest
+
+from automata.backend.grammar.dist import State
+from automata.backend.grammar.regular_languages.nfa.algo.nfa_bfs import nfa_accept_bfs
+from automata.backend.grammar.regular_languages.nfa.nfa_mod import NFA
+
+
+@pytest.mark.parametrize(
+    "regex", ["(a|b)*abb", "(ab|a)*(b|())c*", "((a|b)(a|b))*|c+", "(a|b)*a(a|b)(a|b)"]
+)
+def test_agrees_with_set_simulation(regex):
+    nfa = NFA.from_regex(regex)
+    bits = nfa.bit_parallel()
+    rng = random.Random(regex)
+    for _ in range(300):
+        word = "".join(rng.choice("abcx") for _ in range(rng.randint(0, 12)))
+        expected = nfa_accept_bfs(
+            nfa.transitions, nfa._start_state, nfa._accept_states, word, nfa.epsilon_symbol
+        )
+        assert bits.accepts(word) == expected, word
+
+
+def test_masks_round_trip_to_states():
+    nfa = NFA.from_string("s,a,s,t;t,ε,u;u,b,v", "s", {"v"})
+    bits = nfa.bit_parallel()
+    assert bits.states[0] == State("s")
+    assert bits.states_of(bits.start) == {"s"}
+    after_a = bits.step(bits.start, "a")
+    assert bits.states_of(after_a) == {"s", "t", "u"}
+    assert after_a == bits.mask_of(["s", "t", "u", "unknown"])
+    assert bits.states_of(bits.run("ab")) == {"v"}
+    assert bits.run("b") == 0
+    assert nfa.bit_parallel() is bits
+
+
+def test_wide_nfa_spans_many_bytes():
+    # A chain of 300 states: the frontier crosses every byte of the mask.
+    n = 300
+    nfa = NFA.from_string(";".join(f"q{i},a,q{i + 1}" for i in range(n)), "q0", {f"q{n}"})
+    bits = nfa.bit_parallel()
+    assert bits.accepts("a" * n)
+    assert not bits.accepts("a" * (n - 1))
+    assert not bits.accepts("a" * (n + 1))
@@ -56,5 +56,16 @@ class TestNFA(unittest.TestCase):
         self.assertFalse(dfa.accepts(''))
 
 
+    def test_dfa_states_are_labeled_by_subset(self):
+        nfa = NFA.from_string("q0,a,q0,q1;q0,b,q0", "q0", {"q1"})
+        dfa = nfa.to_dfa()
+        self.assertEqual(dfa._start_state, State('d0'))
+        self.assertEqual(
+            set(dfa.labels().values()), {'q0', 'q0,q1'}
+        )
+        self.assertEqual(dfa.label(State('d0')), 'q0')
+        self.assertEqual(dfa.label(State('unknown')), 'unknown')
+
+
 if __name__ == '__main__':
     unittest.main()
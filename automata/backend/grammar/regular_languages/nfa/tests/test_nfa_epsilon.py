@@ -0,0 +1,49 @@
+"""Tests for ε-transition elimination."""
+
+import random
+
+import pytest
+
+from automata.backend.grammar.regular_languages.nfa.nfa_mod import NFA
+
+
+def _epsilon_edges(nfa):
+    return sum(
+        len(row[nfa.epsilon_symbol])
+        for row in nfa.transitions.values()
+        if nfa.epsilon_symbol in row
+    )
+
+
+@pytest.mark.parametrize(
+    "regex", ["(a|b)*abb", "(ab|a)*(b|())c*", "((a|())*|b(c|())*)*d", "a?b+|c{2,3}"]
+)
+@pytest.mark.parametrize("prune", [True, False])
+def test_same_language_without_epsilons(regex, prune):
+    nfa = NFA.from_regex(regex)
+    free = nfa.remove_epsilons(prune=prune)
+    assert _epsilon_edges(free) == 0
+    assert free.epsilon_closures() == {}
+    assert len(free._states) <= len(nfa._states)
+    rng = random.Random(regex)
+    for _ in range(300):
+        word = "".join(rng.choice("abcdx") for _ in range(rng.randint(0, 10)))
+        assert free.accepts(word) == nfa.accepts(word), word
+    assert free.to_dfa().equivalent_to(nfa.to_dfa())
+
+
+def test_pruning_drops_states_only_entered_by_epsilon():
+    nfa = NFA.from_string("s,ε,m;m,a,t;t,ε,f", "s", {"f"})
+    free = nfa.remove_epsilons()
+    assert free._states.states() == {"s", "t"}
+    assert free._accept_states.states() == {"t"}
+    assert free.transitions["s"]["a"].states() == {"t"}
+
+    unpruned = nfa.remove_epsilons(prune=False)
+    assert unpruned._states.states() == {"s", "m", "t", "f"}
+    assert unpruned._accept_states.states() == {"t", "f"}
+
+
+def test_epsilon_free_nfa_is_returned_as_is():
+    nfa = NFA.from_string("s,a,t;t,b,s", "s", {"t"})
+    assert nfa.remove_epsilons() is nfa
@@ -0,0 +1,125 @@
+"""Tests for the lazily determinized, cache-bounded NFA matcher."""
+
+import random
+
+import pytest
+
+from automata.backend.grammar.regular_languages.nfa.algo.nfa_bfs import nfa_accept_bfs
+from automata.backend.grammar.regular_languages.nfa.algo.nfa_lazy_dfa import LazyDFA
+from automata.backend.grammar.regular_languages.nfa.nfa_mod import NFA
+
+
+def _bfs_accepts(nfa, word):
+    return nfa_accept_bfs(
+        nfa.transitions, nfa._start_state, nfa._accept_states, word, nfa.epsilon_symbol
+    )
+
+
+@pytest.mark.parametrize("regex", ["(a|b)*abb", "a*(b|c)+a?", "((ab)*|c)*b"])
+def test_agrees_with_set_simulation(regex):
+    nfa = NFA.from_regex(regex)
+    rng = random.Random(regex)
+    for _ in range(300):
+        word = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 10)))
+        assert nfa.accepts(word) == _bfs_accepts(nfa, word), word
+
+
+def test_cache_is_reused_across_words():
+    nfa = NFA.from_regex("(a|b)*abb")
+    lazy = nfa.lazy_dfa()
+    assert nfa.accepts("ababb")
+    misses = lazy.misses
+    assert nfa.accepts("ababb")
+    assert lazy.misses == misses  # every transition came from the cache
+    assert lazy.hits >= 5
+    assert nfa.lazy_dfa() is lazy
+
+
+def test_cache_stays_bounded_and_falls_back_when_thrashing():
+    # The k-th symbol from the end is an 'a': the DFA has 2^k states.
+    k = 10
+    nfa = NFA.from_regex("(a|b)*a" + "(a|b)" * k)
+    lazy = LazyDFA(nfa, max_states=8)
+    rng = random.Random(1)
+    word = "".join(rng.choice("ab") for _ in range(2000))
+    assert lazy.accepts(word) == (word[-k - 1] == "a")
+    assert len(lazy) <= 8
+    assert lazy.fallbacks == 1
+    assert lazy.evictions >= 8
+
+
+def test_iterators_and_unknown_symbols():
+    nfa = NFA.from_regex("ab*")
+    lazy = LazyDFA(nfa, max_states=1)
+    assert lazy.accepts(iter("abbb"))
+    assert not lazy.accepts("abz")
+    assert lazy.run("z") == frozenset()
+    with pytest.raises(ValueError):
+        LazyDFA(nfa, max_states=0)
+
+
+def test_edits_to_transitions_invalidate_the_cached_matchers():
+    from automata.backend.grammar.dist import State, StateSet, Symbol
+
+    nfa = NFA.from_string("q0,a,q1", "q0", {"q1"})
+    assert nfa.accepts("a") and not nfa.accepts("b")
+    version = nfa.version
+
+    # Direct edit of the public dict: a new (state, symbol) entry.
+    nfa.transitions[State("q0")][Symbol("b")] = StateSet(["q1"])
+    assert nfa.accepts("b") and _bfs_accepts(nfa, "b")
+    assert nfa.version > version
+
+    # A new target added to an existing entry's StateSet in place.
+    nfa.transitions[State("q0")][Symbol("a")].add_state(State("q2"))
+    nfa.add_transition(State("q2"), Symbol("c"), State("q1"))
+    assert nfa.accepts("ac") and _bfs_accepts(nfa, "ac")
+    nfa.transitions[State("q0")][Symbol("a")].remove_state(State("q2"))
+    assert not nfa.accepts("ac")
+
+    # New rows, through setdefault and item assignment.
+    nfa.transitions.setdefault(State("q1"), {})[Symbol("c")] = StateSet(["q1"])
+    assert nfa.accepts("bc")
+    del nfa.transitions[State("q1")]
+    assert not nfa.accepts("bc")
+
+    # Accepting states.
+    nfa._accept_states.add_state(State("q0"))
+    assert nfa.accepts("")
+    nfa._accept_states.remove_state(State("q0"))
+    assert not nfa.accepts("")
+
+    # A new target for an existing entry through add_transition.
+    nfa.add_transition(State("q1"), Symbol("a"), State("q2"))
+    nfa.add_transition(State("q1"), Symbol("a"), State("q1"))
+    assert nfa.transitions["q1"]["a"].states() == {"q1", "q2"}
+    assert nfa.accepts("baa") and _bfs_accepts(nfa, "baa")
+
+    # Replacing the whole dict.
+    nfa.transitions = {State("q0"): {Symbol("c"): StateSet(["q1"])}}
+    assert not nfa.accepts("a")
+    assert nfa.accepts("c")
+    assert nfa.epsilon_closures() == {}
+    assert nfa.bit_parallel().accepts("c")
+
+
+def test_in_place_stateset_edit_after_accepts():
+    from automata.backend.grammar.dist import State
+
+    nfa = NFA.from_string("q0,a,q1;q1,b,q2", "q0", {"q2"})
+    assert not nfa.accepts("a")
+    nfa.transitions[State("q0")]["a"].add_state(State("q2"))
+    assert nfa.accepts("a")
+
+
+def test_pickled_nfa_keeps_watching_edits():
+    import pickle
+
+    from automata.backend.grammar.dist import State, StateSet
+
+    nfa = NFA.from_string("q0,a,q1", "q0", {"q1"})
+    assert nfa.accepts("a")
+    copy = pickle.loads(pickle.dumps(nfa))
+    assert type(copy.transitions) is type(nfa.transitions)
+    copy.transitions[State("q0")]["b"] = StateSet(["q1"])
+    assert copy.accepts("b") and not nfa.accepts("b")
@@ -0,0 +1,61 @@
+"""Tests for the Glushkov (position automaton) construction."""
+
+import pytest
+
+from automata.backend.grammar.regular_languages.regex_to_nfa import (
+    RegexSyntaxError,
+    regex_to_nfa,
+)
+
+PATTERNS = [
+    "ab",
+    "a|b|",
+    "(a|b)*abb",
+    "ab?c",
+    "a+b",
+    "a{2,3}",
+    "(ab){2}",
+    "a{2,}",
+    "(a?b){0,2}c{3}",
+    "(a*|b+)*c",
+    "((a|())*|b(c|())*)*d",
+    "[a-c]\\d+x{0}",
+    "ε*|a",
+    "(a{1,2}){2,}b?",
+]
+
+
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_same_language_as_thompson(pattern):
+    glushkov = regex_to_nfa(pattern, method="glushkov")
+    thompson = regex_to_nfa(pattern)
+    assert glushkov.to_dfa().equivalent_to(thompson.to_dfa())
+
+
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_one_state_per_position_and_no_epsilons(pattern):
+    nfa = regex_to_nfa(pattern, method="glushkov")
+    assert nfa.epsilon_closures() == {}
+    assert all(nfa.epsilon_symbol not in row for row in nfa.transitions.values())
+    assert len(regex_to_nfa(pattern)._states) >= len(nfa._states)
+
+
+def test_state_count_is_positions_plus_start():
+    # Four symbol occurrences: a, b, a, b.
+    nfa = regex_to_nfa("(a|b)*ab", method="glushkov")
+    assert len(nfa._states) == 5
+    assert nfa.accepts("abab")
+    assert not nfa.accepts("aba")
+
+
+def test_wildcard_uses_alphabet():
+    nfa = regex_to_nfa(".a", alphabet="xy", method="glushkov")
+    assert nfa.accepts("xa") and nfa.accepts("aa")
+    assert not nfa.accepts("za")
+    with pytest.raises(RegexSyntaxError):
+        regex_to_nfa(".*", method="glushkov")
+
+
+def test_unknown_method_is_rejected():
+    with pytest.raises(ValueError, match="glushkov"):
+        regex_to_nfa("a", method="brzozowski")
@@ -0,0 +1,103 @@
+"""Tests for unanchored leftmost-longest regex search."""
+
+import random
+import re
+
+import pytest
+
+from automata.backend.grammar.regular_languages.regex_search import (
+    RegexMatch,
+    compile_regex,
+)
+from automata.backend.grammar.regular_languages.regex_to_nfa import RegexSyntaxError
+
+
+def _leftmost_longest(pattern, text):
+    """Brute-force POSIX search over all substrings, using `re` for membership."""
+    whole = re.compile(f"(?:{pattern})\\Z")
+    spans, position = [], 0
+    while position <= len(text):
+        found = None
+        for start in range(position, len(text) + 1):
+            ends = [
+                end
+                for end in range(start, len(text) + 1)
+                if whole.match(text, start, end)
+            ]
+            if ends:
+                found = (start, max(ends))
+                break
+        if found is None:
+            break
+        spans.append(found)
+        position = found[1] if found[1] > found[0] else found[1] + 1
+    return spans
+
+
+@pytest.mark.parametrize(
+    "pattern,text,expected",
+    [
+        ("ab*|c", "xabbcab", ["abb", "c", "ab"]),
+        # Longest, not first alternative (unlike Python's `re`).
+        ("a|ab|abc", "abcab", ["abc", "ab"]),
+        # Empty matches where nothing longer starts.
+        ("a*", "baa", ["", "aa", ""]),
+        ("[0-9]+", "v12 and 345", ["12", "345"]),
+        ("x", "abc", []),
+    ],
+)
+def test_findall(pattern, text, expected):
+    assert compile_regex(pattern).findall(text) == expected
+
+
+def test_matches_brute_force_on_random_texts():
+    rng = random.Random(0)
+    patterns = ["a*", "(ab|a)(bc|c)?", "b+a?", "(a|b)*c", "a{2,3}", "[ab]c*|cc"]
+    for pattern in patterns:
+        compiled = compile_regex(pattern)
+        for _ in range(100):
+            text = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 12)))
+            spans = [m.span() for m in compiled.finditer(text)]
+            assert spans == _leftmost_longest(pattern, text), (pattern, text)
+
+
+
+@pytest.mark.parametrize("pattern", ["a*b|a", "(a|b)*c|a", "a{1,5}b?"])
+def test_search_work_is_linear(pattern):
+    # Every position is a match start, but no run of the forward DFA ever
+    # completes a long match: rescanning from each start would be quadratic.
+    compiled = compile_regex(pattern)
+    work = []
+    for n in (1000, 2000, 4000):
+        text = "a" * n
+        metrics = {}
+        compiled._longest_ends(text, compiled._match_starts(text), metrics)
+        assert "".join(compiled.findall(text)) == text
+        work.append(metrics["forward_steps"])
+    assert work[1] <= 2 * work[0] + 100
+    assert work[2] <= 2 * work[1] + 100
+    assert work[2] <= 10 * 4000
+
+def test_anchors():
+    assert compile_regex("^ab*").findall("abbab") == ["abb"]
+    assert compile_regex("^ab*").findall("cab") == []
+    assert compile_regex("ca*$").findall("cacaa") == ["caa"]
+    assert compile_regex("ca*$").findall("caab") == []
+    assert compile_regex("^a*$").findall("aaa") == ["aaa"]
+    assert compile_regex("a\\$").findall("a$a") == ["a$"]
+
+
+def test_match_objects_and_helpers():
+    compiled = compile_regex("b+")
+    match = compiled.search("aabbba")
+    assert match == RegexMatch(2, 5, "aabbba")
+    assert match.group() == "bbb" and match.span() == (2, 5)
+    assert compiled.search("aaa") is None
+    assert compiled.fullmatch("bb") == RegexMatch(0, 2, "bb")
+    assert compiled.fullmatch("bba") is None
+
+
+def test_wildcard_alphabet_and_syntax_errors():
+    assert compile_regex("a.c", alphabet="abc").findall("abcaxc") == ["abc"]
+    with pytest.raises(RegexSyntaxError):
+        compile_regex("a(b")
@@ -0,0 +1,294 @@
+"""
+Unanchored regex search with leftmost-longest (POSIX) semantics.
+
+`regex_to_nfa` builds whole-word matchers. `compile_regex(pattern)` turns
+the same syntax into a searcher that finds matches *inside* a text:
+
+    >>> [m.group() for m in compile_regex("ab*|c").finditer("xabbcab")]
+    ['abb', 'c', 'ab']
+
+Matches are reported left to right and never overlap. Among the matches
+starting at the leftmost possible position, the longest is chosen; the
+search then resumes where that match ended. An empty match is reported
+where nothing longer starts, and the search then moves one character on.
+
+Two DFAs do the work:
+
+- a *reverse* DFA for Σ*·rev(R) is run once over the text from right to
+  left. After reading text[i:] it is accepting exactly when some match
+  starts at i, so one linear pass marks every possible match start;
+- the *forward* (minimal) DFA for R is then run once from left to right,
+  with a run started at every marked position. Runs that reach the same
+  DFA state have the same future, so they are merged, and a position costs
+  at most one step per DFA state. Each merge is recorded as a node in a
+  forest whose leaves are the starts. Every node keeps the last accepting
+  position seen after it was created. The longest match from a start is
+  then the largest such position on its path to the root.
+
+Both passes are linear in the length of the text; picking the
+non-overlapping leftmost-longest matches from the precomputed ends is
+another linear scan.
+
+Characters outside the pattern's alphabet simply cannot be part of a match.
+
+A leading `^` anchors matches to the start of the text and a trailing `$` to
+its end (for `$`, the reverse DFA is run without the Σ* loop, so the pass
+stops as soon as no suffix can match).
+"""
+
+from dataclasses import dataclass
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from automata.backend.grammar.dist import State, StateSet, Symbol
+from automata.backend.grammar.regular_languages.dfa.dfa_scanner import _live_offsets
+from automata.backend.grammar.regular_languages.nfa.nfa_mod import NFA
+from automata.backend.grammar.regular_languages.regex_to_nfa import regex_to_nfa
+
+
+@dataclass(frozen=True)
+class RegexMatch:
+    """A match of a compiled regex: text[start:end]."""
+
+    start: int
+    end: int
+    string: str
+
+    def group(self) -> str:
+        """The matched text."""
+        return self.string[self.start : self.end]
+
+    def span(self) -> Tuple[int, int]:
+        """The (start, end) pair."""
+        return self.start, self.end
+
+
+def _split_anchors(pattern: str) -> Tuple[str, bool, bool]:
+    """Strip a leading '^' and an unescaped trailing '$' from `pattern`."""
+    at_start = pattern.startswith("^")
+    if at_start:
+        pattern = pattern[1:]
+    at_end = False
+    if pattern.endswith("$"):
+        backslashes = len(pattern) - 1 - len(pattern[:-1].rstrip("\\"))
+        if backslashes % 2 == 0:
+            at_end = True
+            pattern = pattern[:-1]
+    return pattern, at_start, at_end
+
+
+def _reverse_nfa(nfa: NFA, loop: bool) -> NFA:
+    """
+    An NFA for rev(L(nfa)), prefixed with Σ* when `loop` is set. A fresh
+    start state has ε-edges to the old accepting states (and, with `loop`,
+    a self-loop on every symbol); the old start state is the only accept.
+    """
+    epsilon = nfa.epsilon_symbol
+    transitions: Dict[State, Dict[Symbol, Set[State]]] = {}
+    states = set(nfa._states.states()) | {nfa._start_state}
+    for source, row in nfa.transitions.items():
+        states.add(source)
+        for symbol, targets in row.items():
+            for target in targets.states():
+                states.add(target)
+                transitions.setdefault(target, {}).setdefault(symbol, set()).add(
+                    source
+                )
+    start = State("__reverse_start__")
+    entry = transitions.setdefault(start, {})
+    entry[epsilon] = set(nfa._accept_states.states())
+    if loop:
+        for symbol in nfa._alphabet.symbols():
+            entry.setdefault(symbol, set()).add(start)
+
+    return NFA(
+        states=StateSet.from_states(states | {start}),
+        alphabet=nfa._alphabet,
+        transitions={
+            source: {
+                symbol: StateSet.from_states(targets)
+                for symbol, targets in row.items()
+            }
+            for source, row in transitions.items()
+        },
+        start_state=start,
+        accept_states=StateSet.from_states({nfa._start_state}),
+        epsilon_symbol=epsilon,
+    )
+
+
+class CompiledRegex:
+    """
+    A regex compiled for searching. Build it with `compile_regex`.
+
+    Attributes:
+        pattern: The source pattern.
+    """
+
+    def __init__(self, pattern: str, alphabet: Optional[Iterable[str]] = None):
+        self.pattern = pattern
+        body, self._at_start, self._at_end = _split_anchors(pattern)
+        nfa = regex_to_nfa(body, alphabet)
+
+        self._forward = nfa.to_dfa().minimized().compile()
+        self._forward_live = _live_offsets(self._forward)
+        self._reverse = (
+            _reverse_nfa(nfa, loop=not self._at_end).to_dfa().minimized().compile()
+        )
+        self._reverse_live = _live_offsets(self._reverse)
+
+    def _match_starts(self, text: str) -> bytearray:
+        """starts[i] == 1 iff some match of the pattern begins at text[i]."""
+        compiled = self._reverse
+        table, column = compiled._table, compiled._symbol_column
+        accepting, live = compiled._accepting_offsets, self._reverse_live
+        starts = bytearray(len(text) + 1)
+        offset = 0
+        starts[len(text)] = offset in accepting
+        for i in range(len(text) - 1, -1, -1):
+            col = column.get(text[i])
+            if col is None:
+                if self._at_end:
+                    break  # no match can span this character
+                offset = 0  # Σ* absorbs it; restart from the loop state
+            else:
+                offset = table[offset + col]
+                if self._at_end and offset not in live:
+                    break
+            if offset in accepting:
+                starts[i] = 1
+        return starts
+
+    def _longest_ends(
+        self,
+        text: str,
+        starts: bytearray,
+        metrics: Optional[MutableMapping[str, int]] = None,
+    ) -> Dict[int, int]:
+        """
+        Map each marked start to the end of the longest match beginning
+        there, in one left-to-right pass of the forward DFA.
+        """
+        compiled = self._forward
+        table, column = compiled._table, compiled._symbol_column
+        accepting, live = compiled._accepting_offsets, self._forward_live
+        start_accepts = 0 in accepting
+        # Forest of runs: a leaf per start, a new parent whenever two runs
+        # merge. end[node] is the last accepting position seen at the node.
+        parent: List[int] = []
+        end: List[int] = []
+        leaf: Dict[int, int] = {}
+        runs: Dict[int, int] = {}  # DFA row offset -> node of the run there
+        steps = 0
+
+        def merge(first: int, second: int) -> int:
+            node = len(parent)
+            parent.append(-1)
+            end.append(-1)
+            parent[first] = parent[second] = node
+            return node
+
+        limit = 1 if self._at_start else len(text) + 1
+        i = 0
+        while i <= len(text):
+            if not runs:
+                i = starts.find(1, i, limit)
+                if i == -1:
+                    break
+            if i < limit and starts[i]:
+                node = leaf[i] = len(parent)
+                parent.append(-1)
+                end.append(i if start_accepts else -1)
+                other = runs.get(0)
+                runs[0] = node if other is None else merge(other, node)
+            if i == len(text):
+                break
+            col = column.get(text[i])
+            i += 1
+            if col is None:
+                runs = {}
+                continue
+            steps += len(runs)
+            advanced: Dict[int, int] = {}
+            for offset, node in runs.items():
+                target = table[offset + col]
+                if target not in live:
+                    continue
+                other = advanced.get(target)
+                if other is not None:
+                    node = merge(other, node)
+                advanced[target] = node
+                if target in accepting:
+                    end[node] = i
+            runs = advanced
+
+        # Parents are created after their children: resolve top-down.
+        best = end[:]
+        for node in range(len(parent) - 1, -1, -1):
+            up = parent[node]
+            if up != -1 and best[up] > best[node]:
+                best[node] = best[up]
+        if metrics is not None:
+            metrics.update({"forward_steps": steps, "run_nodes": len(parent)})
+        return {start: best[node] for start, node in leaf.items()}
+
+    def finditer(self, text: str) -> Iterator[RegexMatch]:
+        """Yield the non-overlapping leftmost-longest matches in `text`."""
+        starts = self._match_starts(text)
+        ends = self._longest_ends(text, starts)
+        position = 0
+        while position <= len(text):
+            start = starts.find(1, position)
+            if start == -1:
+                return
+            if self._at_start and start != 0:
+                return
+            # With '$', only starts whose suffix matches are marked, and the
+            # longest match from such a start ends at the end of the text.
+            end = ends[start]
+            yield RegexMatch(start, end, text)
+            if self._at_start:
+                return
+            position = end if end > start else end + 1
+
+    def findall(self, text: str) -> List[str]:
+        """Return the matched substrings, as `finditer` finds them."""
+        return [match.group() for match in self.finditer(text)]
+
+    def search(self, text: str) -> Optional[RegexMatch]:
+        """Return the leftmost-longest match in `text`, or None."""
+        return next(self.finditer(text), None)
+
+    def fullmatch(self, text: str) -> Optional[RegexMatch]:
+        """Return a match spanning all of `text`, or None."""
+        if self._forward.accepts(text):
+            return RegexMatch(0, len(text), text)
+        return None
+
+    def __repr__(self) -> str:
+        return f"compile_regex({self.pattern!r})"
+
+
+def compile_regex(
+    pattern: str, alphabet: Optional[Iterable[str]] = None
+) -> CompiledRegex:
+    """
+    Compile `pattern` (the syntax of `regex_to_nfa`) for searching in text.
+
+    Args:
+        pattern: The pattern. A leading '^' / trailing '$' anchor matches to
+            the start / end of the searched text.
+        alphabet: Extra symbols for the `.` wildcard, as in `regex_to_nfa`.
+
+    Raises:
+        RegexSyntaxError: If the pattern cannot be parsed.
+    """
+    return CompiledRegex(pattern, alphabet)
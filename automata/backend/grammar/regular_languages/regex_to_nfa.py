@@ -1,5 +1,6 @@
 """
-Regex -> NFA via a recursive-descent parser and Thompson's construction.
+Regex -> NFA via a recursive-descent parser and Thompson's construction, or
+(with `method="glushkov"`) the Glushkov position automaton.
 
 Supported syntax:
     a           literal character
@@ -26,6 +27,13 @@ appear in the pattern itself, plus anything passed via the `alphabet`
 argument. A pattern whose alphabet would otherwise be empty (e.g. ".*")
 requires an explicit `alphabet`.
 
+Thompson's construction (the default) glues two-state fragments together
+with ε-edges. The Glushkov construction numbers the symbol occurrences
+("positions") of the pattern instead and computes which positions can come
+first, last and after each other; the NFA has one state per position plus a
+start state and no ε-transitions. Bounded repeats are expanded into copies
+in both constructions.
+
 The grammar, for reference:
     union  := concat ('|' concat)*
     concat := repeat*
@@ -34,7 +42,7 @@ The grammar, for reference:
 """
 
 import itertools
-from typing import Iterable, List, Optional, Set, Tuple
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
 from automata.backend.grammar.dist import State, Alphabet, StateSet, Symbol
 from automata.backend.grammar.regular_languages.nfa.nfa_mod import NFA
@@ -367,10 +375,130 @@ class _Compiler:
         return fragment
 
 
+# ── Glushkov construction ───────────────────────────────────────────────────
+
+
+class _Glushkov:
+    """
+    The position automaton of an AST.
+
+    Every "lit", "set" and "any" node occurrence becomes a position 1..n,
+    with the symbols it matches. `compile` returns (nullable, first, last)
+    for a node and records in `follow` which positions may come right after
+    which.
+    """
+
+    def __init__(self, alphabet: Set[str]):
+        self.alphabet = alphabet
+        self.symbols: List[FrozenSet[str]] = [frozenset()]  # position 0: start
+        self.follow: Dict[int, Set[int]] = {}
+
+    def position(self, chars: Iterable[str]) -> Tuple[bool, Set[int], Set[int]]:
+        self.symbols.append(frozenset(chars))
+        p = len(self.symbols) - 1
+        return False, {p}, {p}
+
+    def link(self, last: Set[int], first: Set[int]) -> None:
+        for p in last:
+            self.follow.setdefault(p, set()).update(first)
+
+    def compile(self, node: _Node) -> Tuple[bool, Set[int], Set[int]]:
+        kind = node[0]
+        if kind == "lit":
+            return self.position({node[1]})
+        if kind == "set":
+            return self.position(node[1])
+        if kind == "any":
+            return self.position(self.alphabet)
+        if kind == "eps":
+            return True, set(), set()
+        if kind == "cat":
+            return self._concat([self.compile(child) for child in node[1]])
+        if kind == "alt":
+            nullable, first, last = False, set(), set()
+            for child in node[1]:
+                n, f, l = self.compile(child)
+                nullable, first, last = nullable or n, first | f, last | l
+            return nullable, first, last
+        if kind == "star":
+            _, first, last = self.compile(node[1])
+            self.link(last, first)
+            return True, first, last
+        if kind == "rep":
+            return self._repeat(node[1], node[2], node[3])
+        raise AssertionError(f"unknown AST node {kind!r}")
+
+    def _concat(
+        self, parts: List[Tuple[bool, Set[int], Set[int]]]
+    ) -> Tuple[bool, Set[int], Set[int]]:
+        nullable, first, last = parts[0]
+        for n, f, l in parts[1:]:
+            self.link(last, f)
+            first = first | f if nullable else first
+            last = last | l if n else l
+            nullable = nullable and n
+        return nullable, first, last
+
+    def _repeat(
+        self, node: _Node, low: int, high: Optional[int]
+    ) -> Tuple[bool, Set[int], Set[int]]:
+        """
+        Compile r{low,high} as copies of r: r+ and r? need only one copy
+        (r{n,} is r{n-1} r+), other counts expand like Thompson's.
+        """
+        parts = [self.compile(node) for _ in range(max(low - 1, 0))]
+        if high is None:
+            nullable, first, last = self.compile(node)
+            self.link(last, first)
+            parts.append((nullable or low == 0, first, last))
+        else:
+            if low > 0:
+                parts.append(self.compile(node))
+            for _ in range(high - low):
+                _, first, last = self.compile(node)
+                parts.append((True, first, last))
+        if not parts:
+            return True, set(), set()
+        return self._concat(parts)
+
+
+def _glushkov_nfa(ast: _Node, chars: Set[str]) -> NFA:
+    builder = _Glushkov(chars)
+    nullable, first, last = builder.compile(ast)
+    names = [State(f"q{p}") for p in range(len(builder.symbols))]
+
+    transitions = {}
+    for source, targets in [(0, first), *builder.follow.items()]:
+        row: Dict[Symbol, Set[State]] = {}
+        for p in targets:
+            for ch in builder.symbols[p]:
+                row.setdefault(Symbol(ch), set()).add(names[p])
+        if row:
+            transitions[names[source]] = {
+                symbol: StateSet.from_states(states) for symbol, states in row.items()
+            }
+
+    accepting = {names[p] for p in last}
+    if nullable:
+        accepting.add(names[0])
+    return NFA(
+        states=StateSet.from_states(set(names)),
+        alphabet=Alphabet(chars),
+        transitions=transitions,
+        start_state=names[0],
+        accept_states=StateSet.from_states(accepting),
+        epsilon_symbol=EPSILON,
+    )
+
+
 # ── Public API ───────────────────────────────────────────────────────────────
 
 
-def regex_to_nfa(regex: str, alphabet: Optional[Iterable[str]] = None) -> NFA:
+def regex_to_nfa(
+    regex: str,
+    alphabet: Optional[Iterable[str]] = None,
+    method: str = "thompson",
+) -> NFA:
     """
     Build an NFA accepting exactly the whole words matched by `regex`.
 
@@ -379,11 +507,19 @@ def regex_to_nfa(regex: str, alphabet: Optional[Iterable[str]] = None) -> NFA:
         alphabet: Extra symbols to include in the NFA's alphabet, beyond the
             characters appearing in the pattern. Required when the pattern
             uses the `.` wildcard but contains no literal characters.
+        method: "thompson" (ε-transitions, two states per symbol occurrence)
+            or "glushkov" (ε-free, one state per symbol occurrence plus a
+            start state).
 
     Raises:
         RegexSyntaxError: If the pattern cannot be parsed, or `.` is used
             with an empty alphabet.
+        ValueError: If `method` is not one of the above.
     """
+    if method not in ("thompson", "glushkov"):
+        raise ValueError(
+            f"Unknown construction method {method!r}; use 'thompson' or 'glushkov'"
+        )
     ast = _Parser(regex).parse()
 
     chars: Set[str] = set()
@@ -395,6 +531,9 @@ def regex_to_nfa(regex: str, alphabet: Optional[Iterable[str]] = None) -> NFA:
             "pattern uses '.' but has no alphabet; pass alphabet=..."
         )
 
+    if method == "glushkov":
+        return _glushkov_nfa(ast, chars)
+
     compiler = _Compiler(chars)
     fragment = compiler.compile(ast)
 
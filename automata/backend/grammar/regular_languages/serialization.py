@@ -0,0 +1,424 @@
+"""
+Compact, versioned binary files for DFAs and NFAs.
+
+Both formats are little-endian and laid out so that the bulky part, the
+transition data, is a flat int32 array that can be memory-mapped as is.
+
+DFA file (magic ``ADFA``)::
+
+    header       <4sHHIIIi: magic, format version, flags (reserved, 0),
+                 state count n, symbol count k, start id, sink id (-1: none)
+    symbols      (k + 1) uint32 byte offsets, then the UTF-8 blob
+    states       (n + 1) uint32 byte offsets, then the UTF-8 blob
+    transitions  n * k int32, row-major; -1 marks a missing transition
+    bitmaps      ceil(n / 8) bytes each: declared in `states`, has a row in
+                 the transition dict, accepting
+
+NFA file (magic ``ANFA``)::
+
+    header       <4sHHIIIi: magic, format version, flags (reserved, 0),
+                 state count n, symbol count k, start id, epsilon symbol id
+    symbols, states   as for DFAs
+    row offsets  (n + 1) uint32 indexes into the edge arrays
+    edges        E int32 symbol ids, then E int32 target ids; a target of
+                 -1 records an empty target set
+    bitmaps      declared, has a row, accepting (n bits each), then
+                 in-alphabet (k bits)
+
+String tables are padded to a 4-byte boundary so the int32 arrays that
+follow them are aligned. Both formats
+round-trip exactly: declared-but-unused states, undeclared transition
+targets, empty rows and the DFA's sink state all survive a save/load.
+
+Loading a DFA does not parse its transitions: the array is wrapped by a
+lazy mapping that builds a row's dict the first time that row is used, so
+start-up cost is dominated by reading the state names. With ``mmap=True``
+the array is mapped from the file rather than read.
+"""
+
+import mmap as _mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    MutableMapping,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from automata.backend.grammar.dist import Alphabet, State, StateSet, Symbol
+from automata.backend.grammar.regular_languages.dfa.dfa_mod import DFA
+from automata.backend.grammar.regular_languages.nfa.nfa_mod import NFA
+
+FORMAT_VERSION = 1
+
+_DFA_MAGIC = b"ADFA"
+_NFA_MAGIC = b"ANFA"
+_HEADER = struct.Struct("<4sHHIIIi")
+
+PathLike = Union[str, Path]
+
+
+# ── Writing ──────────────────────────────────────────────────────────────────
+
+
+def _pad(out: bytearray) -> None:
+    out.extend(b"\0" * (-len(out) % 4))
+
+
+def _write_strings(out: bytearray, strings: Sequence[str]) -> None:
+    blobs = [s.encode("utf-8") for s in strings]
+    offsets = [0]
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+    out.extend(struct.pack(f"<{len(offsets)}I", *offsets))
+    out.extend(b"".join(blobs))
+    _pad(out)
+
+
+def _write_int32(out: bytearray, values: Sequence[int]) -> None:
+    data = array("i", values)
+    if sys.byteorder != "little":
+        data.byteswap()
+    out.extend(data.tobytes())
+
+
+def _write_bitmap(out: bytearray, size: int, members: Set[int]) -> None:
+    bits = bytearray((size + 7) // 8)
+    for i in members:
+        bits[i >> 3] |= 1 << (i & 7)
+    out.extend(bits)
+
+
+def _intern(first: State, *groups) -> Tuple[List[State], Dict[State, int]]:
+    """Number every state in `groups`, with `first` as id 0 and the rest sorted."""
+    named: Set[State] = set()
+    for group in groups:
+        named.update(group)
+    named.discard(first)
+    ordered = [first, *sorted(named)]
+    return ordered, {s: i for i, s in enumerate(ordered)}
+
+
+def save_dfa(dfa: DFA, path: PathLike) -> None:
+    """Write `dfa` to `path` in the binary DFA format."""
+    symbols = sorted(dfa._alphabet.symbols())
+    symbol_id = {s: i for i, s in enumerate(symbols)}
+    targets = (t for row in dfa._transitions.values() for t in row.values())
+    sink = [dfa._sink_state] if dfa._sink_state is not None else []
+    states, state_id = _intern(
+        dfa._start_state,
+        dfa._states.states(),
+        dfa._accept_states.states(),
+        dfa._transitions.keys(),
+        targets,
+        sink,
+    )
+
+    k = len(symbols)
+    table = [-1] * (len(states) * k)
+    for source, row in dfa._transitions.items():
+        base = state_id[source] * k
+        for symbol, target in row.items():
+            if symbol not in symbol_id:
+                raise ValueError(
+                    f"Transition on {symbol!r} from {source!r} uses a symbol "
+                    f"outside the DFA's alphabet"
+                )
+            table[base + symbol_id[symbol]] = state_id[target]
+
+    out = bytearray()
+    out.extend(
+        _HEADER.pack(
+            _DFA_MAGIC,
+            FORMAT_VERSION,
+            0,
+            len(states),
+            k,
+            0,
+            state_id[dfa._sink_state] if sink else -1,
+        )
+    )
+    _write_strings(out, symbols)
+    _write_strings(out, states)
+    _write_int32(out, table)
+    n = len(states)
+    _write_bitmap(out, n, {state_id[s] for s in dfa._states.states()})
+    _write_bitmap(out, n, {state_id[s] for s in dfa._transitions})
+    _write_bitmap(out, n, {state_id[s] for s in dfa._accept_states.states()})
+    Path(path).write_bytes(bytes(out))
+
+
+def save_nfa(nfa: NFA, path: PathLike) -> None:
+    """Write `nfa` to `path` in the binary NFA format."""
+    used: Set[Symbol] = set(nfa._alphabet.symbols()) | {nfa.epsilon_symbol}
+    for row in nfa.transitions.values():
+        used.update(row.keys())
+    symbols = sorted(used)
+    symbol_id = {s: i for i, s in enumerate(symbols)}
+    targets = (
+        t for row in nfa.transitions.values() for ts in row.values() for t in ts
+    )
+    states, state_id = _intern(
+        nfa._start_state,
+        nfa._states.states(),
+        nfa._accept_states.states(),
+        nfa.transitions.keys(),
+        targets,
+    )
+
+    row_offsets = [0]
+    edge_symbols: List[int] = []
+    edge_targets: List[int] = []
+    for state in states:
+        for symbol, target_set in sorted(nfa.transitions.get(state, {}).items()):
+            ids = sorted(state_id[t] for t in target_set) or [-1]
+            edge_symbols.extend([symbol_id[symbol]] * len(ids))
+            edge_targets.extend(ids)
+        row_offsets.append(len(edge_symbols))
+
+    out = bytearray()
+    out.extend(
+        _HEADER.pack(
+            _NFA_MAGIC,
+            FORMAT_VERSION,
+            0,
+            len(states),
+            len(symbols),
+            0,
+            symbol_id[nfa.epsilon_symbol],
+        )
+    )
+    _write_strings(out, symbols)
+    _write_strings(out, states)
+    out.extend(struct.pack(f"<{len(row_offsets)}I", *row_offsets))
+    _write_int32(out, edge_symbols)
+    _write_int32(out, edge_targets)
+    n = len(states)
+    _write_bitmap(out, n, {state_id[s] for s in nfa._states.states()})
+    _write_bitmap(out, n, {state_id[s] for s in nfa.transitions})
+    _write_bitmap(out, n, {state_id[s] for s in nfa._accept_states.states()})
+    _write_bitmap(
+        out, len(symbols), {symbol_id[s] for s in nfa._alphabet.symbols()}
+    )
+    Path(path).write_bytes(bytes(out))
+
+
+# ── Reading ──────────────────────────────────────────────────────────────────
+
+
+class _Reader:
+    """Sequential reader over a bytes-like buffer (bytes or an mmap view)."""
+
+    def __init__(self, buffer: memoryview):
+        self.buffer = buffer
+        self.pos = 0
+
+    def take(self, size: int) -> memoryview:
+        if self.pos + size > len(self.buffer):
+            raise ValueError("Truncated automaton file")
+        view = self.buffer[self.pos : self.pos + size]
+        self.pos += size
+        return view
+
+    def align(self) -> None:
+        self.pos += -self.pos % 4
+
+    def header(self, magic: bytes) -> Tuple[int, int, int, int]:
+        found, version, _flags, n, k, start, extra = _HEADER.unpack(
+            self.take(_HEADER.size)
+        )
+        if found != magic:
+            raise ValueError(
+                f"Not a {magic.decode()} automaton file (magic {found!r})"
+            )
+        if version != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported automaton file version {version} "
+                f"(this release reads version {FORMAT_VERSION})"
+            )
+        return n, k, start, extra
+
+    def uint32(self, count: int) -> Tuple[int, ...]:
+        return struct.unpack(f"<{count}I", self.take(4 * count))
+
+    def strings(self, count: int) -> List[str]:
+        offsets = self.uint32(count + 1)
+        blob = bytes(self.take(offsets[-1]))
+        self.align()
+        return [
+            blob[offsets[i] : offsets[i + 1]].decode("utf-8") for i in range(count)
+        ]
+
+    def int32(self, count: int) -> Sequence[int]:
+        view = self.take(4 * count)
+        if sys.byteorder == "little":
+            return view.cast("i")  # zero-copy over the file contents
+        data = array("i", bytes(view))
+        data.byteswap()
+        return data
+
+    def bitmap(self, size: int) -> List[int]:
+        members = []
+        for index, byte in enumerate(self.take((size + 7) // 8)):
+            if byte:
+                members.extend(index * 8 + b for b in range(8) if byte >> b & 1)
+        return members
+
+
+def _open(path: PathLike, use_mmap: bool) -> memoryview:
+    with open(path, "rb") as handle:
+        if use_mmap:
+            try:
+                return memoryview(
+                    _mmap.mmap(handle.fileno(), 0, access=_mmap.ACCESS_READ)
+                )
+            except ValueError:
+                pass  # empty files cannot be mapped; fall through to read
+        return memoryview(handle.read())
+
+
+class _TableTransitions(MutableMapping):
+    """
+    A DFA transition dict backed by a loaded int32 table.
+
+    A row's `{symbol: target}` dict is built on first access and then kept,
+    so mutations through the row (as `DFA.add_transition` does) stick.
+    """
+
+    def __init__(
+        self,
+        states: List[State],
+        state_id: Dict[State, int],
+        symbols: List[Symbol],
+        table: Sequence[int],
+        has_row: Set[int],
+    ):
+        self._states = states
+        self._state_id = state_id
+        self._symbols = symbols
+        self._table = table
+        self._pending = set(has_row)  # ids whose rows are not built yet
+        self._rows: Dict[State, Dict[Symbol, State]] = {}
+
+    def _build(self, state_id: int) -> Dict[Symbol, State]:
+        k, table, states = len(self._symbols), self._table, self._states
+        base = state_id * k
+        row = {}
+        for column, symbol in enumerate(self._symbols):
+            target = table[base + column]
+            if target >= 0:
+                row[symbol] = states[target]
+        return row
+
+    def __getitem__(self, state: State) -> Dict[Symbol, State]:
+        try:
+            return self._rows[state]
+        except KeyError:
+            pass
+        state_id = self._state_id.get(state)
+        if state_id is None or state_id not in self._pending:
+            raise KeyError(state)
+        self._pending.discard(state_id)
+        row = self._rows[state] = self._build(state_id)
+        return row
+
+    def __setitem__(self, state: State, row: Dict[Symbol, State]) -> None:
+        state_id = self._state_id.get(state)
+        if state_id is not None:
+            self._pending.discard(state_id)
+        self._rows[state] = row
+
+    def __delitem__(self, state: State) -> None:
+        if state in self._rows:
+            del self._rows[state]
+            return
+        state_id = self._state_id.get(state)
+        if state_id is None or state_id not in self._pending:
+            raise KeyError(state)
+        self._pending.discard(state_id)
+
+    def __contains__(self, state) -> bool:
+        if state in self._rows:
+            return True
+        state_id = self._state_id.get(state)
+        return state_id is not None and state_id in self._pending
+
+    def __iter__(self) -> Iterator[State]:
+        yield from list(self._rows)
+        for state_id in sorted(self._pending):
+            yield self._states[state_id]
+
+    def __len__(self) -> int:
+        return len(self._rows) + len(self._pending)
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+
+def load_dfa(path: PathLike, mmap: bool = True) -> DFA:
+    """
+    Read a DFA written by `save_dfa`. With `mmap=True` the transition array
+    is mapped from the file; either way its rows are decoded lazily.
+    """
+    reader = _Reader(_open(path, mmap))
+    n, k, start, sink = reader.header(_DFA_MAGIC)
+    symbols = [Symbol(s) for s in reader.strings(k)]
+    states = [State(s) for s in reader.strings(n)]
+    table = reader.int32(n * k)
+    declared = reader.bitmap(n)
+    has_row = reader.bitmap(n)
+    accepting = reader.bitmap(n)
+
+    state_id = {s: i for i, s in enumerate(states)}
+    return DFA(
+        states=StateSet.from_states(states[i] for i in declared),
+        alphabet=Alphabet(symbols),
+        transitions=_TableTransitions(states, state_id, symbols, table, set(has_row)),
+        start_state=states[start],
+        accept_states=StateSet.from_states(states[i] for i in accepting),
+        sink_state=states[sink] if sink >= 0 else None,
+    )
+
+
+def load_nfa(path: PathLike, mmap: bool = True) -> NFA:
+    """Read an NFA written by `save_nfa`."""
+    reader = _Reader(_open(path, mmap))
+    n, k, start, epsilon = reader.header(_NFA_MAGIC)
+    symbols = [Symbol(s) for s in reader.strings(k)]
+    states = [State(s) for s in reader.strings(n)]
+    row_offsets = reader.uint32(n + 1)
+    edge_count = row_offsets[-1]
+    edge_symbols = reader.int32(edge_count)
+    edge_targets = reader.int32(edge_count)
+    declared = reader.bitmap(n)
+    has_row = reader.bitmap(n)
+    accepting = reader.bitmap(n)
+    in_alphabet = reader.bitmap(k)
+
+    transitions: Dict[State, Dict[Symbol, StateSet]] = {}
+    for i in has_row:
+        grouped: Dict[Symbol, Set[State]] = {}
+        for e in range(row_offsets[i], row_offsets[i + 1]):
+            targets = grouped.setdefault(symbols[edge_symbols[e]], set())
+            if edge_targets[e] >= 0:
+                targets.add(states[edge_targets[e]])
+        transitions[states[i]] = {
+            symbol: StateSet.from_states(targets)
+            for symbol, targets in grouped.items()
+        }
+
+    return NFA(
+        states=StateSet.from_states(states[i] for i in declared),
+        alphabet=Alphabet(symbols[i] for i in in_alphabet),
+        transitions=transitions,
+        start_state=states[start],
+        accept_states=StateSet.from_states(states[i] for i in accepting),
+        epsilon_symbol=symbols[epsilon],
+    )
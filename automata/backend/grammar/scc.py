@@ -0,0 +1,134 @@
+"""
+Strongly connected components and state classification for automata.
+
+`strongly_connected_components` is Tarjan's algorithm with an explicit
+stack, so automata with very long chains of states do not hit Python's
+recursion limit. Components come out in reverse topological order: every
+component is emitted after all the components it can reach.
+
+`StateAnalysis` classifies the states of an automaton's transition graph,
+given as a successor map (the labels do not matter):
+
+- *reachable*: reachable from the start state;
+- *live*: some accepting state is reachable from it (co-reachable);
+- *useful*: both reachable and live. These are the only states a trimmed
+  automaton needs;
+- *trap*: reachable but not live. Once a run enters a trap state it can
+  never accept.
+
+Liveness is decided per component: in reverse topological order, a
+component is live if it contains an accepting state or has an edge into a
+live component, so one pass over the condensation suffices.
+"""
+
+from typing import Dict, Hashable, Iterable, List, Mapping, Set, TypeVar
+
+N = TypeVar("N", bound=Hashable)
+
+
+def strongly_connected_components(
+    nodes: Iterable[N], successors: Mapping[N, Iterable[N]]
+) -> List[List[N]]:
+    """
+    Return the strongly connected components of the graph, each a list of
+    nodes, in reverse topological order (iterative Tarjan).
+
+    Nodes that only appear as successors are included as well.
+    """
+    index: Dict[N, int] = {}
+    low: Dict[N, int] = {}
+    on_stack: Set[N] = set()
+    stack: List[N] = []
+    components: List[List[N]] = []
+
+    for root in nodes:
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        # Each frame is a node and an iterator over its remaining successors.
+        work = [(root, iter(successors.get(root, ())))]
+        while work:
+            node, pending = work[-1]
+            for target in pending:
+                if target not in index:
+                    index[target] = low[target] = len(index)
+                    stack.append(target)
+                    on_stack.add(target)
+                    work.append((target, iter(successors.get(target, ()))))
+                    break
+                if target in on_stack and index[target] < low[node]:
+                    low[node] = index[target]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
+
+
+class StateAnalysis:
+    """
+    Reachability, liveness and SCCs of an automaton's transition graph.
+
+    Attributes:
+        components: The SCCs, in reverse topological order.
+        component_of: Index into `components` of each state.
+        reachable: States reachable from the start state.
+        live: States from which an accepting state is reachable.
+        useful: States that are both reachable and live.
+        trap: Reachable states that are not live.
+    """
+
+    def __init__(
+        self,
+        states: Iterable[N],
+        start: N,
+        accepting: Iterable[N],
+        successors: Mapping[N, Iterable[N]],
+    ):
+        nodes = [start, *states, *successors]
+        self.components: List[List[N]] = strongly_connected_components(
+            nodes, successors
+        )
+        self.component_of: Dict[N, int] = {
+            node: i for i, component in enumerate(self.components) for node in component
+        }
+
+        accepting = set(accepting)
+        live_component = [False] * len(self.components)
+        for i, component in enumerate(self.components):
+            live_component[i] = any(node in accepting for node in component) or any(
+                live_component[self.component_of[target]]
+                for node in component
+                for target in successors.get(node, ())
+            )
+        self.live: Set[N] = {
+            node for node, i in self.component_of.items() if live_component[i]
+        }
+
+        self.reachable: Set[N] = {start}
+        stack = [start]
+        while stack:
+            for target in successors.get(stack.pop(), ()):
+                if target not in self.reachable:
+                    self.reachable.add(target)
+                    stack.append(target)
+
+        self.useful: Set[N] = self.reachable & self.live
+        self.trap: Set[N] = self.reachable - self.live
+
+    def is_empty(self) -> bool:
+        """True if no accepting state is reachable: the language is empty."""
+        return not self.useful
@@ -0,0 +1,45 @@
+"""Hypothesis strategies for random automata, shared across test modules."""
+
+from typing import Sequence
+
+from hypothesis import strategies as st
+
+from automata.backend.grammar.dist import Alphabet, State, StateSet, Symbol
+from automata.backend.grammar.regular_languages.dfa.dfa_mod import DFA
+
+ALPHABET = ["a", "b"]
+
+
+@st.composite
+def dfas(
+    draw,
+    max_states: int = 6,
+    alphabet: Sequence[str] = tuple(ALPHABET),
+    sink: bool = False,
+):
+    """
+    Random partial DFAs over `alphabet` ({a, b} by default). With `sink`,
+    some of them route missing transitions to a random `sink_state`.
+    """
+    n = draw(st.integers(min_value=1, max_value=max_states))
+    states = [f"s{i}" for i in range(n)]
+    transitions = {}
+    for s in states:
+        row = {}
+        for c in alphabet:
+            if draw(st.booleans()):
+                row[Symbol(c)] = State(draw(st.sampled_from(states)))
+        if row:
+            transitions[State(s)] = row
+    accepting = draw(st.sets(st.sampled_from(states), max_size=n))
+    sink_state = None
+    if sink and draw(st.booleans()):
+        sink_state = State(draw(st.sampled_from(states)))
+    return DFA(
+        states=StateSet(states),
+        alphabet=Alphabet(list(alphabet)),
+        transitions=transitions,
+        start_state=State("s0"),
+        accept_states=StateSet(accepting),
+        sink_state=sink_state,
+    )
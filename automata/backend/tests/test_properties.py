@@ -8,7 +8,10 @@ Hypothesis hunts for counterexamples instead of relying on hand-picked cases:
 - NFA -> DFA conversion preserves the language;
 - both minimizers preserve the language and agree on the minimal size;
 - complement/union/intersection satisfy involution and De Morgan's law;
-- equivalence counterexamples actually distinguish the two DFAs.
+- equivalence counterexamples actually distinguish the two DFAs;
+- the integer-compiled DFA agrees with `DFA.accepts`;
+- lazy pair search agrees with the materialized product construction,
+  and the union-find equivalence check agrees with both.
 """
 
 import re
@@ -16,7 +19,6 @@ import re
 from hypothesis import given, settings, strategies as st
 
 from automata.backend.grammar.dist import Alphabet, State, StateSet, Symbol
-from automata.backend.grammar.regular_languages.dfa.dfa_mod import DFA
 from automata.backend.grammar.regular_languages.dfa.minimization.hopcroft import (
     hopcroft_minimize,
 )
@@ -25,8 +27,7 @@ from automata.backend.grammar.regular_languages.dfa.minimization.myhill_nerode i
 )
 from automata.backend.grammar.regular_languages.nfa.nfa_mod import NFA
 from automata.backend.grammar.regular_languages.regex_to_nfa import regex_to_nfa
-
-ALPHABET = ["a", "b"]
+from automata.backend.tests.strategies import ALPHABET, dfas
 
 # ── Strategies ───────────────────────────────────────────────────────────────
 
@@ -65,29 +66,6 @@ def _ast_to_pattern(ast) -> str:
     return f"({_ast_to_pattern(ast[1])}){ast[0]}"  # *, +, ?
 
 
-@st.composite
-def dfas(draw, max_states: int = 6):
-    """Random partial DFAs over {a, b}."""
-    n = draw(st.integers(min_value=1, max_value=max_states))
-    states = [f"s{i}" for i in range(n)]
-    transitions = {}
-    for s in states:
-        row = {}
-        for c in ALPHABET:
-            if draw(st.booleans()):
-                row[Symbol(c)] = State(draw(st.sampled_from(states)))
-        if row:
-            transitions[State(s)] = row
-    accepting = draw(st.sets(st.sampled_from(states), max_size=n))
-    return DFA(
-        states=StateSet(states),
-        alphabet=Alphabet(ALPHABET),
-        transitions=transitions,
-        start_state=State("s0"),
-        accept_states=StateSet(accepting),
-    )
-
-
 @st.composite
 def nfas(draw, max_states: int = 5):
     """Random NFAs over {a, b} with ε-transitions."""
@@ -162,6 +140,37 @@ def test_dfa_to_regex_roundtrip(dfa):
         assert roundtripped.equivalent_to(dfa)
 
 
+@given(dfas(), st.text(alphabet="abc", max_size=7))
+def test_compiled_dfa_agrees_with_accepts(dfa, word):
+    assert dfa.compile().accepts(word) == dfa.accepts(word)
+
+
+@given(dfas(), dfas())
+def test_lazy_pair_search_matches_product(d1, d2):
+    from automata.backend.grammar.regular_languages.dfa.dfa_ops import (
+        shortest_accepted,
+        symmetric_difference,
+    )
+
+    assert d1.is_subset_of(d2) == d1.difference(d2).is_empty()
+    assert d1.is_disjoint_from(d2) == d1.intersection(d2).is_empty()
+    witness = d1.find_distinguishing_string(d2)
+    expected = shortest_accepted(symmetric_difference(d1, d2))
+    assert (witness is None) == (expected is None)
+    if witness is not None:
+        assert len(witness) == len(expected)
+
+
+@given(dfas(), dfas())
+def test_union_find_equivalence_agrees_with_pair_search(d1, d2):
+    from automata.backend.grammar.regular_languages.dfa.dfa_ops import hopcroft_karp
+
+    witness = hopcroft_karp(d1, d2)
+    assert (witness is None) == (d1.find_distinguishing_string(d2) is None)
+    if witness is not None:
+        assert d1.accepts(witness) != d2.accepts(witness)
+
+
 @given(dfas(), dfas(), words)
 def test_counterexample_actually_distinguishes(d1, d2, word):
     witness = d1.find_distinguishing_string(d2)
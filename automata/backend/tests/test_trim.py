@@ -0,0 +1,111 @@
+"""Tests for the SCC analysis and the trim operation on DFAs and NFAs."""
+
+import itertools
+import random
+
+from automata.backend.grammar.dist import Alphabet, State, StateSet, Symbol
+from automata.backend.grammar.regular_languages.dfa.dfa_mod import DFA
+from automata.backend.grammar.regular_languages.nfa.nfa_mod import NFA
+from automata.backend.grammar.scc import StateAnalysis, strongly_connected_components
+
+
+def _reach(successors, node):
+    seen, stack = {node}, [node]
+    while stack:
+        for t in successors.get(stack.pop(), ()):
+            if t not in seen:
+                seen.add(t)
+                stack.append(t)
+    return seen
+
+
+def test_sccs_match_mutual_reachability_in_reverse_topological_order():
+    rng = random.Random(3)
+    for _ in range(30):
+        n = rng.randint(1, 12)
+        successors = {
+            i: {rng.randrange(n) for _ in range(rng.randint(0, 3))} for i in range(n)
+        }
+        components = strongly_connected_components(range(n), successors)
+        reach = {i: _reach(successors, i) for i in range(n)}
+        position = {v: k for k, comp in enumerate(components) for v in comp}
+        assert sorted(position) == list(range(n))
+        for u, v in itertools.product(range(n), repeat=2):
+            same = v in reach[u] and u in reach[v]
+            assert (position[u] == position[v]) == same
+            if v in reach[u]:
+                assert position[v] <= position[u]  # successors come first
+
+
+def test_long_chain_does_not_recurse():
+    n = 100_000
+    successors = {i: [i + 1] for i in range(n)}
+    successors[n] = [0]
+    analysis = StateAnalysis(range(n + 1), 0, [n], successors)
+    assert len(analysis.components) == 1
+    assert len(analysis.useful) == n + 1 and not analysis.trap
+
+
+def _dfa():
+    # s -a-> t -b-> f(accept); s -b-> trap (loops); u is unreachable.
+    return DFA.from_string(
+        "s,a,t;t,b,f;s,b,trap;trap,a,trap;trap,b,trap;u,a,f", "s", {"f"}
+    )
+
+
+def test_dfa_state_analysis():
+    analysis = _dfa().state_analysis()
+    assert analysis.reachable == {"s", "t", "f", "trap"}
+    assert analysis.live == {"s", "t", "f", "u"}
+    assert analysis.useful == {"s", "t", "f"}
+    assert analysis.trap == {"trap"}
+
+
+def test_dfa_trim_preserves_language():
+    dfa = _dfa()
+    trimmed = dfa.trim()
+    assert trimmed._states.states() == {"s", "t", "f"}
+    assert trimmed.equivalent_to(dfa)
+    assert dfa.trim() is trimmed
+    assert trimmed.trim() is trimmed
+
+
+def test_dfa_trim_writes_out_a_useful_sink():
+    dfa = DFA(
+        states=StateSet(["p", "s"]),
+        alphabet=Alphabet(["a", "b"]),
+        transitions={State("p"): {Symbol("a"): State("p")}},
+        start_state=State("p"),
+        accept_states=StateSet(["s"]),
+        sink_state=State("s"),
+    )
+    trimmed = dfa.trim()
+    assert trimmed._sink_state is None
+    for word in ["", "a", "b", "ab", "ba", "bb", "aab"]:
+        assert trimmed.accepts(word) == dfa.accepts(word), word
+
+
+def test_dfa_trim_of_empty_language_keeps_the_start_state():
+    dfa = DFA.from_string("s,a,t;t,a,s", "s", set())
+    trimmed = dfa.trim()
+    assert trimmed._states.states() == {"s"}
+    assert trimmed.is_empty()
+
+
+def test_minimization_drops_unreachable_states():
+    assert len(_dfa().minimized()._states) == 3
+
+
+def test_nfa_trim_and_to_dfa():
+    nfa = NFA.from_string("s,a,s,t,d;t,ε,f;d,a,d;u,b,f", "s", {"f"})
+    analysis = nfa.state_analysis()
+    assert analysis.trap == {"d"}
+    trimmed = nfa.trim()
+    assert trimmed._states.states() == {"s", "t", "f"}
+    for n in range(4):
+        for word in itertools.product("ab", repeat=n):
+            assert trimmed.accepts(list(word)) == nfa.accepts(list(word))
+    # Dead NFA states no longer appear in the subsets.
+    dfa = nfa.to_dfa()
+    assert all("d" not in label.split(",") for label in dfa.labels().values())
+    assert trimmed.trim() is trimmed